@@ -0,0 +1,284 @@
+"""Read-only JSON API over the coverage data: ``python -m ack_dashboard.api [--port 8503]``.
+
+Serves the same in-memory data and metrics layer as the dashboard:
+
+- ``GET /v1/version``: data version and service count
+- ``GET /v1/metrics?services=s3,ec2``: ``calculate_overall_metrics``
+- ``GET /v1/services?services=s3,ec2``: ``create_service_dataframe`` rows
+- ``GET /v1/services/<service>``: one service's counts
+- ``GET /v1/operations?service=s3&type=control_plane&supported=false&sort=line&order=desc&limit=100&offset=0``:
+  operations from the operations index
+
+Every response carries an ``ETag`` derived from the data version and the
+request, so clients revalidate with ``If-None-Match`` and get ``304`` until
+the results change. Encoded bodies (plain and gzip) are cached per data
+version, and the hot queries are encoded ahead of the first request whenever
+a new version is loaded.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import sys
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .calculations.metrics import calculate_overall_metrics, create_service_dataframe
+from .data.cache import LRUCache
+from .data.index import get_operations_index
+from .data.loader import watch_interval
+from .data.store import get_store
+
+
+logger = logging.getLogger(__name__)
+
+HOT_PATHS = ["/v1/version", "/v1/metrics", "/v1/services"]
+OPERATION_TYPES = {'control_plane': 'Control Plane', 'data_plane': 'Data Plane'}
+MAX_LIMIT = 1000
+GZIP_MIN_BYTES = 512
+
+# Canonical request: path plus sorted query parameters
+Query = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class Response:
+    body: bytes
+    gzipped: Optional[bytes]
+    etag: str
+
+
+class CoverageApi:
+    """Resolves canonical queries against the current data, caching encoded responses per version."""
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = results_dir
+        self._responses = LRUCache(maxsize=1024, name="api_responses")
+        self._warm_version = ""
+        self._warm_lock = threading.Lock()
+
+    def data(self) -> Dict[str, Any]:
+        # Same store and background watcher as the dashboard: requests never parse files.
+        store = get_store(self.results_dir)
+        interval = watch_interval()
+        if interval > 0:
+            store.watch(interval)
+        data, errors = store.current_with_errors() if interval > 0 else (None, [])
+        if data is None:
+            data, errors = store.load_with_errors()
+        if not data:
+            raise ApiError(503, "No results loaded")
+        if data.version != self._warm_version:
+            self._warm(data, errors)
+        return data
+
+    def get(self, query: Query) -> Response:
+        data = self.data()
+        return self._responses.get_or_create((data.version, query), lambda: self._encode(data, query))
+
+    def _warm(self, data: Dict[str, Any], errors) -> None:
+        with self._warm_lock:
+            if data.version == self._warm_version:
+                return
+            for json_file, e in errors:
+                logger.error("Error loading %s: %s", json_file, e)
+            for path in HOT_PATHS:
+                self._responses.put((data.version, (path, ())), self._encode(data, (path, ())))
+            self._warm_version = data.version
+
+    def _encode(self, data: Dict[str, Any], query: Query) -> Response:
+        payload = {'data_version': data.version, **self._resolve(data, *query)}
+        body = json.dumps(payload, separators=(',', ':')).encode()
+        gzipped = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+        digest = hashlib.blake2b(repr(query).encode(), digest_size=6).hexdigest()
+        return Response(body, gzipped, f'"{data.version}-{digest}"')
+
+    def _resolve(self, data: Dict[str, Any], path: str, params: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+        args = dict(params)
+        if path == "/v1/version":
+            return {'services': len(data)}
+        if path == "/v1/metrics":
+            return {'overall': calculate_overall_metrics(data, _services(data, args))}
+        if path == "/v1/services":
+            service_df = create_service_dataframe(data, _services(data, args))
+            return {'services': service_df.to_dict(orient='records')}
+        if path.startswith("/v1/services/"):
+            service = path[len("/v1/services/"):].lower()
+            if service not in data:
+                raise ApiError(404, f"Unknown service: {service}")
+            return {'service': {k: v for k, v in data[service].items() if k != 'operations'}}
+        if path == "/v1/operations":
+            return _operations(data, args)
+        raise ApiError(404, f"Not found: {path}")
+
+
+def _services(data: Dict[str, Any], args: Dict[str, str]) -> Optional[List[str]]:
+    if 'services' not in args:
+        return None
+    services = [s.strip().lower() for s in args['services'].split(",") if s.strip()]
+    unknown = sorted(set(services) - data.keys())
+    if unknown:
+        raise ApiError(404, f"Unknown services: {', '.join(unknown)}")
+    return services
+
+
+def _operations(data: Dict[str, Any], args: Dict[str, str]) -> Dict[str, Any]:
+    index = get_operations_index(data)
+    services = _services(data, {'services': args['service']}) if 'service' in args else None
+    types = None
+    if 'type' in args:
+        types = [OPERATION_TYPES.get(t.strip()) for t in args['type'].split(",")]
+        if None in types:
+            raise ApiError(400, "type must be control_plane or data_plane")
+    supported = None
+    if 'supported' in args:
+        if args['supported'] not in ('true', 'false'):
+            raise ApiError(400, "supported must be true or false")
+        supported = ['Yes'] if args['supported'] == 'true' else ['No']
+    sort_by = args.get('sort')
+    if sort_by is not None:
+        sort_by = {'name': 'Operation', 'type': 'Type', 'file': 'File', 'line': 'Line',
+                   'service': 'Service', 'supported': 'Supported'}.get(sort_by)
+        if sort_by is None:
+            raise ApiError(400, "sort must be one of name, service, type, file, line, supported")
+    try:
+        limit = min(int(args.get('limit', 100)), MAX_LIMIT)
+        offset = int(args.get('offset', 0))
+    except ValueError:
+        raise ApiError(400, "limit and offset must be integers")
+    if limit < 0 or offset < 0:
+        raise ApiError(400, "limit and offset must not be negative")
+
+    rows = index.query(services, types, supported, sort_by, args.get('order') == 'desc')
+    page = index.table.iloc[rows[offset:offset + limit]]
+    return {
+        'total': len(rows),
+        'offset': offset,
+        'operations': [
+            {'service': service, 'name': name, 'type': type_, 'file': file, 'line': int(line), 'supported': bool(ok)}
+            for service, name, type_, file, line, ok in zip(
+                page['service'], page['name'], page['type'], page['file'], page['line'], page['supported']
+            )
+        ],
+    }
+
+
+def canonical_query(target: str) -> Query:
+    parts = urlsplit(target)
+    return parts.path.rstrip('/') or '/', tuple(sorted(parse_qsl(parts.query)))
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # gzip, or failing that ``*``, must be listed without ``q=0``.
+    weights = {}
+    for coding in accept_encoding.split(','):
+        name, *params = [part.strip() for part in coding.split(';')]
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.lower()] = weight
+    return weights.get('gzip', weights.get('*', 0.0)) > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison, as If-None-Match requires.
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or any(tag.removeprefix('W/') == etag for tag in tags)
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    # Keep-alive connections: probing tools and scrapers reuse one socket.
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY every
+    # keep-alive response would stall on the client's delayed ACK.
+    disable_nagle_algorithm = True
+    api: CoverageApi = None
+
+    def do_GET(self):
+        try:
+            response = self.api.get(canonical_query(self.path))
+        except ApiError as e:
+            self._send(e.status, json.dumps({'error': str(e)}).encode())
+            return
+        except Exception:
+            logger.exception("Error serving %s", self.path)
+            self._send(500, json.dumps({'error': "Internal server error"}).encode())
+            return
+
+        accepts_gzip = response.gzipped is not None and _accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        etag = response.etag[:-1] + '-gz"' if accepts_gzip else response.etag
+        if _etag_matches(self.headers.get('If-None-Match', ''), etag):
+            self._send(304, b'', etag=etag)
+        elif accepts_gzip:
+            self._send(200, response.gzipped, etag=etag, encoding='gzip')
+        else:
+            self._send(200, response.body, etag=etag)
+
+    def _send(self, status: int, body: bytes, etag: Optional[str] = None, encoding: Optional[str] = None) -> None:
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'no-cache')
+        if etag:
+            self.send_header('ETag', etag)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Suppress per-request logs
+
+
+class ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve(results_dir: Path, host: str = "", port: int = 8503) -> ApiServer:
+    handler = type('BoundApiHandler', (ApiHandler,), {'api': CoverageApi(results_dir)})
+    return ApiServer((host, port), handler)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ack_dashboard.api", description="Serve coverage data as JSON.")
+    parser.add_argument("--results", default="results", help="results directory (default: %(default)s)")
+    parser.add_argument("--host", default="", help="bind address (default: all interfaces)")
+    parser.add_argument("--port", type=int, default=8503)
+    args = parser.parse_args(argv)
+
+    results_dir = Path(args.results)
+    if not results_dir.is_dir():
+        print(f"Results directory not found: {results_dir}", file=sys.stderr)
+        return 2
+
+    httpd = serve(results_dir, args.host, args.port)
+    httpd.RequestHandlerClass.api.data()  # Load and warm the hot queries before accepting requests
+    print(f"Coverage API listening on port {args.port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..data.cache import LRUCache
+from ..data.store import data_version
+
+
+SUMMARY_FIELDS = [
+    'total_operations',
+    'supported_operations',
+    'control_plane_operations',
+    'supported_control_plane_operations',
+]
+
+# Kinds of per-operation change, in display order
+ADDED = 'added'
+REMOVED = 'removed'
+NEWLY_SUPPORTED = 'newly supported'
+NEWLY_UNSUPPORTED = 'newly unsupported'
+TYPE_CHANGED = 'type changed'
+MOVED = 'moved'
+
+
+@dataclass(frozen=True)
+class OperationChange:
+    service: str
+    operation: str
+    kind: str
+    old: Optional[Tuple[str, str, int]] = None  # (type, file, line)
+    new: Optional[Tuple[str, str, int]] = None
+
+
+@dataclass
+class ServiceDiff:
+    service: str
+    status: str  # 'added', 'removed' or 'changed'
+    old_summary: Optional[Tuple[int, int, int, int]] = None
+    new_summary: Optional[Tuple[int, int, int, int]] = None
+    changes: List[OperationChange] = field(default_factory=list)
+
+    def count(self, kind: str) -> int:
+        return sum(1 for change in self.changes if change.kind == kind)
+
+
+@dataclass
+class DatasetDiff:
+    services: List[ServiceDiff]
+    unchanged: int
+
+    @property
+    def changes(self) -> List[OperationChange]:
+        return [change for service in self.services for change in service.changes]
+
+    def count(self, kind: str) -> int:
+        return sum(service.count(kind) for service in self.services)
+
+    def services_with_status(self, status: str) -> List[str]:
+        return [service.service for service in self.services if service.status == status]
+
+
+def _supported(state: Optional[Tuple[str, str, int]]) -> bool:
+    return state is not None and bool(state[1]) and state[2] > 0
+
+
+def service_digest(service_data: Dict[str, Any]) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(tuple(service_data[f] for f in SUMMARY_FIELDS)).encode())
+    for op in service_data['operations']:
+        digest.update(f"{op['name']}\0{op['type']}\0{op['file']}\0{op['line']}\n".encode())
+    return digest.digest()
+
+
+_digest_cache = LRUCache(maxsize=8, name="diff_digests")
+
+
+def service_digests(data: Dict[str, Any]) -> Dict[str, bytes]:
+    """Per-service content digests, computed once per data version."""
+    return _digest_cache.get_or_create(
+        data_version(data), lambda: {service: service_digest(d) for service, d in data.items()}
+    )
+
+
+def diff_datasets(old: Dict[str, Any], new: Dict[str, Any]) -> DatasetDiff:
+    """Per-service and per-operation deltas from ``old`` to ``new`` (both in the ``load_data()`` shape).
+
+    Services whose digests match are skipped without looking at their operations.
+    """
+    old_digests, new_digests = service_digests(old), service_digests(new)
+    services: List[ServiceDiff] = []
+    unchanged = 0
+
+    for service in sorted(old.keys() | new.keys()):
+        if service not in new:
+            services.append(ServiceDiff(
+                service, 'removed', old_summary=_summary(old[service]),
+                changes=[OperationChange(service, name, REMOVED, old=state)
+                         for name, state in _operations(old[service]).items()]
+            ))
+        elif service not in old:
+            services.append(ServiceDiff(
+                service, 'added', new_summary=_summary(new[service]),
+                changes=[OperationChange(service, name, ADDED, new=state)
+                         for name, state in _operations(new[service]).items()]
+            ))
+        elif old_digests[service] == new_digests[service]:
+            unchanged += 1
+        else:
+            services.append(ServiceDiff(
+                service, 'changed', _summary(old[service]), _summary(new[service]),
+                _operation_changes(service, _operations(old[service]), _operations(new[service]))
+            ))
+    return DatasetDiff(services, unchanged)
+
+
+def _summary(service_data: Dict[str, Any]) -> Tuple[int, int, int, int]:
+    return tuple(service_data[f] for f in SUMMARY_FIELDS)
+
+
+def _operations(service_data: Dict[str, Any]) -> Dict[str, Tuple[str, str, int]]:
+    return {op['name']: (op['type'], op['file'], op['line']) for op in service_data['operations']}
+
+
+def _operation_changes(service: str, before: Dict[str, Tuple[str, str, int]],
+                       after: Dict[str, Tuple[str, str, int]]) -> List[OperationChange]:
+    changes = []
+    for name in sorted(before.keys() | after.keys()):
+        old, new = before.get(name), after.get(name)
+        if old == new:
+            continue
+        if old is None:
+            kind = ADDED
+        elif new is None:
+            kind = REMOVED
+        elif _supported(old) != _supported(new):
+            kind = NEWLY_SUPPORTED if _supported(new) else NEWLY_UNSUPPORTED
+        elif old[0] != new[0]:
+            kind = TYPE_CHANGED
+        else:
+            kind = MOVED
+        changes.append(OperationChange(service, name, kind, old, new))
+    return changes
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Dict, Any
+
+from ..data.cache import LRUCache
+from ..data.index import get_operations_index
+from ..data.store import data_version
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class HotspotReport:
+    """Where supported operations are implemented, aggregated once per data version.
+
+    ``by_service_file``: one row per (service, file) with operation counts and line span.
+    ``by_file``: one row per file path across services; ``Services`` > 1 marks
+    shared code such as ``pkg/tags/sync.go`` that every controller carries a copy of.
+    ``by_basename``: one row per file name (``hook.go``, ``sdk.go``, ...) across services.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        import pandas as pd
+
+        table = get_operations_index(data).table
+        supported = table[table['supported']].assign(
+            control_plane=lambda df: df['type'] == 'control_plane'
+        )
+        self._supported = supported
+
+        by_service_file = supported.groupby(['service', 'file'], observed=True).agg(
+            operations=('name', 'size'),
+            control_plane=('control_plane', 'sum'),
+            first_line=('line', 'min'),
+            last_line=('line', 'max'),
+        )
+        self.by_service_file = by_service_file.reset_index().rename(columns={
+            'service': 'Service', 'file': 'File', 'operations': 'Operations',
+            'control_plane': 'Control Plane', 'first_line': 'First Line', 'last_line': 'Last Line'
+        }).sort_values(['Operations', 'Service'], ascending=[False, True], kind='stable', ignore_index=True)
+
+        by_file = supported.groupby('file', observed=True).agg(
+            services=('service', 'nunique'),
+            operations=('name', 'size'),
+        )
+        self.by_file = by_file.reset_index().rename(columns={
+            'file': 'File', 'services': 'Services', 'operations': 'Operations'
+        }).sort_values(['Operations', 'File'], ascending=[False, True], kind='stable', ignore_index=True)
+
+        files = pd.Series(supported['file'].cat.categories, index=supported['file'].cat.categories)
+        basenames = files.str.rsplit('/', n=1).str[-1]
+        by_basename = supported.groupby(supported['file'].map(basenames), observed=True).agg(
+            services=('service', 'nunique'),
+            files=('file', 'nunique'),
+            operations=('name', 'size'),
+        )
+        self.by_basename = by_basename.rename_axis('File Name').reset_index().rename(columns={
+            'services': 'Services', 'files': 'Files', 'operations': 'Operations'
+        }).sort_values(['Operations', 'File Name'], ascending=[False, True], kind='stable', ignore_index=True)
+
+    @property
+    def shared_files(self) -> "pd.DataFrame":
+        return self.by_file[self.by_file['Services'] > 1]
+
+    def files_for_service(self, service: str) -> "pd.DataFrame":
+        return self.by_service_file[self.by_service_file['Service'] == service]
+
+    def operations_in_file(self, service: str, file: str) -> "pd.DataFrame":
+        supported = self._supported
+        rows = supported[(supported['service'] == service) & (supported['file'] == file)]
+        return rows[['name', 'type', 'line']].sort_values('line', ignore_index=True).rename(columns={
+            'name': 'Operation', 'type': 'Type', 'line': 'Line'
+        })
+
+    def line_ranges(self, service: str, file: str, bucket_size: int = 100) -> "pd.DataFrame":
+        operations = self.operations_in_file(service, file)
+        start = (operations['Line'] - 1) // bucket_size * bucket_size + 1
+        ranges = operations.groupby(start).agg(operations=('Operation', 'size'))
+        ranges.index = [f"{s}-{s + bucket_size - 1}" for s in ranges.index]
+        return ranges.rename_axis('Lines').reset_index().rename(columns={'operations': 'Operations'})
+
+
+_report_cache = LRUCache(maxsize=4, name="hotspots")
+
+
+def get_hotspot_report(data: Dict[str, Any]) -> HotspotReport:
+    return _report_cache.get_or_create(data_version(data), lambda: HotspotReport(data))
@@ -0,0 +1,135 @@
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence
+
+from ..data.cache import LRUCache
+from ..data.index import get_operations_index
+from ..data.store import data_version
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+OTHER_VERB = 'Other'
+VERB_PATTERN = r'^([A-Z][a-z]+)'
+
+
+class CoverageMatrix:
+    """Operation verb (``Create``, ``Delete``, ``Tag``, ...) x service pivot, built once per data version.
+
+    The verb of an operation is the leading capitalized word of its name,
+    extracted once per distinct name over a categorical of the names. Every
+    operation then gets a cell code ``verb * len(services) + service``;
+    ``total`` and ``supported`` are ``(verbs, services)`` count arrays from
+    one ``bincount`` each, for all operations and for control plane
+    operations only. ``cell_rows`` lists the operations index rows behind
+    one cell, from a single argsort of the cell codes.
+
+    Verbs are ordered by operation count, most common first; services keep
+    data order.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        import pandas as pd
+
+        index = get_operations_index(data)
+        table = index.table
+        self.index = index
+        self.services: List[str] = index.services
+
+        names = pd.Categorical(table['name'])
+        name_verbs = names.categories.str.extract(VERB_PATTERN, expand=False).fillna(OTHER_VERB)
+        verbs, name_verb_codes = np.unique(name_verbs.to_numpy(dtype=str), return_inverse=True)
+        verb_codes = name_verb_codes[names.codes]
+
+        # Most common verb first, so "top N verbs" is a prefix of the rows.
+        order = np.argsort(-np.bincount(verb_codes, minlength=len(verbs)), kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        self.verbs: List[str] = [str(verb) for verb in verbs[order]]
+        self._verb_positions = {verb: i for i, verb in enumerate(self.verbs)}
+        self._service_positions = {service: i for i, service in enumerate(self.services)}
+
+        shape = (len(self.verbs), len(self.services))
+        cells = rank[verb_codes].astype(np.int64) * len(self.services) + table['service'].cat.codes.to_numpy()
+        supported = table['supported'].to_numpy()
+        control_plane = (table['type'] == 'control_plane').to_numpy()
+        self._control_plane = control_plane
+
+        def pivot(mask: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+            selected = cells if mask is None else cells[mask]
+            weights = supported if mask is None else supported[mask]
+            return {
+                'total': np.bincount(selected, minlength=shape[0] * shape[1]).reshape(shape),
+                'supported': np.bincount(selected, weights=weights, minlength=shape[0] * shape[1])
+                .astype(np.int64).reshape(shape),
+            }
+
+        self._pivots = {False: pivot(None), True: pivot(control_plane)}
+
+        self._cell_order = np.argsort(cells, kind='stable')
+        self._cell_starts = np.searchsorted(cells[self._cell_order], np.arange(shape[0] * shape[1] + 1))
+
+    def counts(self, control_plane_only: bool = False, services: Optional[Sequence[str]] = None,
+               verbs: int = 0) -> Dict[str, np.ndarray]:
+        """``total``/``supported`` counts restricted to ``services`` and the ``verbs`` most common verbs."""
+        pivot = self._pivots[control_plane_only]
+        columns = self._service_columns(services)
+        rows = slice(None, verbs or None)
+        return {name: counts[rows][:, columns] for name, counts in pivot.items()}
+
+    def frame(self, control_plane_only: bool = False, services: Optional[Sequence[str]] = None,
+              verbs: int = 0) -> "pd.DataFrame":
+        """Coverage % per (verb, service) cell; ``NaN`` where a service has no operation with that verb."""
+        import pandas as pd
+
+        counts = self.counts(control_plane_only, services, verbs)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            coverage = np.round(counts['supported'] / counts['total'] * 100, 1)
+        return pd.DataFrame(
+            np.where(counts['total'] > 0, coverage, np.nan),
+            index=pd.Index(self.verbs[:verbs or None], name='Verb'),
+            columns=pd.Index([self.services[i] for i in self._service_columns(services)], name='Service'),
+        )
+
+    def verb_summary(self, control_plane_only: bool = False, services: Optional[Sequence[str]] = None,
+                     verbs: int = 0) -> "pd.DataFrame":
+        import pandas as pd
+
+        counts = self.counts(control_plane_only, services, verbs)
+        total = counts['total'].sum(axis=1)
+        supported = counts['supported'].sum(axis=1)
+        return pd.DataFrame({
+            'Verb': self.verbs[:verbs or None],
+            'Services': (counts['total'] > 0).sum(axis=1),
+            'Fully Supported In': ((counts['total'] > 0) & (counts['supported'] == counts['total'])).sum(axis=1),
+            'Operations': total,
+            'Supported': supported,
+            'Coverage %': np.round(np.divide(supported, total, out=np.zeros(len(total)), where=total > 0) * 100, 1),
+        })
+
+    def cell_rows(self, verb: str, service: str, control_plane_only: bool = False) -> np.ndarray:
+        """Operations index rows of one (verb, service) cell, in index order."""
+        verb_position = self._verb_positions.get(verb)
+        service_position = self._service_positions.get(service)
+        if verb_position is None or service_position is None:
+            return np.empty(0, dtype=np.intp)
+        cell = verb_position * len(self.services) + service_position
+        rows = self._cell_order[self._cell_starts[cell]:self._cell_starts[cell + 1]]
+        return rows[self._control_plane[rows]] if control_plane_only else rows
+
+    def cell_operations(self, verb: str, service: str, control_plane_only: bool = False) -> "pd.DataFrame":
+        rows = self.cell_rows(verb, service, control_plane_only)
+        return self.index.display.iloc[rows].reset_index(drop=True)
+
+    def _service_columns(self, services: Optional[Sequence[str]]) -> np.ndarray:
+        if services is None:
+            return np.arange(len(self.services))
+        return np.array(sorted(self._service_positions[s] for s in set(services) if s in self._service_positions),
+                        dtype=np.intp)
+
+
+_matrix_cache = LRUCache(maxsize=4, name="coverage_matrix")
+
+
+def get_coverage_matrix(data: Dict[str, Any]) -> CoverageMatrix:
+    return _matrix_cache.get_or_create(data_version(data), lambda: CoverageMatrix(data))
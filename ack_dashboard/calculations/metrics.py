@@ -1,84 +1,127 @@
-import pandas as pd
-from typing import Dict, Any, List, Optional
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Optional, Union
 
+from ..data.cache import LRUCache
+from ..data.store import data_version
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# A service selection: names, a boolean mask in data order, or an int bitset
+# whose bit ``i`` selects the ``i``-th service. ``None`` selects everything.
+Selection = Optional[Union[Iterable[str], np.ndarray, int]]
+
+
+class MetricsEngine:
+    """Per-service counts held as NumPy arrays in data order.
+
+    Selections are reduced to a boolean mask, and results are memoized on the
+    packed mask, so repeated calls for the same selection within (or across)
+    reruns cost a dictionary lookup.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.services = list(data.keys())
+        self._positions = {service: i for i, service in enumerate(self.services)}
+        self.total = _counts(data, 'total_operations')
+        self.supported = _counts(data, 'supported_operations')
+        self.control_plane = _counts(data, 'control_plane_operations')
+        self.supported_control_plane = _counts(data, 'supported_control_plane_operations')
+        self.coverage = _percent(self.supported, self.total)
+        self.control_plane_coverage = _percent(self.supported_control_plane, self.control_plane)
+        self._metrics = LRUCache(maxsize=64)
+        self._frames = LRUCache(maxsize=64)
+
+    def mask(self, selected_services: Selection = None) -> np.ndarray:
+        n = len(self.services)
+        if selected_services is None:
+            return np.ones(n, dtype=bool)
+        if isinstance(selected_services, np.ndarray) and selected_services.dtype == bool:
+            return selected_services
+        if isinstance(selected_services, int):
+            raw = selected_services.to_bytes((n + 7) // 8, 'little')
+            return np.unpackbits(np.frombuffer(raw, dtype=np.uint8), count=n, bitorder='little').astype(bool)
+        mask = np.zeros(n, dtype=bool)
+        positions = [self._positions[s] for s in selected_services if s in self._positions]
+        mask[positions] = True
+        return mask
+
+    def overall_metrics(self, selected_services: Selection = None) -> Dict[str, Any]:
+        mask = self.mask(selected_services)
+        return self._metrics.get_or_create(_selection_key(mask), lambda: self._overall_metrics(mask))
+
+    def service_dataframe(self, selected_services: Selection = None) -> "pd.DataFrame":
+        """Per-service coverage table, sorted by coverage. The returned frame is shared; do not mutate it."""
+        mask = self.mask(selected_services)
+        return self._frames.get_or_create(_selection_key(mask), lambda: self._service_dataframe(mask))
+
+    def _overall_metrics(self, mask: np.ndarray) -> Dict[str, Any]:
+        total = self.total[mask]
+        control_plane = self.control_plane[mask]
+        coverage = self.coverage[mask][total > 0]
+        cp_coverage = self.control_plane_coverage[mask][control_plane > 0]
 
-def calculate_overall_metrics(data: Dict[str, Any], selected_services: Optional[List[str]] = None) -> Dict[str, Any]:
-    if not data:
-        return {}
-    
-    if selected_services is not None:
-        filtered_data = {k: v for k, v in data.items() if k in selected_services}
-    else:
-        filtered_data = data
-    
-    if not filtered_data:
         return {
-            'total_operations': 0,
-            'total_supported': 0,
-            'total_control_plane': 0,
-            'total_supported_control_plane': 0,
-            'overall_coverage': 0,
-            'control_plane_coverage': 0,
-            'num_services': 0
+            'total_operations': int(total.sum()),
+            'total_supported': int(self.supported[mask].sum()),
+            'total_control_plane': int(control_plane.sum()),
+            'total_supported_control_plane': int(self.supported_control_plane[mask].sum()),
+            'overall_coverage': float(coverage.mean()) if coverage.size else 0,
+            'control_plane_coverage': float(cp_coverage.mean()) if cp_coverage.size else 0,
+            'num_services': int(mask.sum())
         }
-    
-    total_operations = sum(service['total_operations'] for service in filtered_data.values())
-    total_supported = sum(service['supported_operations'] for service in filtered_data.values())
-    total_control_plane = sum(service['control_plane_operations'] for service in filtered_data.values())
-    total_supported_control_plane = sum(service['supported_control_plane_operations'] for service in filtered_data.values())
-    
-    # Calculate average overall coverage (arithmetic mean of individual service coverage)
-    overall_coverages = []
-    cp_coverages = []
-    for service_data in filtered_data.values():
-        if service_data['total_operations'] > 0:
-            overall_cov = (service_data['supported_operations'] / service_data['total_operations'] * 100)
-            overall_coverages.append(overall_cov)
-        
-        if service_data['control_plane_operations'] > 0:
-            cp_cov = (service_data['supported_control_plane_operations'] / service_data['control_plane_operations'] * 100)
-            cp_coverages.append(cp_cov)
-    
-    overall_coverage = sum(overall_coverages) / len(overall_coverages) if overall_coverages else 0
-    control_plane_coverage = sum(cp_coverages) / len(cp_coverages) if cp_coverages else 0
-    
-    return {
-        'total_operations': total_operations,
-        'total_supported': total_supported,
-        'total_control_plane': total_control_plane,
-        'total_supported_control_plane': total_supported_control_plane,
-        'overall_coverage': overall_coverage,
-        'control_plane_coverage': control_plane_coverage,
-        'num_services': len(filtered_data)
-    }
-
-
-def create_service_dataframe(data: Dict[str, Any], selected_services: Optional[List[str]] = None) -> pd.DataFrame:
+
+    def _service_dataframe(self, mask: np.ndarray) -> "pd.DataFrame":
+        import pandas as pd
+
+        positions = np.flatnonzero(mask)
+        if positions.size == 0:
+            return pd.DataFrame()
+
+        coverage = np.round(self.coverage[positions], 1)
+        frame = pd.DataFrame({
+            'Service': [self.services[i].upper() for i in positions],
+            'Total Operations': self.total[positions],
+            'Supported Operations': self.supported[positions],
+            'Coverage %': coverage,
+            'Control Plane Operations': self.control_plane[positions],
+            'Supported Control Plane': self.supported_control_plane[positions],
+            'Control Plane Coverage %': np.round(self.control_plane_coverage[positions], 1)
+        })
+        order = np.argsort(-coverage, kind='stable')
+        return frame.take(order)
+
+
+def _counts(data: Dict[str, Any], field: str) -> np.ndarray:
+    return np.fromiter((service[field] for service in data.values()), dtype=np.int64, count=len(data))
+
+
+def _percent(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    out = np.zeros(len(numerator), dtype=np.float64)
+    np.divide(numerator * 100, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _selection_key(mask: np.ndarray) -> bytes:
+    return np.packbits(mask).tobytes() + len(mask).to_bytes(4, 'little')
+
+
+_engine_cache = LRUCache(maxsize=4, name="metrics_engine")
+
+
+def get_metrics_engine(data: Dict[str, Any]) -> MetricsEngine:
+    return _engine_cache.get_or_create(data_version(data), lambda: MetricsEngine(data))
+
+
+def calculate_overall_metrics(data: Dict[str, Any], selected_services: Selection = None) -> Dict[str, Any]:
     if not data:
+        return {}
+    return get_metrics_engine(data).overall_metrics(selected_services)
+
+
+def create_service_dataframe(data: Dict[str, Any], selected_services: Selection = None) -> "pd.DataFrame":
+    if not data:
+        import pandas as pd
         return pd.DataFrame()
-    
-    # Filter data based on selected services
-    if selected_services is not None:
-        filtered_data = {k: v for k, v in data.items() if k in selected_services}
-    else:
-        filtered_data = data
-    
-    if not filtered_data:
-        return pd.DataFrame()
-    
-    services = []
-    for service_name, service_data in filtered_data.items():
-        coverage = (service_data['supported_operations'] / service_data['total_operations'] * 100) if service_data['total_operations'] > 0 else 0
-        control_plane_coverage = (service_data['supported_control_plane_operations'] / service_data['control_plane_operations'] * 100) if service_data['control_plane_operations'] > 0 else 0
-        
-        services.append({
-            'Service': service_name.upper(),
-            'Total Operations': service_data['total_operations'],
-            'Supported Operations': service_data['supported_operations'],
-            'Coverage %': round(coverage, 1),
-            'Control Plane Operations': service_data['control_plane_operations'],
-            'Supported Control Plane': service_data['supported_control_plane_operations'],
-            'Control Plane Coverage %': round(control_plane_coverage, 1)
-        })
-    
-    return pd.DataFrame(services).sort_values('Coverage %', ascending=False)
\ No newline at end of file
+    return get_metrics_engine(data).service_dataframe(selected_services)
@@ -0,0 +1,130 @@
+"""Headless coverage report: ``python -m ack_dashboard [options]``.
+
+Emits the overall and per-service metrics shown by the dashboard without
+importing Streamlit. JSON has an ``overall`` object and a ``services`` list;
+CSV and Parquet have one row per service after an ``ALL`` row holding the
+overall metrics. Exit codes: 0 on success, 1 when a coverage threshold is
+not met, 2 on usage or load errors.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+
+from .calculations.metrics import calculate_overall_metrics, create_service_dataframe
+from .data.store import DataStore
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+EXIT_OK = 0
+EXIT_BELOW_THRESHOLD = 1
+EXIT_ERROR = 2
+
+OVERALL_ROW = "ALL"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m ack_dashboard", description="Report ACK API coverage metrics.")
+    parser.add_argument("--results", default="results", help="results directory (default: %(default)s)")
+    parser.add_argument("--services", action="append", default=None,
+                        help="comma-separated services to include; may be repeated (default: all)")
+    parser.add_argument("--format", choices=["json", "csv", "parquet"], default="json")
+    parser.add_argument("--output", "-o", help="output file (default: stdout; required for parquet)")
+    parser.add_argument("--min-coverage", type=float,
+                        help="fail if the mean coverage %% of the selected services is below this value")
+    parser.add_argument("--min-control-plane-coverage", type=float,
+                        help="fail if the mean control plane coverage %% is below this value")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    results_dir = Path(args.results)
+    if not results_dir.is_dir():
+        print(f"Results directory not found: {results_dir}", file=sys.stderr)
+        return EXIT_ERROR
+
+    # A one-off report: no shared store, and no snapshot written into the results directory.
+    store = DataStore(results_dir, use_snapshot=False)
+    data = store.load()
+    for json_file, e in store.errors:
+        print(f"Error loading {json_file}: {e}", file=sys.stderr)
+    if store.errors or not data:
+        return EXIT_ERROR
+
+    selected_services = None
+    if args.services:
+        selected_services = [s.strip().lower() for value in args.services for s in value.split(",") if s.strip()]
+        if not selected_services:
+            print("--services names no services", file=sys.stderr)
+            return EXIT_ERROR
+        unknown = sorted(set(selected_services) - data.keys())
+        if unknown:
+            print(f"Unknown services: {', '.join(unknown)}", file=sys.stderr)
+            return EXIT_ERROR
+
+    metrics = calculate_overall_metrics(data, selected_services)
+    service_df = create_service_dataframe(data, selected_services)
+
+    if args.format == "json":
+        report = {
+            'data_version': data.version,
+            'overall': metrics,
+            'services': service_df.to_dict(orient='records'),
+        }
+        _write_text(json.dumps(report, indent=2) + "\n", args.output)
+    elif args.format == "csv":
+        _write_text(report_table(metrics, service_df).to_csv(index=False), args.output)
+    else:
+        if not args.output:
+            parser.error("--format parquet requires --output")
+        try:
+            report_table(metrics, service_df).to_parquet(args.output, index=False)
+        except ImportError as e:
+            print(f"Parquet output needs an optional dependency: {e}", file=sys.stderr)
+            return EXIT_ERROR
+
+    failures = []
+    if args.min_coverage is not None and metrics['overall_coverage'] < args.min_coverage:
+        failures.append(f"mean coverage {metrics['overall_coverage']:.1f}% < {args.min_coverage}%")
+    if (args.min_control_plane_coverage is not None
+            and metrics['control_plane_coverage'] < args.min_control_plane_coverage):
+        failures.append(
+            f"mean control plane coverage {metrics['control_plane_coverage']:.1f}% "
+            f"< {args.min_control_plane_coverage}%"
+        )
+    for failure in failures:
+        print(f"Coverage threshold not met: {failure}", file=sys.stderr)
+    return EXIT_BELOW_THRESHOLD if failures else EXIT_OK
+
+
+def report_table(metrics: Dict[str, Any], service_df: "pd.DataFrame") -> "pd.DataFrame":
+    """``service_df`` under an ``ALL`` row of the overall metrics.
+
+    As in the dashboard, the overall coverage percentages are the mean of the
+    per-service percentages, not the ratio of the summed counts.
+    """
+    import pandas as pd
+
+    overall = pd.DataFrame([{
+        'Service': OVERALL_ROW,
+        'Total Operations': metrics['total_operations'],
+        'Supported Operations': metrics['total_supported'],
+        'Coverage %': round(metrics['overall_coverage'], 1),
+        'Control Plane Operations': metrics['total_control_plane'],
+        'Supported Control Plane': metrics['total_supported_control_plane'],
+        'Control Plane Coverage %': round(metrics['control_plane_coverage'], 1),
+    }], columns=service_df.columns)
+    return pd.concat([overall, service_df], ignore_index=True).astype(service_df.dtypes.to_dict())
+
+
+def _write_text(text: str, output: Optional[str]) -> None:
+    if output:
+        Path(output).write_text(text)
+    else:
+        sys.stdout.write(text)
@@ -0,0 +1,42 @@
+"""Atomic file writes, shared by everything that writes files other processes read.
+
+Results files, snapshots, the static export and the metrics and status files
+are written to a temporary file and renamed over the target, so a reader never
+sees a partial file. ``mkstemp`` creates that file as ``0600``; it is given the
+mode a plain ``open()`` would have (``0666`` minus the umask) before the
+rename, so a server or job running as another user can still read it.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+def _read_umask() -> int:
+    # The umask can only be read by setting it; done once at import, before any writer threads start.
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+_FILE_MODE = 0o666 & ~_read_umask()
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """Binary file whose contents replace ``path`` once the block exits without an exception."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(tmp, _FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_atomic(path: Path, body: bytes) -> None:
+    with atomic_write(path) as f:
+        f.write(body)
@@ -0,0 +1,297 @@
+"""Generate ``results/*-operations.json`` from ACK controller sources: ``python -m ack_dashboard.data.generate``.
+
+Inputs are a directory of operation lists and a directory of controller
+checkouts. An operation list is a JSON file with a ``service_name`` and an
+``operations`` array of ``{"name", "type"}`` objects; a previous results file
+works as one. The checkout of a service is ``<controllers>/<service>-controller``
+(or ``<controllers>/<service>``).
+
+The Go files under ``pkg/resource/`` of each checkout are scanned for SDK calls
+(``.CreateBucket(`` or ``.CreateBucketWithContext(``), skipping comments and
+string literals. An operation is supported at the first call site, ordered by
+file path and line; operations that are never called are unsupported.
+
+Regeneration is incremental. Scans are cached by content hash in
+``<output>/.ack-generate-cache``, and a file whose mtime and size match the
+cache is not read at all, so only changed files are scanned, in parallel on a
+process pool. Results files whose content did not change are not rewritten,
+so the dashboard does not reload them.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from .files import write_atomic
+from .ingest import LoadError
+
+
+CACHE_NAME = ".ack-generate-cache"
+CACHE_FORMAT = 2
+SOURCE_DIR = "pkg/resource"
+
+# Fewer stale files than this are scanned inline: a process pool costs more to start.
+PARALLEL_MIN_FILES = 32
+
+# Comments and string literals are matched (and skipped) as whole tokens, so a
+# call-like text inside them never counts, nor does ``//`` inside a string
+# hide the call after it. Only the last alternative captures a call.
+_TOKEN = re.compile(
+    rb'//[^\n]*'                        # line comment
+    rb'|/\*.*?\*/'                      # block comment
+    rb'|"(?:[^"\\\n]|\\.)*"'            # interpreted string
+    rb"|'(?:[^'\\\n]|\\.)*'"            # rune
+    rb'|`[^`]*`'                        # raw string
+    rb'|\.([A-Z][A-Za-z0-9_]*)\(',      # method call
+    re.DOTALL,
+)
+_CONTEXT_SUFFIX = b'WithContext'
+
+# Exported method name -> first line it is called on
+Calls = Dict[str, int]
+
+
+def scan_go_source(source: bytes) -> Calls:
+    """Line of the first call of every exported method in ``source``, outside comments and string literals."""
+    calls: Calls = {}
+    line = 1
+    counted = 0
+    for match in _TOKEN.finditer(source):
+        name = match.group(1)
+        if name is None:
+            continue
+        start = match.start()
+        line += source.count(b'\n', counted, start)
+        counted = start
+        if name.endswith(_CONTEXT_SUFFIX) and len(name) > len(_CONTEXT_SUFFIX):
+            name = name[:-len(_CONTEXT_SUFFIX)]
+        calls.setdefault(name.decode('ascii'), line)
+    return calls
+
+
+def _scan_file(path: str) -> Calls:
+    with open(path, 'rb') as f:
+        return scan_go_source(f.read())
+
+
+class ScanCache:
+    """Scans by content digest, plus the (mtime, size, digest) last seen for each path."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.files: Dict[str, Tuple[int, int, str]] = {}
+        self.scans: Dict[str, Calls] = {}
+        if path is not None:
+            try:
+                cached = json.loads(path.read_text())
+            except (OSError, ValueError):
+                cached = {}
+            if cached.get('format') == CACHE_FORMAT:
+                self.files = {name: tuple(entry) for name, entry in cached['files'].items()}
+                self.scans = cached['scans']
+
+    def prune(self) -> int:
+        """Forget files that no longer exist; their scans go too unless another file shares the content."""
+        gone = [name for name in self.files if not os.path.exists(name)]
+        for name in gone:
+            del self.files[name]
+        return len(gone)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        live = {digest for _, _, digest in self.files.values()}
+        payload = {
+            'format': CACHE_FORMAT,
+            'files': self.files,
+            'scans': {digest: calls for digest, calls in self.scans.items() if digest in live},
+        }
+        write_atomic(self.path, json.dumps(payload, separators=(',', ':')).encode())
+
+
+@dataclass
+class GenerateReport:
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    errors: List[LoadError] = field(default_factory=list)
+    files: int = 0
+    stat_hits: int = 0
+    content_hits: int = 0
+    scanned: int = 0
+    pruned: int = 0
+    elapsed_s: float = 0.0
+
+
+def read_operation_list(path: Path) -> Tuple[str, List[Dict[str, str]]]:
+    with open(path, 'r') as f:
+        document = json.load(f)
+    service = document.get('service_name') or path.stem.removesuffix('-operations')
+    operations = [{'name': op['name'], 'type': op['type']} for op in document['operations']]
+    return service.lower(), operations
+
+
+def controller_dir(controllers: Path, service: str) -> Optional[Path]:
+    for candidate in (controllers / f"{service}-controller", controllers / service):
+        if (candidate / SOURCE_DIR).is_dir():
+            return candidate
+    return None
+
+
+def source_files(checkout: Path) -> List[Path]:
+    return sorted(
+        path for path in (checkout / SOURCE_DIR).rglob("*.go")
+        if not path.name.endswith("_test.go") and path.is_file()
+    )
+
+
+def service_results(service: str, operations: List[Dict[str, str]],
+                    locations: Dict[str, Tuple[str, int]]) -> Dict[str, Any]:
+    """The results document for ``service``: supported operations first, each group sorted by name."""
+    ops = []
+    for op in operations:
+        file, line = locations.get(op['name'], ("", 0))
+        ops.append({'name': op['name'], 'type': op['type'], 'file': file, 'line': line})
+    ops.sort(key=lambda op: (not op['file'], op['name']))
+
+    control_plane_ops = [op for op in ops if op['type'] == 'control_plane']
+    return {
+        'service_name': service,
+        'total_operations': len(ops),
+        'supported_operations': sum(1 for op in ops if op['file']),
+        'control_plane_operations': len(control_plane_ops),
+        'supported_control_plane_operations': sum(1 for op in control_plane_ops if op['file']),
+        'operations': ops,
+    }
+
+
+def generate(operation_lists: Path, controllers: Path, output: Path, workers: Optional[int] = None,
+             cache_path: Optional[Path] = None, use_cache: bool = True) -> GenerateReport:
+    """Write ``<output>/<service>-operations.json`` for every operation list in ``operation_lists``."""
+    start = time.perf_counter()
+    report = GenerateReport()
+    output.mkdir(parents=True, exist_ok=True)
+    cache = ScanCache((cache_path or output / CACHE_NAME) if use_cache else None)
+
+    services: Dict[str, Tuple[List[Dict[str, str]], Path, List[Path]]] = {}
+    for list_path in sorted(operation_lists.glob("*.json")):
+        try:
+            service, operations = read_operation_list(list_path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            report.errors.append(LoadError(list_path, ValueError(f"Invalid operation list: {e}")))
+            continue
+        checkout = controller_dir(controllers, service)
+        if checkout is None:
+            report.errors.append(LoadError(list_path, FileNotFoundError(
+                f"No controller checkout for {service} in {controllers}")))
+            continue
+        services[service] = (operations, checkout, source_files(checkout))
+
+    # Resolve every file to a digest, reading only files whose stat changed.
+    digests: Dict[str, str] = {}
+    stale: Dict[str, str] = {}
+    for _, _, files in services.values():
+        for path in files:
+            key = str(path.resolve())
+            report.files += 1
+            try:
+                stat = path.stat()
+                cached = cache.files.get(key)
+                if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size) and cached[2] in cache.scans:
+                    digests[key] = cached[2]
+                    report.stat_hits += 1
+                    continue
+                digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+            except OSError as e:
+                report.errors.append(LoadError(path, e))
+                continue
+            cache.files[key] = (stat.st_mtime_ns, stat.st_size, digest)
+            digests[key] = digest
+            if digest in cache.scans:
+                report.content_hits += 1
+            else:
+                stale.setdefault(digest, key)
+
+    for digest, calls in zip(stale, _scan_all(list(stale.values()), workers)):
+        if isinstance(calls, Exception):
+            report.errors.append(LoadError(Path(stale[digest]), calls))
+        else:
+            cache.scans[digest] = calls
+            report.scanned += 1
+
+    for service, (operations, checkout, files) in services.items():
+        locations: Dict[str, Tuple[str, int]] = {}
+        for path in files:
+            calls = cache.scans.get(digests.get(str(path.resolve()), ""), {})
+            relative = path.relative_to(checkout).as_posix()
+            for name, line in calls.items():
+                locations.setdefault(name, (relative, line))
+        results = service_results(service, operations, locations)
+        body = (json.dumps(results, indent=2) + "\n").encode()
+        results_path = output / f"{service}-operations.json"
+        try:
+            if results_path.read_bytes() == body:
+                report.unchanged.append(service)
+                continue
+        except OSError:
+            pass
+        write_atomic(results_path, body)
+        report.written.append(service)
+
+    report.pruned = cache.prune()
+    cache.save()
+    report.elapsed_s = time.perf_counter() - start
+    return report
+
+
+def _scan_all(paths: List[str], workers: Optional[int]) -> List[Any]:
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(paths) < PARALLEL_MIN_FILES:
+        return [_scan_or_error(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_scan_or_error, paths, chunksize=max(1, len(paths) // (workers * 4))))
+
+
+def _scan_or_error(path: str) -> Any:
+    # Errors are returned rather than raised so one unreadable file never aborts the batch.
+    try:
+        return _scan_file(path)
+    except OSError as e:
+        return e
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ack_dashboard.data.generate",
+                                     description="Generate results files from ACK controller sources.")
+    parser.add_argument("--operations", required=True, help="directory of per-service operation lists")
+    parser.add_argument("--controllers", required=True, help="directory of controller checkouts")
+    parser.add_argument("--output", default="results", help="results directory (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="scan processes (default: CPU count)")
+    parser.add_argument("--cache", default=None, help=f"scan cache file (default: <output>/{CACHE_NAME})")
+    parser.add_argument("--no-cache", action="store_true", help="scan every file and do not write a cache")
+    args = parser.parse_args(argv)
+
+    for name in ("operations", "controllers"):
+        if not Path(getattr(args, name)).is_dir():
+            print(f"Directory not found: {getattr(args, name)}", file=sys.stderr)
+            return 2
+
+    report = generate(Path(args.operations), Path(args.controllers), Path(args.output), args.workers,
+                      Path(args.cache) if args.cache else None, use_cache=not args.no_cache)
+    for path, e in report.errors:
+        print(f"Error generating from {path}: {e}", file=sys.stderr)
+    print(f"{len(report.written)} written, {len(report.unchanged)} unchanged; "
+          f"{report.scanned} of {report.files} Go files scanned "
+          f"({report.stat_hits} skipped by mtime and size, {report.content_hits} by content hash) "
+          f"in {report.elapsed_s:.2f}s")
+    return 2 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""Coverage history across results snapshots, stored as an append-only delta log.
+
+Each line of ``snapshots.jsonl`` records one snapshot (typically one ACK
+release) and holds only what changed since the previous one::
+
+    {"label": "v1.2.0", "recorded_at": "...", "data_version": "...",
+     "summaries": {"s3": [total, supported, control_plane, supported_control_plane], "gone": null},
+     "operations": {"s3": {"CreateBucket": ["control_plane", "pkg/resource/bucket/sdk.go", 83],
+                           "RemovedOp": null}}}
+
+Opening a history replays the deltas once into in-memory indexes: per-service
+coverage change points and per-snapshot support transitions. Queries are then
+answered from those indexes without touching any results directory.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from .store import data_version, get_store
+
+
+HISTORY_FILE = "snapshots.jsonl"
+SUMMARY_FIELDS = [
+    'total_operations',
+    'supported_operations',
+    'control_plane_operations',
+    'supported_control_plane_operations',
+]
+
+# (type, file, line) of an operation as recorded in a snapshot
+OperationState = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class CoveragePoint:
+    label: str
+    total: int
+    supported: int
+    control_plane: int
+    supported_control_plane: int
+
+    @property
+    def coverage(self) -> float:
+        return self.supported / self.total * 100 if self.total > 0 else 0
+
+    @property
+    def control_plane_coverage(self) -> float:
+        return self.supported_control_plane / self.control_plane * 100 if self.control_plane > 0 else 0
+
+
+@dataclass(frozen=True)
+class SupportChange:
+    service: str
+    operation: str
+    label: str
+    supported: bool
+
+
+@dataclass
+class _ServiceHistory:
+    # Snapshot indices at which the summary changed, and the summary from then on.
+    indices: List[int] = field(default_factory=list)
+    summaries: List[Optional[Tuple[int, int, int, int]]] = field(default_factory=list)
+
+
+def _is_supported(state: Optional[OperationState]) -> bool:
+    return state is not None and bool(state[1]) and state[2] > 0
+
+
+class HistoryStore:
+    """Append-only coverage history kept in ``<directory>/snapshots.jsonl``."""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.path = Path(directory) / HISTORY_FILE
+        self.labels: List[str] = []
+        self.recorded_at: List[str] = []
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._current: Dict[str, Dict[str, OperationState]] = {}
+        self._summaries: Dict[str, Tuple[int, int, int, int]] = {}
+        self._services: Dict[str, _ServiceHistory] = {}
+        self._transitions: Dict[Tuple[str, str], List[Tuple[int, bool]]] = {}
+        self._changes_by_snapshot: List[List[Tuple[str, str, bool]]] = []
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def version(self) -> int:
+        return len(self.labels)
+
+    @property
+    def services(self) -> List[str]:
+        return sorted(self._summaries)
+
+    def refresh(self) -> None:
+        """Replay records appended since the last refresh (by this or another process)."""
+        with self._lock:
+            if not self.path.exists():
+                return
+            with open(self.path, 'r') as f:
+                f.seek(self._offset)
+                for line in iter(f.readline, ''):
+                    if not line.endswith('\n'):
+                        break  # A writer is still appending this record
+                    self._apply(json.loads(line))
+                    self._offset = f.tell()
+
+    def append(self, data: Dict[str, Any], label: str) -> Dict[str, Any]:
+        """Record ``data`` (the ``load_data()`` shape) as a new snapshot, storing only its delta."""
+        self.refresh()
+        with self._lock:
+            if label in self.labels:
+                raise ValueError(f"Snapshot {label!r} is already recorded")
+
+            summaries: Dict[str, Optional[List[int]]] = {}
+            operations: Dict[str, Dict[str, Optional[list]]] = {}
+            for service, service_data in data.items():
+                summary = tuple(service_data[f] for f in SUMMARY_FIELDS)
+                if self._summaries.get(service) != summary:
+                    summaries[service] = list(summary)
+
+                before = self._current.get(service, {})
+                after = {op['name']: (op['type'], op['file'], op['line']) for op in service_data['operations']}
+                delta = {name: list(state) for name, state in after.items() if before.get(name) != state}
+                delta.update({name: None for name in before.keys() - after.keys()})
+                if delta:
+                    operations[service] = delta
+
+            for service in self._summaries.keys() - data.keys():
+                summaries[service] = None
+                operations[service] = {name: None for name in self._current.get(service, {})}
+
+            record = {
+                'label': label,
+                'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'data_version': data_version(data),
+                'summaries': summaries,
+                'operations': operations,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+                self._offset = f.tell()
+            self._apply(record)
+            return record
+
+    def coverage_series(self, service: str, last: Optional[int] = None) -> List[CoveragePoint]:
+        """Coverage of ``service`` at each of the last ``last`` snapshots it existed in."""
+        history = self._services.get(service)
+        if history is None:
+            return []
+        start = 0 if last is None else max(0, len(self.labels) - last)
+        points = []
+        for index in range(start, len(self.labels)):
+            position = bisect_right(history.indices, index) - 1
+            summary = history.summaries[position] if position >= 0 else None
+            if summary is not None:
+                points.append(CoveragePoint(self.labels[index], *summary))
+        return points
+
+    def newly_supported(self, since: str, service: Optional[str] = None) -> List[SupportChange]:
+        """Operations unsupported (or absent) at snapshot ``since`` and supported in the latest one."""
+        return self._flipped(since, to_supported=True, service=service)
+
+    def newly_unsupported(self, since: str, service: Optional[str] = None) -> List[SupportChange]:
+        return self._flipped(since, to_supported=False, service=service)
+
+    def _flipped(self, since: str, to_supported: bool, service: Optional[str]) -> List[SupportChange]:
+        start = self.labels.index(since)
+        # Only the transitions recorded after ``since`` are visited.
+        last_change: Dict[Tuple[str, str], int] = {}
+        for index in range(start + 1, len(self.labels)):
+            for svc, operation, _ in self._changes_by_snapshot[index]:
+                if service is None or svc == service:
+                    last_change[(svc, operation)] = index
+
+        changes = []
+        for key, index in last_change.items():
+            now = self._state_at(key, len(self.labels) - 1)
+            if now == to_supported and self._state_at(key, start) != to_supported:
+                changes.append(SupportChange(key[0], key[1], self.labels[index], now))
+        return sorted(changes, key=lambda c: (c.service, c.operation))
+
+    def _state_at(self, key: Tuple[str, str], index: int) -> bool:
+        transitions = self._transitions.get(key, [])
+        position = bisect_right(transitions, (index, True)) - 1
+        return transitions[position][1] if position >= 0 else False
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        index = len(self.labels)
+        self.labels.append(record['label'])
+        self.recorded_at.append(record.get('recorded_at', ''))
+
+        for service, summary in record['summaries'].items():
+            history = self._services.setdefault(service, _ServiceHistory())
+            history.indices.append(index)
+            history.summaries.append(tuple(summary) if summary is not None else None)
+            if summary is None:
+                self._summaries.pop(service, None)
+            else:
+                self._summaries[service] = tuple(summary)
+
+        changes = []
+        for service, operations in record['operations'].items():
+            current = self._current.setdefault(service, {})
+            for name, state in operations.items():
+                was_supported = _is_supported(current.get(name))
+                if state is None:
+                    current.pop(name, None)
+                else:
+                    current[name] = tuple(state)
+                supported = _is_supported(current.get(name))
+                if supported != was_supported:
+                    self._transitions.setdefault((service, name), []).append((index, supported))
+                    changes.append((service, name, supported))
+            if not current:
+                del self._current[service]
+        self._changes_by_snapshot.append(changes)
+
+
+_histories: Dict[Path, HistoryStore] = {}
+_histories_lock = threading.Lock()
+
+
+def default_history_dir() -> Path:
+    return Path(os.environ.get("ACK_DASHBOARD_HISTORY_DIR", "history"))
+
+
+def get_history(directory: Optional[Union[str, Path]] = None) -> HistoryStore:
+    """Return the process-wide history for ``directory``, picking up newly appended snapshots."""
+    key = Path(directory or default_history_dir()).resolve()
+    with _histories_lock:
+        history = _histories.get(key)
+        if history is None:
+            history = _histories[key] = HistoryStore(key)
+            return history
+    history.refresh()
+    return history
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ack_dashboard.data.history",
+                                     description="Record and inspect coverage history.")
+    parser.add_argument("--history", default=None, help="history directory (default: $ACK_DASHBOARD_HISTORY_DIR or history)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    append = commands.add_parser("append", help="record a results directory as a new snapshot")
+    append.add_argument("label", help="snapshot label, e.g. the ACK release")
+    append.add_argument("--results", default="results")
+    commands.add_parser("list", help="list recorded snapshots")
+    args = parser.parse_args(argv)
+
+    history = get_history(args.history)
+    if args.command == "append":
+        store = get_store(args.results)
+        data = store.load()
+        for json_file, e in store.errors:
+            print(f"Error loading {json_file}: {e}", file=sys.stderr)
+        if store.errors or not data:
+            return 2
+        try:
+            record = history.append(data, args.label)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+        changed = sum(len(ops) for ops in record['operations'].values())
+        print(f"Recorded {args.label}: {changed} operation change(s) across {len(record['operations'])} service(s)")
+    else:
+        for label, recorded_at in zip(history.labels, history.recorded_at):
+            print(f"{label}\t{recorded_at}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Tuple
+
+from .cache import LRUCache
+from .store import data_version
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+TABLE_COLUMNS = ['service', 'name', 'type', 'file', 'line', 'supported']
+DISPLAY_COLUMNS = ['Operation', 'Type', 'Supported', 'File', 'Line']
+
+
+class OperationsIndex:
+    """Every operation of every service in one columnar table, built once per data version.
+
+    ``table`` holds the raw columns (categorical service/type/file, boolean
+    ``supported``); ``display`` holds the formatted columns the views render.
+    Both share the same row order, grouped by service, so a service is a
+    contiguous ``[start, stop)`` slice described by ``offsets``.
+
+    ``query()`` filters and sorts on the server and returns row positions;
+    ``page()`` materializes just one page of them, so large tables never have
+    to be shipped to the browser whole.
+    """
+
+    def __init__(self, table: "pd.DataFrame", display: "pd.DataFrame", offsets: Dict[str, Tuple[int, int]]):
+        self.table = table
+        self.display = display
+        self.offsets = offsets
+        self._queries = LRUCache(maxsize=128)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @property
+    def services(self):
+        return list(self.offsets)
+
+    def service_slice(self, service: str) -> slice:
+        start, stop = self.offsets.get(service, (0, 0))
+        return slice(start, stop)
+
+    def service_table(self, service: str) -> "pd.DataFrame":
+        return self.table.iloc[self.service_slice(service)]
+
+    def service_operations(self, service: str, control_plane_only: bool = False) -> "pd.DataFrame":
+        rows = self.service_slice(service)
+        display = self.display.iloc[rows]
+        if control_plane_only:
+            is_control_plane = (self.table['type'].iloc[rows] == 'control_plane').to_numpy()
+            display = display[is_control_plane].drop(columns='Type')
+        return display.reset_index(drop=True)
+
+    def query(self, services: Optional[Iterable[str]] = None, types: Optional[Iterable[str]] = None,
+              supported: Optional[Iterable[str]] = None, sort_by: Optional[str] = None,
+              descending: bool = False) -> np.ndarray:
+        """Row positions matching the filters, in display order.
+
+        ``types`` and ``supported`` take display values (``'Control Plane'``,
+        ``'Yes'``/``'No'``); ``None`` means no filter. ``sort_by`` is a display
+        column (or ``'Service'``); ties keep index order. Results are memoized
+        per filter and sort combination.
+        """
+        filters = (
+            None if services is None else tuple(sorted(set(services))),
+            None if types is None else tuple(sorted(set(types))),
+            None if supported is None else tuple(sorted(set(supported))),
+        )
+        rows = self._queries.get_or_create(filters, lambda: self._filter(*filters))
+        if sort_by is None:
+            return rows[::-1] if descending else rows
+        return self._queries.get_or_create(filters + (sort_by, descending),
+                                           lambda: self._sort(rows, sort_by, descending))
+
+    def page(self, rows: np.ndarray, page: int, page_size: int,
+             columns: Optional[List[str]] = None) -> "pd.DataFrame":
+        """One page (0-based) of ``rows``, indexed by position in the result."""
+        start = page * page_size
+        positions = rows[start:start + page_size]
+        frame = self.display.iloc[positions]
+        if columns is not None and 'Service' in columns:
+            frame = frame.assign(Service=self.table['service'].to_numpy()[positions])
+        if columns is not None:
+            frame = frame[columns]
+        return frame.set_axis(range(start, start + len(positions)))
+
+    def _filter(self, services, types, supported) -> np.ndarray:
+        if services is not None and len(services) == 1:
+            rows = np.arange(*self.offsets.get(services[0], (0, 0)))
+        else:
+            rows = np.arange(len(self.table))
+            if services is not None:
+                rows = rows[self.table['service'].isin(services).to_numpy()]
+        for column, values in (('Type', types), ('Supported', supported)):
+            if values is not None:
+                rows = rows[self.display[column].iloc[rows].isin(values).to_numpy()]
+        return rows
+
+    def _sort(self, rows: np.ndarray, sort_by: str, descending: bool) -> np.ndarray:
+        if sort_by == 'Line':
+            keys = self.table['line'].to_numpy()[rows]
+        elif sort_by == 'Service':
+            keys = _sort_ranks(self.table['service'].array)[rows]
+        elif sort_by == 'Operation':
+            keys = self.display['Operation'].to_numpy()[rows]
+        else:
+            keys = _sort_ranks(self.display[sort_by].array)[rows]
+        # Sort on dense ranks, so descending order can negate them and ties stay in index order.
+        _, ranks = np.unique(keys, return_inverse=True)
+        order = np.argsort(-ranks if descending else ranks, kind='stable')
+        return rows[order]
+
+
+def _sort_ranks(categorical: "pd.Categorical") -> np.ndarray:
+    """Per-row rank of each value in its categories' alphabetical order."""
+    ranks = np.empty(len(categorical.categories), dtype=np.int32)
+    ranks[np.argsort(categorical.categories.to_numpy(dtype=str))] = np.arange(len(ranks))
+    return ranks[categorical.codes]
+
+
+def build_operations_index(data: Dict[str, Any]) -> OperationsIndex:
+    import pandas as pd
+
+    services, names, types, files, lines = [], [], [], [], []
+    offsets = {}
+    for service_name, service_data in data.items():
+        start = len(names)
+        for op in service_data['operations']:
+            names.append(op['name'])
+            types.append(op['type'])
+            files.append(op['file'])
+            lines.append(op['line'])
+        offsets[service_name] = (start, len(names))
+        services.extend([service_name] * (len(names) - start))
+
+    line = np.asarray(lines, dtype=np.int32)
+    file = pd.Categorical(files)
+    type_ = pd.Categorical(types)
+    supported = (file.codes != _code_of(file, '')) & (line > 0)
+
+    table = pd.DataFrame({
+        'service': pd.Categorical(services, categories=list(offsets)),
+        'name': names,
+        'type': type_,
+        'file': file,
+        'line': line,
+        'supported': supported,
+    })
+
+    display = pd.DataFrame({
+        'Operation': names,
+        'Type': type_.rename_categories([t.replace('_', ' ').title() for t in type_.categories]),
+        'Supported': pd.Categorical.from_codes(np.where(supported, 0, 1), categories=['Yes', 'No']),
+        'File': file.rename_categories([f if f else 'N/A' for f in file.categories]),
+        'Line': np.where(line > 0, line.astype(str), 'N/A'),
+    })
+
+    return OperationsIndex(table, display, offsets)
+
+
+def _code_of(categorical: "pd.Categorical", value: str) -> int:
+    categories = categorical.categories
+    return int(categories.get_loc(value)) if value in categories else -2
+
+
+_index_cache = LRUCache(maxsize=4, name="operations_index")
+
+
+def get_operations_index(data: Dict[str, Any]) -> OperationsIndex:
+    """Return the operations index for ``data``, building it only once per data version."""
+    return _index_cache.get_or_create(data_version(data), lambda: build_operations_index(data))
@@ -0,0 +1,218 @@
+import json
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .records import compact_service
+
+STREAMED_ARRAY = 'operations'
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DELIMITERS = frozenset(' \t\n\r,:]}')
+
+
+class LoadError(NamedTuple):
+    path: Path
+    error: Exception
+
+
+@dataclass(frozen=True)
+class IngestOptions:
+    """How results files are read.
+
+    ``workers`` > 1 parses files concurrently on a thread pool (or a process
+    pool with ``executor="process"``). ``streaming`` decodes the ``operations``
+    array item by item from fixed-size chunks, so the raw text of a large
+    service is never held alongside its parsed operations.
+    """
+
+    workers: int = 1
+    executor: str = "thread"
+    streaming: bool = False
+    chunk_size: int = 1 << 16
+
+
+def resolve_options(workers: Optional[int] = None, executor: Optional[str] = None,
+                    streaming: Optional[bool] = None, env: Optional[Dict[str, str]] = None) -> IngestOptions:
+    """Build ingest options, falling back to ``ACK_DASHBOARD_LOAD_*`` environment variables."""
+    env = os.environ if env is None else env
+    if workers is None:
+        workers = int(env.get("ACK_DASHBOARD_LOAD_WORKERS", "1"))
+    if executor is None:
+        executor = env.get("ACK_DASHBOARD_LOAD_EXECUTOR", "thread")
+    if streaming is None:
+        streaming = env.get("ACK_DASHBOARD_LOAD_STREAMING", "0") == "1"
+    return IngestOptions(workers=workers, executor=executor, streaming=streaming)
+
+
+def parse_results_file(path: Union[str, Path], streaming: bool = False, chunk_size: int = 1 << 16) -> Dict[str, Any]:
+    with open(path, 'r') as f:
+        if streaming:
+            return _StreamingReader(f, chunk_size).read_document()
+        return json.load(f)
+
+
+def parse_results_files(paths: Iterable[Path], options: IngestOptions = IngestOptions(), compact: bool = False
+                        ) -> Tuple[Dict[Path, Dict[str, Any]], List[LoadError]]:
+    """Parse ``paths``, returning the parsed documents and every per-file error together.
+
+    With ``compact``, each document's operations become ``records.Operation``
+    as soon as it is parsed, so the raw dicts of only one file are alive at a
+    time when parsing sequentially.
+    """
+    paths = list(paths)
+    results: Dict[Path, Dict[str, Any]] = {}
+    errors: List[LoadError] = []
+
+    if options.workers <= 1 or len(paths) <= 1:
+        outcomes = (_parse_one(path, options.streaming, options.chunk_size) for path in paths)
+        for path, outcome in zip(paths, outcomes):
+            _collect(path, outcome, results, errors, compact)
+        return results, errors
+
+    with _executor(options) as pool:
+        outcomes = pool.map(_parse_one, paths, [options.streaming] * len(paths), [options.chunk_size] * len(paths))
+        for path, outcome in zip(paths, outcomes):
+            _collect(path, outcome, results, errors, compact)
+    return results, errors
+
+
+def _executor(options: IngestOptions) -> Executor:
+    if options.executor == "process":
+        return ProcessPoolExecutor(max_workers=options.workers)
+    if options.executor == "thread":
+        return ThreadPoolExecutor(max_workers=options.workers, thread_name_prefix="ack-ingest")
+    raise ValueError(f"Unknown executor {options.executor!r}; expected 'thread' or 'process'")
+
+
+def _parse_one(path: Path, streaming: bool, chunk_size: int) -> Union[Dict[str, Any], Exception]:
+    # Errors are returned rather than raised so one bad file never aborts the batch.
+    try:
+        return parse_results_file(path, streaming, chunk_size)
+    except Exception as e:
+        return e
+
+
+def _collect(path: Path, outcome: Union[Dict[str, Any], Exception],
+             results: Dict[Path, Dict[str, Any]], errors: List[LoadError], compact: bool = False) -> None:
+    if isinstance(outcome, Exception):
+        errors.append(LoadError(path, outcome))
+    elif not isinstance(outcome, dict):
+        errors.append(LoadError(path, ValueError("Expected a JSON object at the top level")))
+    elif compact:
+        try:
+            results[path] = compact_service(outcome)
+        except (KeyError, TypeError) as e:
+            errors.append(LoadError(path, ValueError(f"Malformed operation record: missing or invalid {e}")))
+    else:
+        results[path] = outcome
+
+
+class _StreamingReader:
+    """Incremental decoder for one top-level JSON object.
+
+    Values are decoded with ``JSONDecoder.raw_decode`` from a sliding window
+    over the file; items of the ``operations`` array are decoded one at a time
+    and consumed text is dropped from the window as it goes.
+    """
+
+    def __init__(self, f, chunk_size: int):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def read_document(self) -> Dict[str, Any]:
+        result = self.read_object()
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                raise ValueError(f"Extra data after JSON document: {self._buffer[self._pos]!r}")
+            if self._eof:
+                return result
+            self._fill()
+
+    def read_object(self) -> Dict[str, Any]:
+        self._expect('{')
+        result: Dict[str, Any] = {}
+        if self._peek() == '}':
+            self._pos += 1
+            return result
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected an object key, got {key!r}")
+            self._expect(':')
+            if key == STREAMED_ARRAY and self._peek() == '[':
+                result[key] = self._array()
+            else:
+                result[key] = self._value()
+            if self._next_separator('}'):
+                return result
+
+    def _array(self) -> List[Any]:
+        self._expect('[')
+        items: List[Any] = []
+        if self._peek() == ']':
+            self._pos += 1
+            return items
+        while True:
+            items.append(self._value())
+            if self._next_separator(']'):
+                return items
+
+    def _next_separator(self, closing: str) -> bool:
+        char = self._peek()
+        self._pos += 1
+        if char == closing:
+            return True
+        if char != ',':
+            raise ValueError(f"Expected ',' or {closing!r}, got {char!r}")
+        return False
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            # A number cut by the window edge ("2." of "2.5") decodes early; only trust
+            # a value once the character after it is a delimiter.
+            if not self._eof and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                raise ValueError("Unexpected end of JSON document")
+            self._fill()
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, got {found!r}")
+        self._pos += 1
+
+    def _fill(self) -> None:
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+
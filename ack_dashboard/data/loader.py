@@ -1,24 +1,82 @@
-import json
-import streamlit as st
+import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 
+from .store import get_store
+
+
+logger = logging.getLogger(__name__)
+
+# Called with a user-facing message whenever loading fails. The data layer has
+# no UI dependency; the Streamlit app installs ``st.error`` via ``set_error_reporter``.
+ErrorReporter = Callable[[str], Any]
+
+_error_reporter: ErrorReporter = logger.error
+
+
+def set_error_reporter(reporter: ErrorReporter) -> None:
+    global _error_reporter
+    _error_reporter = reporter
+
+
+def watch_interval() -> float:
+    """Seconds between background checks of the results directory; ``0`` reloads on every call instead."""
+    return float(os.environ.get("ACK_DASHBOARD_WATCH_INTERVAL", "2"))
+
+
+def configured_datasets(env: Optional[Dict[str, str]] = None) -> Dict[str, Path]:
+    """Results directories the dashboard can switch between, by display name.
+
+    ``ACK_DASHBOARD_DATASETS`` is a comma-separated list of ``name=path`` (or
+    bare ``path``, named after its directory), e.g.
+    ``upstream=results,fork=/data/fork-results``. Defaults to ``results``.
+    """
+    env = os.environ if env is None else env
+    return _named_paths(env.get("ACK_DASHBOARD_DATASETS", "results")) or {"results": Path("results")}
+
+
+def configured_baselines(env: Optional[Dict[str, str]] = None) -> Dict[str, Path]:
+    """Datasets the Snapshot Diff view may compare against, by display name.
+
+    Every configured dataset, plus ``ACK_DASHBOARD_BASELINES``: results
+    directories or compiled snapshot files of earlier releases, in the same
+    ``name=path`` format, e.g. ``v1.2.0=/data/v1.2.0.ack-snapshot``. Viewers
+    can only pick from this list; they never supply a path.
+    """
+    env = os.environ if env is None else env
+    return {**configured_datasets(env), **_named_paths(env.get("ACK_DASHBOARD_BASELINES", ""))}
+
+
+def _named_paths(value: str) -> Dict[str, Path]:
+    paths: Dict[str, Path] = {}
+    for item in value.split(","):
+        name, _, path = item.strip().rpartition("=")
+        if path:
+            paths[name.strip() or Path(path).name] = Path(path)
+    return paths
+
+
+def load_data(results_dir: Path = Path("results"), report_error: Optional[ErrorReporter] = None) -> Optional[Dict[str, Any]]:
+    report_error = report_error or _error_reporter
 
-def load_data() -> Optional[Dict[str, Any]]:
-    results_dir = Path("results")
-    data = {}
-    
     if not results_dir.exists():
-        st.error("Results directory not found!")
+        report_error("Results directory not found!")
         return None
-    
-    for json_file in results_dir.glob("*.json"):
-        try:
-            with open(json_file, 'r') as f:
-                service_data = json.load(f)
-                service_name = service_data.get('service_name', json_file.stem.replace('-operations', ''))
-                data[service_name] = service_data
-        except Exception as e:
-            st.error(f"Error loading {json_file}: {e}")
-    
-    return data
\ No newline at end of file
+
+    store = get_store(results_dir)
+    interval = watch_interval()
+    if interval > 0:
+        # Changed files are reparsed by the store's watcher thread; a rerun
+        # just picks up whichever version was swapped in last.
+        store.watch(interval)
+        data, errors = store.current_with_errors()
+        if data is None:
+            data, errors = store.load_with_errors()
+    else:
+        data, errors = store.load_with_errors()
+    if errors:
+        details = "\n".join(f"- `{json_file}`: {e}" for json_file, e in errors)
+        report_error(f"Error loading {len(errors)} results file(s):\n{details}")
+
+    return data
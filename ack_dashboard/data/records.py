@@ -0,0 +1,99 @@
+"""Compact, immutable operation records shared by every session.
+
+A parsed results file holds one dict per operation plus a fresh copy of every
+file path. ``Operation`` replaces those dicts with ``__slots__`` records:
+names and paths are interned, ``line`` values are shared, and the operation
+type is a small integer code into ``OPERATION_TYPES``. Records still read like
+the original dicts (``op['name']``, ``op.get('file')``, ``dict(op)``), so code
+written against the JSON shape keeps working.
+"""
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List
+
+
+FIELDS = ('name', 'type', 'file', 'line')
+
+# Type code -> type name; codes for unexpected types are appended on first sight.
+OPERATION_TYPES: List[str] = ['control_plane', 'data_plane']
+_TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(OPERATION_TYPES)}
+_types_lock = threading.Lock()
+
+# One int object per distinct line number instead of one per operation.
+_LINES: Dict[int, int] = {}
+
+
+def type_code(type_: str) -> int:
+    code = _TYPE_CODES.get(type_)
+    if code is None:
+        with _types_lock:
+            code = _TYPE_CODES.get(type_)
+            if code is None:
+                OPERATION_TYPES.append(sys.intern(type_))
+                code = _TYPE_CODES[type_] = len(OPERATION_TYPES) - 1
+    return code
+
+
+class Operation(Mapping):
+    __slots__ = ('name', 'file', 'line', 'type_code')
+
+    def __init__(self, name: str, type_: str, file: str, line: int):
+        _set_name(self, sys.intern(name))
+        _set_type_code(self, type_code(type_))
+        _set_file(self, sys.intern(file))
+        _set_line(self, _LINES.setdefault(line, line))
+
+    @classmethod
+    def from_dict(cls, op: Dict[str, Any]) -> "Operation":
+        return cls(op['name'], op['type'], op['file'], op['line'])
+
+    @property
+    def type(self) -> str:
+        return OPERATION_TYPES[self.type_code]
+
+    @property
+    def supported(self) -> bool:
+        return bool(self.file) and self.line > 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Operation records are read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Operation records are read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.type_code, self.file, self.line))
+
+    def __reduce__(self):
+        return (Operation, (self.name, self.type, self.file, self.line))
+
+    def __repr__(self) -> str:
+        return f"Operation({self.name!r}, {self.type!r}, {self.file!r}, {self.line!r})"
+
+
+# Slot setters, bypassing the read-only ``__setattr__`` during construction
+_set_name = Operation.name.__set__
+_set_type_code = Operation.type_code.__set__
+_set_file = Operation.file.__set__
+_set_line = Operation.line.__set__
+
+
+def compact_service(service_data: Dict[str, Any]) -> Dict[str, Any]:
+    """``service_data`` with its operations as a tuple of ``Operation`` records."""
+    compact = {key: value for key, value in service_data.items() if key != 'operations'}
+    compact['operations'] = tuple(
+        op if isinstance(op, Operation) else Operation.from_dict(op) for op in service_data['operations']
+    )
+    return compact
@@ -0,0 +1,319 @@
+"""Inverted index for searching operations across every service.
+
+Each operation is indexed under three fields:
+
+- ``name``: CamelCase tokens of the operation name plus the full name
+  (``DescribeDBClusters`` -> ``describe``, ``db``, ``clusters``, ``describedbclusters``);
+  digits stay with the letters before them (``AssignIpv6Addresses`` -> ``assign``, ``ipv6``, ...)
+- ``service``: the service name
+- ``file``: path segments of the implementing file, its base name and the full path
+
+Query terms are whitespace separated and combined with AND:
+
+- ``word`` exact token, ``word*`` token prefix, other ``*`` wildcards
+  such as ``*word*`` match anywhere in a token, ``~word`` is fuzzy (shared trigrams)
+- ``name:``, ``service:`` or ``file:`` restrict a term to one field; a
+  wildcard term on ``name:`` matches whole operation names, so ``name:Tag*``
+  finds ``TagResource`` but not ``UntagResource``
+- filters: ``is:supported``, ``is:unsupported``, ``is:unsupported-everywhere``
+  (the operation is unsupported in every service that has it) and
+  ``type:control`` / ``type:data``
+"""
+import re
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from .cache import LRUCache
+from .store import data_version
+
+
+FIELDS = ('name', 'service', 'file')
+
+_CAMEL_TOKEN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+\d*|[A-Z]+\d*|\d+')
+_PATH_TOKEN = re.compile(r'[A-Za-z0-9]+')
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    service: str
+    name: str
+    type: str
+    file: str
+    line: int
+    supported: bool
+
+
+def name_tokens(name: str) -> List[str]:
+    return [token.lower() for token in _CAMEL_TOKEN.findall(name)]
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _FieldIndex:
+    def __init__(self):
+        self.postings: Dict[str, Set[int]] = {}
+        self.vocabulary: List[str] = []  # sorted, for prefix ranges
+        self.trigrams: Dict[str, Set[str]] = {}
+        self.gram_counts: Dict[str, int] = {}
+        self._joined: Optional[str] = None
+
+    def copy(self) -> "_FieldIndex":
+        index = _FieldIndex()
+        index.postings = {token: set(rows) for token, rows in self.postings.items()}
+        index.vocabulary = list(self.vocabulary)
+        index.trigrams = {gram: set(tokens) for gram, tokens in self.trigrams.items()}
+        index.gram_counts = dict(self.gram_counts)
+        return index
+
+    def add(self, token: str, row: int) -> None:
+        rows = self.postings.get(token)
+        if rows is None:
+            rows = self.postings[token] = set()
+            self._joined = None
+            self.vocabulary.insert(bisect_left(self.vocabulary, token), token)
+            grams = _trigrams(token)
+            for gram in grams:
+                self.trigrams.setdefault(gram, set()).add(token)
+            self.gram_counts[token] = len(grams)
+        rows.add(row)
+
+    def remove(self, token: str, row: int) -> None:
+        rows = self.postings[token]
+        rows.discard(row)
+        if not rows:
+            del self.postings[token]
+            self._joined = None
+            del self.vocabulary[bisect_left(self.vocabulary, token)]
+            for gram in _trigrams(token):
+                tokens = self.trigrams[gram]
+                tokens.discard(token)
+                if not tokens:
+                    del self.trigrams[gram]
+            del self.gram_counts[token]
+
+    def exact(self, token: str) -> Set[int]:
+        return self.postings.get(token, set())
+
+    def prefix(self, prefix: str) -> Set[int]:
+        rows: Set[int] = set()
+        i = bisect_left(self.vocabulary, prefix)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(prefix):
+            rows |= self.postings[self.vocabulary[i]]
+            i += 1
+        return rows
+
+    def wildcard(self, pattern: str) -> Set[int]:
+        literal = max(pattern.split('*'), key=len)
+        if len(literal) >= 3:
+            # Only tokens holding every trigram of the longest literal part can match.
+            candidates = set.intersection(*(self.trigrams.get(literal[i:i + 3], set()) for i in range(len(literal) - 2)))
+            regex = _wildcard_regex(pattern)
+            tokens = [token for token in candidates if regex.fullmatch(token)]
+        else:
+            # Scan the whole vocabulary in one regex pass over a newline-joined copy.
+            if self._joined is None:
+                self._joined = "\n".join(self.vocabulary)
+            tokens = [match.group() for match in _wildcard_regex(pattern).finditer(self._joined)]
+        rows: Set[int] = set()
+        for token in tokens:
+            rows |= self.postings[token]
+        return rows
+
+    def fuzzy(self, word: str, threshold: float = 0.5) -> Set[int]:
+        grams = _trigrams(word)
+        shared = Counter(chain.from_iterable(self.trigrams.get(gram, ()) for gram in grams))
+        rows: Set[int] = set()
+        for token, count in shared.items():
+            # Jaccard similarity of the two trigram sets.
+            if count >= threshold * (len(grams) + self.gram_counts[token] - count):
+                rows |= self.postings[token]
+        return rows
+
+
+class SearchIndex:
+    """Inverted index over all operations of one data version.
+
+    An index is not modified once built; ``derive()`` builds the index of
+    another version from it.
+    """
+
+    def __init__(self):
+        self.version = ""
+        self._fields = {field: _FieldIndex() for field in FIELDS}
+        self._rows: Dict[int, SearchHit] = {}
+        self._row_tokens: Dict[int, List[Tuple[str, str]]] = {}
+        self._service_rows: Dict[str, List[int]] = {}
+        self._name_rows: Dict[str, Set[int]] = {}
+        self._service_data: Dict[str, Any] = {}
+        self._next_row = 0
+        self._queries = LRUCache(maxsize=256, name="search_queries")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def shared_services(self, data: Dict[str, Any]) -> int:
+        """Number of services in ``data`` whose results this index already holds."""
+        return sum(1 for service, service_data in data.items() if self._service_data.get(service) is service_data)
+
+    def derive(self, data: Dict[str, Any]) -> "SearchIndex":
+        """Index of ``data``, reindexing only the services whose results differ from this index's.
+
+        Unchanged files keep their parsed object across store reloads, so an
+        identity check is enough to find the services that need reindexing.
+        """
+        index = SearchIndex()
+        index._fields = {field: field_index.copy() for field, field_index in self._fields.items()}
+        index._rows = dict(self._rows)
+        index._row_tokens = dict(self._row_tokens)
+        index._service_rows = dict(self._service_rows)
+        index._name_rows = {name: set(rows) for name, rows in self._name_rows.items()}
+        index._service_data = dict(self._service_data)
+        index._next_row = self._next_row
+
+        changed = [s for s, service_data in data.items() if self._service_data.get(s) is not service_data]
+        removed = [s for s in self._service_data if s not in data]
+        for service in removed + changed:
+            index._remove_service(service)
+        for service in changed:
+            index._add_service(service, data[service])
+        index.version = data_version(data)
+        return index
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        hits = self._queries.get_or_create(query.strip(), lambda: self._search(query))
+        return hits if limit is None else hits[:limit]
+
+    def _search(self, query: str) -> List[SearchHit]:
+        rows: Optional[Set[int]] = None
+        filters = []
+        for term in query.split():
+            field, _, value = term.rpartition(':')
+            if field == 'is' or field == 'type':
+                filters.append((field, value.lower()))
+                continue
+            if field and field not in FIELDS:
+                field, value = '', term
+            matched = self._match(field, value.lower())
+            rows = matched if rows is None else rows & matched
+            if not rows:
+                return []
+
+        if rows is None:
+            rows = set(self._rows)
+        hits = [self._rows[row] for row in rows]
+        for field, value in filters:
+            hits = self._filter(hits, field, value)
+        return sorted(hits, key=lambda hit: (hit.service, hit.name))
+
+    def _match(self, field: str, value: str) -> Set[int]:
+        fields = [field] if field else list(FIELDS)
+        rows: Set[int] = set()
+        for name in fields:
+            index = self._fields[name]
+            if value.startswith('~'):
+                rows |= index.fuzzy(value[1:])
+            elif '*' not in value:
+                rows |= index.exact(value)
+            elif value.endswith('*') and value.count('*') == 1:
+                rows |= index.prefix(value[:-1])
+            else:
+                rows |= index.wildcard(value)
+        if field == 'name' and '*' in value:
+            # Wildcards on the name field apply to the whole operation name.
+            regex = _wildcard_regex(value)
+            rows = {row for row in rows if regex.fullmatch(self._rows[row].name.lower())}
+        return rows
+
+    def _filter(self, hits: List[SearchHit], field: str, value: str) -> List[SearchHit]:
+        if field == 'type':
+            return [hit for hit in hits if hit.type.startswith(value)]
+        if value == 'supported':
+            return [hit for hit in hits if hit.supported]
+        if value == 'unsupported':
+            return [hit for hit in hits if not hit.supported]
+        if value == 'unsupported-everywhere':
+            return [
+                hit for hit in hits
+                if not any(self._rows[row].supported for row in self._name_rows[hit.name])
+            ]
+        raise ValueError(f"Unknown filter {field}:{value}")
+
+    def _add_service(self, service: str, service_data: Dict[str, Any]) -> None:
+        rows = []
+        for hit, tokens in _service_entries(service, service_data):
+            row = self._next_row
+            self._next_row += 1
+            self._rows[row] = hit
+            for field, token in tokens:
+                self._fields[field].add(token, row)
+            self._row_tokens[row] = tokens
+            self._name_rows.setdefault(hit.name, set()).add(row)
+            rows.append(row)
+        self._service_rows[service] = rows
+        self._service_data[service] = service_data
+
+    def _remove_service(self, service: str) -> None:
+        for row in self._service_rows.pop(service, []):
+            for field, token in self._row_tokens.pop(row):
+                self._fields[field].remove(token, row)
+            name = self._rows.pop(row).name
+            self._name_rows[name].discard(row)
+            if not self._name_rows[name]:
+                del self._name_rows[name]
+        self._service_data.pop(service, None)
+
+
+@lru_cache(maxsize=256)
+def _wildcard_regex(pattern: str) -> "re.Pattern[str]":
+    return re.compile("^" + "[^\n]*".join(re.escape(part) for part in pattern.split("*")) + "$", re.MULTILINE)
+
+
+def _service_entries(service: str, service_data: Dict[str, Any]) -> List[Tuple[SearchHit, List[Tuple[str, str]]]]:
+    """Hits and (field, token) pairs of one service's operations."""
+    entries = []
+    for op in service_data['operations']:
+        hit = SearchHit(service, op['name'], op['type'], op['file'], op['line'], bool(op['file']) and op['line'] > 0)
+        tokens = [('name', token) for token in name_tokens(op['name'])]
+        tokens.append(('name', op['name'].lower()))
+        tokens.append(('service', service.lower()))
+        if op['file']:
+            path = op['file'].lower()
+            tokens.extend(('file', token) for token in _PATH_TOKEN.findall(path))
+            tokens.append(('file', path.rsplit('/', 1)[-1]))
+            tokens.append(('file', path))
+        entries.append((hit, list(dict.fromkeys(tokens))))
+    return entries
+
+
+def build_search_index(data: Dict[str, Any]) -> SearchIndex:
+    return SearchIndex().derive(data)
+
+
+_index_cache = LRUCache(maxsize=4, name="search_index")
+
+
+def get_search_index(data: Dict[str, Any]) -> SearchIndex:
+    """Return the search index for ``data``, building it only once per data version.
+
+    Each version gets its own index, so sessions on different datasets never
+    query each other's. A new version is derived from the cached index that
+    shares the most services with it, so a reload reindexes only the files
+    that changed.
+    """
+    return _index_cache.get_or_create(data_version(data), lambda: _derive_index(data))
+
+
+def _derive_index(data: Dict[str, Any]) -> SearchIndex:
+    shared, base = max(((index.shared_services(data), index) for index in _index_cache.values()),
+                       key=lambda candidate: candidate[0], default=(0, None))
+    # Copying an index that shares little with ``data`` costs more than building from scratch.
+    if base is None or shared * 2 < len(data):
+        return build_search_index(data)
+    return base.derive(data)
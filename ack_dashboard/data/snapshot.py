@@ -0,0 +1,164 @@
+"""Compact binary snapshot of a results directory.
+
+Layout: ``MAGIC``, a little-endian uint32 header length, a JSON header and then
+the raw column arrays, each aligned to 8 bytes::
+
+    header = {
+        "files":   [{"name", "mtime_ns", "size", "digest", "service_name", <counts>, "start", "stop"}],
+        "strings": [...],   # interned operation names and file paths
+        "types":   [...],   # operation type table
+        "arrays":  {column: [offset, count, dtype]},
+    }
+
+Operations of the ``i``-th file are rows ``start:stop`` of the ``name``,
+``type``, ``file`` and ``line`` columns; strings are indices into the tables.
+The JSON files stay the source of truth: a snapshot is only used when every
+file's (name, mtime, size) still matches what was recorded in it.
+"""
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .files import atomic_write
+from .records import Operation
+
+MAGIC = b"ACKSNAP\x01"
+SNAPSHOT_NAME = ".ack-snapshot"
+
+COUNT_FIELDS = [
+    'total_operations',
+    'supported_operations',
+    'control_plane_operations',
+    'supported_control_plane_operations',
+]
+COLUMNS = [('name', '<i4'), ('type', '<u1'), ('file', '<i4'), ('line', '<i4')]
+
+# (file name, (mtime_ns, size), service name, service data, content digest or None)
+SnapshotFile = Tuple[str, Tuple[int, int], str, Dict[str, Any], Optional[str]]
+
+
+def snapshot_path(results_dir: Path) -> Path:
+    return Path(results_dir) / SNAPSHOT_NAME
+
+
+def write_snapshot(path: Path, files: List[SnapshotFile]) -> None:
+    strings: Dict[str, int] = {}
+    types: Dict[str, int] = {}
+    columns: Dict[str, List[int]] = {name: [] for name, _ in COLUMNS}
+    file_headers = []
+
+    for name, (mtime_ns, size), service_name, service_data, digest in files:
+        start = len(columns['name'])
+        for op in service_data['operations']:
+            columns['name'].append(strings.setdefault(op['name'], len(strings)))
+            columns['type'].append(types.setdefault(op['type'], len(types)))
+            columns['file'].append(strings.setdefault(op['file'], len(strings)))
+            columns['line'].append(op['line'])
+        file_header = {'name': name, 'mtime_ns': mtime_ns, 'size': size, 'digest': digest,
+                       'service_name': service_name}
+        file_header.update({field: service_data[field] for field in COUNT_FIELDS})
+        file_header.update({'start': start, 'stop': len(columns['name'])})
+        file_headers.append(file_header)
+
+    blobs = [np.asarray(columns[name], dtype=dtype).tobytes() for name, dtype in COLUMNS]
+    arrays, offset = {}, 0
+    for (name, dtype), blob in zip(COLUMNS, blobs):
+        arrays[name] = [offset, len(columns[name]), dtype]
+        offset += _aligned(len(blob))
+
+    header = json.dumps({
+        'files': file_headers,
+        'strings': list(strings),
+        'types': list(types),
+        'arrays': arrays,
+    }, separators=(',', ':')).encode()
+    prefix = MAGIC + struct.pack('<I', len(header)) + header
+    prefix += b"\0" * (_aligned(len(prefix)) - len(prefix))
+
+    # Write to a temporary file and rename, so readers never see a partial snapshot.
+    with atomic_write(path) as f:
+        f.write(prefix)
+        for blob in blobs:
+            f.write(blob)
+            f.write(b"\0" * (_aligned(len(blob)) - len(blob)))
+
+
+def read_snapshot(path: Path, signatures: Optional[Dict[str, Tuple[int, int]]] = None) -> Optional[List[SnapshotFile]]:
+    """Return the snapshot's files if it matches ``signatures`` (file name -> (mtime_ns, size)), else ``None``.
+
+    With ``signatures=None`` the snapshot is read as-is, e.g. to compare against an archived release.
+    """
+    try:
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    with buffer:
+        if buffer[:len(MAGIC)] != MAGIC:
+            return None
+        try:
+            (header_length,) = struct.unpack_from('<I', buffer, len(MAGIC))
+            header_start = len(MAGIC) + 4
+            header = json.loads(buffer[header_start:header_start + header_length])
+
+            recorded = {f['name']: (f['mtime_ns'], f['size']) for f in header['files']}
+            if signatures is not None and recorded != signatures:
+                return None
+
+            base = _aligned(header_start + header_length)
+            columns = {}
+            for name, (offset, count, dtype) in header['arrays'].items():
+                columns[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=base + offset).tolist()
+        except (ValueError, KeyError, struct.error):
+            return None  # Truncated or corrupt snapshot; callers fall back to the JSON files
+
+    strings, types = header['strings'], header['types']
+    files = []
+    for f in header['files']:
+        rows = slice(f['start'], f['stop'])
+        operations = tuple(
+            Operation(strings[name], types[type_], strings[file], line)
+            for name, type_, file, line in zip(columns['name'][rows], columns['type'][rows],
+                                               columns['file'][rows], columns['line'][rows])
+        )
+        service_data = {'service_name': f['service_name']}
+        service_data.update({field: f[field] for field in COUNT_FIELDS})
+        service_data['operations'] = operations
+        files.append((f['name'], (f['mtime_ns'], f['size']), f['service_name'], service_data, f.get('digest')))
+    return files
+
+
+def _aligned(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .store import DataStore
+
+    argv = sys.argv[1:] if argv is None else argv
+    results_dir = Path(argv[0] if argv else "results")
+    store = DataStore(results_dir, use_snapshot=False)
+    data = store.load()
+    for json_file, e in store.errors:
+        print(f"Error loading {json_file}: {e}", file=sys.stderr)
+    if store.errors:
+        return 1
+
+    path = snapshot_path(results_dir)
+    try:
+        store.write_snapshot(path)
+    except OSError as e:
+        print(f"Cannot write {path}: {e}", file=sys.stderr)
+        return 1
+    print(f"Wrote {path} ({len(data)} services, {path.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from . import snapshot
+from .cache import LRUCache
+from .ingest import IngestOptions, LoadError, parse_results_files, resolve_options
+
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) of a results file; a change in either invalidates its cache entry.
+FileSignature = Tuple[int, int]
+
+
+class ResultsData(dict):
+    """Service name -> service results, tagged with the data version it was assembled from.
+
+    Instances are shared across all sessions and must be treated as read-only;
+    each service's ``operations`` is a tuple of ``records.Operation``.
+    """
+
+    version: str = ""
+
+
+class SharedService(dict):
+    """A parsed results file, shared by every store that holds a byte-identical copy of it."""
+
+
+# Content digest -> parsed file; an entry lives as long as some store still holds it.
+_shared_services: "weakref.WeakValueDictionary[str, SharedService]" = weakref.WeakValueDictionary()
+_shared_lock = threading.Lock()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0
+
+
+@dataclass(frozen=True)
+class ReloadStatus:
+    """Outcome of the background watcher's most recent checks."""
+
+    checked_at: Optional[float] = None
+    reloaded_at: Optional[float] = None
+    reload_ms: Optional[float] = None
+    reloads: int = 0
+    version: str = ""
+    error: Optional[str] = None
+
+
+@dataclass
+class _Entry:
+    signature: FileSignature
+    service_name: Optional[str] = None
+    service_data: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+    digest: Optional[str] = None
+
+
+class DataStore:
+    """Process-wide cache of a results directory, keyed on each file's (path, mtime, size).
+
+    Only files whose signature changed since the previous load are reparsed; when
+    nothing changed, ``load()`` returns the very same ``ResultsData`` object.
+
+    With ``use_snapshot``, a cold store first tries the compiled snapshot in the
+    results directory and rewrites it whenever the JSON files have moved on.
+    Changed files are parsed according to ``ingest_options`` (worker count,
+    executor, streaming). ``snapshot_version`` is the data version the snapshot
+    on disk is known to hold, so ``snapshot_version == load().version`` means
+    the next cold start can skip JSON parsing. ``snapshot_error`` is set when
+    the snapshot cannot be written (say, a read-only results directory); the
+    store then keeps serving from the JSON files.
+
+    ``watch()`` moves reloading off the request path: a background thread
+    polls the directory, reparses changed files and swaps in the new
+    ``ResultsData``, while readers keep using ``current()`` without blocking.
+    Loads are serialized by ``_load_lock``, which is held while scanning and
+    parsing; the result is published as one ``(data, errors)`` pair under the
+    short ``_state_lock``, so readers never wait on a reload nor see new data
+    with the previous version's errors.
+    A file that fails to parse keeps serving its last good contents, so a
+    half-written file never makes a service disappear.
+
+    Parsed files are shared between stores by content digest: a file that is
+    byte-identical to one already loaded by another store (say, an unchanged
+    service in a fork's results) is hashed but not parsed, and both stores hold
+    the same object. ``stats.shared`` counts those files.
+    """
+
+    def __init__(self, results_dir: Union[str, Path], use_snapshot: bool = True,
+                 ingest_options: Optional[IngestOptions] = None):
+        self.results_dir = Path(results_dir)
+        self.use_snapshot = use_snapshot
+        self.ingest_options = ingest_options or IngestOptions()
+        self.stats = CacheStats()
+        self._load_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._watch_lock = threading.Lock()
+        self._entries: Dict[Path, _Entry] = {}
+        self._state: Tuple[Optional[ResultsData], List[LoadError]] = (None, [])
+        self.snapshot_version: Optional[str] = None
+        self.snapshot_error: Optional[str] = None
+        self.reload_status = ReloadStatus()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        self._closed = False
+
+    @property
+    def errors(self) -> List[LoadError]:
+        return self._state[1]
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def current(self) -> Optional[ResultsData]:
+        """The most recently loaded data, without checking the directory."""
+        return self._state[0]
+
+    def current_with_errors(self) -> Tuple[Optional[ResultsData], List[LoadError]]:
+        """The most recently loaded data and the file errors of that same load."""
+        with self._state_lock:
+            return self._state
+
+    def load(self) -> ResultsData:
+        return self.load_with_errors()[0]
+
+    def load_with_errors(self) -> Tuple[ResultsData, List[LoadError]]:
+        """Bring the store up to date with the directory; returns the data and its file errors."""
+        with self._load_lock:
+            data, errors = self._state
+            signatures = self._scan()
+            from_snapshot = not self._entries and self.use_snapshot and self._read_snapshot(signatures)
+            changed = signatures.keys() != self._entries.keys()
+
+            stale = []
+            for path, signature in signatures.items():
+                entry = self._entries.get(path)
+                if entry is not None and entry.signature == signature:
+                    self.stats.hits += 1
+                else:
+                    stale.append(path)
+            self.stats.misses += len(stale)
+
+            if stale:
+                self._load_files(stale, signatures)
+                changed = True
+
+            for path in self._entries.keys() - signatures.keys():
+                del self._entries[path]
+
+            if changed or data is None:
+                errors = [
+                    LoadError(path, entry.error) for path, entry in sorted(self._entries.items())
+                    if entry.error is not None
+                ]
+                data = self._assemble()
+                with self._state_lock:
+                    self._state = (data, errors)
+            if from_snapshot:
+                self.snapshot_version = data.version
+            if self.use_snapshot and stale and not errors:
+                try:
+                    self._write_snapshot(snapshot.snapshot_path(self.results_dir))
+                except OSError as e:
+                    if self.snapshot_error is None:
+                        logger.warning("Cannot write the snapshot of %s, serving from the JSON files: %s",
+                                       self.results_dir, e)
+                    self.snapshot_error = str(e)
+            return data, errors
+
+    def refresh(self) -> ResultsData:
+        """``load()``, recording how long it took and whether a new version was swapped in."""
+        previous = self.current()
+        start = time.perf_counter()
+        try:
+            data = self.load()
+        except Exception as e:
+            logger.exception("Reloading %s failed", self.results_dir)
+            self.reload_status = replace(self.reload_status, checked_at=time.time(), error=str(e))
+            raise
+        status = replace(self.reload_status, checked_at=time.time(), version=data.version, error=None)
+        if previous is not None and data is not previous:
+            status = replace(status, reloaded_at=status.checked_at, reloads=status.reloads + 1,
+                             reload_ms=(time.perf_counter() - start) * 1000)
+            logger.info("Reloaded %s as version %s in %.1f ms (%d file errors)",
+                        self.results_dir, data.version, status.reload_ms, len(self.errors))
+        self.reload_status = status
+        return data
+
+    def watch(self, interval: float = 2.0) -> None:
+        """Start polling the directory every ``interval`` seconds on a daemon thread."""
+        if self.watching:
+            return  # The common case on every rerun: no lock, never waits on a reload
+        with self._watch_lock:
+            if self.watching or self._closed:
+                return
+            self._stop_watching.clear()
+            self._watcher = threading.Thread(
+                target=self._watch, args=(interval,), name=f"results-watcher:{self.results_dir}", daemon=True
+            )
+            self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop_watching.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                pass  # Logged and recorded in reload_status; keep serving the previous version
+
+    def close(self) -> None:
+        """Stop watching and drop the loaded data; called when the store is evicted from ``get_store``."""
+        self._closed = True
+        self.stop_watching()
+        self.clear()
+
+    def write_snapshot(self, path: Path) -> None:
+        with self._load_lock:
+            self._write_snapshot(path)
+
+    def clear(self) -> None:
+        with self._load_lock:
+            self._entries.clear()
+            with self._state_lock:
+                self._state = (None, [])
+            self.snapshot_version = None
+            self.snapshot_error = None
+            self.stats = CacheStats()
+
+    def _scan(self) -> Dict[Path, FileSignature]:
+        return {json_file: _signature(json_file) for json_file in sorted(self.results_dir.glob("*.json"))}
+
+    def _load_files(self, paths: List[Path], signatures: Dict[Path, FileSignature]) -> None:
+        to_parse, digests = [], {}
+        for path in paths:
+            try:
+                digest = _file_digest(path)
+            except OSError:
+                to_parse.append(path)  # Reported by the parser below
+                continue
+            with _shared_lock:
+                shared = _shared_services.get(digest)
+            if shared is None:
+                digests[path] = digest
+                to_parse.append(path)
+            else:
+                self._entries[path] = _Entry(signatures[path], _service_name(path, shared), shared, digest=digest)
+                self.stats.shared += 1
+
+        parsed, errors = parse_results_files(to_parse, self.ingest_options, compact=True)
+        for path, service_data in parsed.items():
+            digest = digests.get(path)
+            # Only share what was parsed from the bytes that were hashed.
+            if digest is not None and _signature(path) == signatures[path]:
+                service_data = _share(digest, service_data)
+            else:
+                digest = None
+            self._entries[path] = _Entry(signatures[path], _service_name(path, service_data), service_data,
+                                         digest=digest)
+        for path, error in errors:
+            previous = self._entries.get(path) or _Entry(signatures[path])
+            self._entries[path] = _Entry(signatures[path], previous.service_name, previous.service_data, error,
+                                         previous.digest)
+
+    def _read_snapshot(self, signatures: Dict[Path, FileSignature]) -> bool:
+        paths = {path.name: path for path in signatures}
+        files = snapshot.read_snapshot(
+            snapshot.snapshot_path(self.results_dir),
+            {path.name: signature for path, signature in signatures.items()},
+        )
+        for name, signature, service_name, service_data, digest in files or []:
+            if digest is not None:
+                service_data = _share(digest, service_data)
+            self._entries[paths[name]] = _Entry(signature, service_name, service_data, digest=digest)
+        return files is not None
+
+    def _write_snapshot(self, path: Path) -> None:
+        files = [
+            (p.name, entry.signature, entry.service_name, entry.service_data, entry.digest)
+            for p, entry in sorted(self._entries.items())
+        ]
+        snapshot.write_snapshot(path, files)
+        data = self.current()
+        if path == snapshot.snapshot_path(self.results_dir):
+            self.snapshot_error = None
+            if data is not None:
+                self.snapshot_version = data.version
+
+    def _assemble(self) -> ResultsData:
+        data = ResultsData()
+        entries = sorted(self._entries.items())
+        for path, entry in entries:
+            if entry.service_data is not None:
+                data[entry.service_name] = entry.service_data
+        data.version = _version(self.results_dir, [(path.name, entry.signature) for path, entry in entries])
+        return data
+
+
+def _signature(path: Path) -> FileSignature:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _service_name(path: Path, service_data: Dict[str, Any]) -> str:
+    return service_data.get('service_name', path.stem.replace('-operations', ''))
+
+
+def _share(digest: str, service_data: Dict[str, Any]) -> SharedService:
+    with _shared_lock:
+        shared = _shared_services.get(digest)
+        if shared is None:
+            shared = _shared_services[digest] = SharedService(service_data)
+        return shared
+
+
+def _version(source: Path, files: List[Tuple[str, FileSignature]]) -> str:
+    digest = hashlib.sha1(f"{source}|".encode())
+    for name, (mtime_ns, size) in files:
+        digest.update(f"{name}:{mtime_ns}:{size};".encode())
+    return digest.hexdigest()[:12]
+
+
+_stores: "OrderedDict[Path, DataStore]" = OrderedDict()
+_stores_lock = threading.Lock()
+
+
+def max_stores() -> int:
+    """How many results directories stay loaded at once (``ACK_DASHBOARD_MAX_DATASETS``, default 4)."""
+    return max(1, int(os.environ.get("ACK_DASHBOARD_MAX_DATASETS", "4")))
+
+
+def get_store(results_dir: Union[str, Path] = "results") -> DataStore:
+    """Return the process-wide store for ``results_dir``, shared by every session.
+
+    Stores are kept in LRU order. Opening one more than ``max_stores()`` closes
+    the least recently used store; if that directory is asked for again, it is
+    reloaded from its snapshot or from files shared with the resident stores.
+    """
+    key = Path(results_dir).resolve()
+    evicted = []
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            use_snapshot = os.environ.get("ACK_DASHBOARD_SNAPSHOT", "1") != "0"
+            store = _stores[key] = DataStore(key, use_snapshot=use_snapshot, ingest_options=resolve_options())
+            limit = max_stores()
+            while len(_stores) > limit:
+                evicted.append(_stores.popitem(last=False)[1])
+        else:
+            _stores.move_to_end(key)
+    for old in evicted:
+        logger.info("Closing results store %s (more than %d loaded)", old.results_dir, limit)
+        old.close()
+    return store
+
+
+def resident_stores() -> List[DataStore]:
+    """Open stores, least recently used first."""
+    with _stores_lock:
+        return list(_stores.values())
+
+
+# Stores of baseline directories, kept apart from ``_stores`` so that loading
+# a baseline never evicts (and closes) a dataset that sessions are viewing.
+_baseline_stores = LRUCache(maxsize=2, name="baseline_stores")
+
+
+def load_dataset(path: Union[str, Path]) -> Tuple[ResultsData, List[LoadError]]:
+    """Load a results directory or a compiled snapshot file as a read-only baseline.
+
+    Directories get their own store, without a snapshot (nothing is written
+    into them) or watcher; files byte-identical to a loaded dataset's are
+    still shared rather than parsed again.
+    """
+    path = Path(path)
+    if path.is_dir():
+        store = _baseline_stores.get_or_create(
+            path.resolve(), lambda: DataStore(path.resolve(), use_snapshot=False, ingest_options=resolve_options())
+        )
+        return store.load_with_errors()
+
+    files = snapshot.read_snapshot(path)
+    if files is None:
+        data = ResultsData()
+        data.version = _version(path.resolve(), [])
+        return data, [LoadError(path, ValueError("Not a results directory or snapshot file"))]
+    data = ResultsData((service_name, service_data) for _, _, service_name, service_data, _ in files)
+    data.version = _version(path.resolve(), [(name, signature) for name, signature, _, _, _ in files])
+    return data, []
+
+
+def data_version(data: Dict[str, Any]) -> str:
+    """Version tag of a loaded dataset, used to key every derived cache.
+
+    Only the ``ResultsData`` of a ``DataStore`` or ``load_dataset`` carries
+    one. Anything else raises ``TypeError`` rather than being hashed on every
+    call: a plain dict has no version, and digesting its contents each time
+    would cost more than the caches keyed on it save.
+    """
+    version = getattr(data, 'version', '')
+    if not version:
+        raise TypeError(f"Expected ResultsData from a DataStore or load_dataset(), got {type(data).__name__}")
+    return version
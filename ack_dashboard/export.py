@@ -0,0 +1,342 @@
+"""Static export of the dashboard: ``python -m ack_dashboard.export [--output site]``.
+
+Precomputes the Overall Coverage and Control Plane Overview views, plus one
+page per service (its analysis and control plane sections), into plain
+HTML and JSON files that any static file server or CDN can serve:
+
+- ``index.html``, ``control-plane.html``, ``services/<service>.html``
+- ``data/summary.json``: per-service counts; ``data/services/<service>.json``: operations
+- ``data/index.js``: service list and data version, shared by every page
+- ``assets/``: stylesheet, script and Plotly bundle
+
+Each page embeds its data, and service filters, operation filters and
+sorting run in the browser, so serving it takes no Python at all.
+
+Re-export is incremental. ``manifest.json`` records a digest of every
+service's exported JSON, and only the pages of services whose JSON changed
+are rendered and rewritten. Pages of removed services are deleted.
+"""
+import argparse
+import hashlib
+import html
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .calculations.metrics import calculate_overall_metrics, create_service_dataframe
+from .data.files import write_atomic
+from .data.store import get_store
+
+
+EXPORT_FORMAT = 1
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+ASSETS = ["dashboard.css", "dashboard.js"]
+PLOTLY_ASSET = "plotly.min.js"
+MANIFEST = "manifest.json"
+
+
+@dataclass
+class ExportReport:
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    full: bool = False
+    elapsed_s: float = 0.0
+
+
+def service_payload(service: str, service_data: Dict[str, Any]) -> Dict[str, Any]:
+    payload = {key: value for key, value in service_data.items() if key != 'operations'}
+    payload['service_name'] = service
+    payload['operations'] = [
+        {'name': op['name'], 'type': op['type'], 'file': op['file'], 'line': op['line']}
+        for op in service_data['operations']
+    ]
+    return payload
+
+
+def summary_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'services': [
+            {
+                'service': service,
+                'total': service_data['total_operations'],
+                'supported': service_data['supported_operations'],
+                'control_plane': service_data['control_plane_operations'],
+                'supported_control_plane': service_data['supported_control_plane_operations'],
+            }
+            for service, service_data in data.items()
+        ]
+    }
+
+
+def export_site(data: Dict[str, Any], output: Path, full: bool = False) -> ExportReport:
+    """Write the static site for ``data`` into ``output``, rewriting only what changed since the last export."""
+    start = time.perf_counter()
+    report = ExportReport()
+    output.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(output / MANIFEST)
+
+    assets_digest = _digest(b"".join((STATIC_DIR / name).read_bytes() for name in ASSETS)
+                            + str(EXPORT_FORMAT).encode())
+    report.full = full or manifest.get('assets') != assets_digest
+    if report.full or not (output / "assets" / PLOTLY_ASSET).exists():
+        _write_assets(output / "assets")
+
+    previous: Dict[str, str] = {} if report.full else manifest.get('services', {})
+    digests: Dict[str, str] = {}
+    for service, service_data in data.items():
+        body = _json_bytes(service_payload(service, service_data))
+        digests[service] = _digest(body)
+        page = output / "services" / f"{service}.html"
+        if previous.get(service) == digests[service] and page.exists():
+            report.unchanged.append(service)
+            continue
+        _write(output / "data" / "services" / f"{service}.json", body)
+        _write(page, render_service_page(service, service_data, body).encode())
+        report.written.append(service)
+
+    for service in sorted(manifest.get('services', {}).keys() - data.keys()):
+        for path in (output / "services" / f"{service}.html", output / "data" / "services" / f"{service}.json"):
+            path.unlink(missing_ok=True)
+        report.removed.append(service)
+
+    summary = _json_bytes(summary_payload(data))
+    if report.full or report.written or report.removed or manifest.get('summary') != _digest(summary):
+        _write(output / "data" / "summary.json", summary)
+        _write(output / "index.html", render_overview_page(data, summary, control_plane=False).encode())
+        _write(output / "control-plane.html", render_overview_page(data, summary, control_plane=True).encode())
+
+    # The export time is left out of the digest, so an unchanged export leaves index.js alone.
+    index = {'services': list(data.keys()), 'data_version': getattr(data, 'version', '')}
+    index_digest = _digest(_json_bytes(index))
+    if report.full or manifest.get('index') != index_digest or not (output / "data" / "index.js").exists():
+        index['exported_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
+        _write(output / "data" / "index.js", f"window.ACK_INDEX = {json.dumps(index)};\n".encode())
+    _write(output / MANIFEST, _json_bytes({
+        'format': EXPORT_FORMAT,
+        'assets': assets_digest,
+        'data_version': index['data_version'],
+        'index': index_digest,
+        'summary': _digest(summary),
+        'services': digests,
+    }))
+    report.elapsed_s = time.perf_counter() - start
+    return report
+
+
+def render_overview_page(data: Dict[str, Any], summary: bytes, control_plane: bool) -> str:
+    from .ui.figures import support_pie, top_services_bar
+
+    metrics = calculate_overall_metrics(data)
+    service_df = create_service_dataframe(data)
+    if control_plane:
+        coverage_column = 'Control Plane Coverage %'
+        service_df = service_df[service_df['Control Plane Operations'] > 0]
+        service_df = service_df.sort_values(coverage_column, ascending=False, kind='stable')
+        supported, total = metrics['total_supported_control_plane'], metrics['total_control_plane']
+        pie = support_pie(supported, total, "Control Plane Coverage", donut=True, title_x=0.5, height=400)
+        bar = top_services_bar(service_df, coverage_column, "Top 10 Services by Control Plane Coverage")
+        title, heading = "Control Plane Overview", "⚙️ Control Plane Overview"
+        cards = [
+            ("Services with Control Plane", f"{len(service_df)}"),
+            ("Total Control Plane Ops", f"{total:,}"),
+            ("Supported Control Plane", f"{supported:,}"),
+            ("Mean Coverage", f"{metrics['control_plane_coverage']:.1f}%"),
+        ]
+    else:
+        supported, total = metrics['total_supported'], metrics['total_operations']
+        pie = support_pie(supported, total, "Overall API Coverage", donut=True, title_x=0.5, height=400)
+        bar = top_services_bar(service_df, 'Coverage %', "Top 10 Services by Coverage")
+        title, heading = "Overall Coverage", "📈 Overall API Coverage"
+        cards = [
+            ("Total Services", f"{metrics['num_services']}"),
+            ("Total Operations", f"{total:,}"),
+            ("Supported Operations", f"{supported:,}"),
+            ("Mean Coverage",
+             f"{metrics['overall_coverage']:.1f}% | CP: {metrics['control_plane_coverage']:.1f}%"),
+        ]
+
+    card_ids = ["metric-services", "metric-total", "metric-supported", "metric-coverage"]
+    body = f"""
+<h1>{heading}</h1>
+<details>
+  <summary>🔧 Filter Services</summary>
+  <button id="select-all" type="button">Select All</button>
+  <button id="clear-all" type="button">Clear All</button>
+  <div id="service-filter"></div>
+</details>
+<p class="info" id="selection-info"></p>
+<div class="metrics">
+{"".join(_card(card_id, label, value) for card_id, (label, value) in zip(card_ids, cards))}
+</div>
+<div class="charts">
+  <div class="chart" id="figure-pie"></div>
+  <div class="chart" id="figure-bar"></div>
+</div>
+<h2>📋 {"Control Plane Services" if control_plane else "Services"} Overview</h2>
+<div class="table-wrap" id="services-table"></div>
+{_json_script("ack-summary", summary)}
+{_json_script("ack-figures", _json_bytes({'pie': _figure(pie), 'bar': _figure(bar)}))}
+"""
+    return _page(title, "control-plane" if control_plane else "overall", "", body)
+
+
+def render_service_page(service: str, service_data: Dict[str, Any], payload: bytes) -> str:
+    from .ui.figures import operation_types_pie, support_pie
+
+    total, supported = service_data['total_operations'], service_data['supported_operations']
+    control_plane = service_data['control_plane_operations']
+    supported_control_plane = service_data['supported_control_plane_operations']
+    coverage = supported / total * 100 if total > 0 else 0
+    cp_coverage = supported_control_plane / control_plane * 100 if control_plane > 0 else 0
+    figures = {
+        'types': _figure(operation_types_pie(service, service_data)),
+        'support': _figure(support_pie(supported, total, f"{service.upper()} - Support Status")),
+        'control_plane': _figure(support_pie(supported_control_plane, control_plane,
+                                             f"{service.upper()} - Control Plane Support")),
+    }
+    types = sorted({op['type'].replace('_', ' ').title() for op in service_data['operations']})
+    type_filters = "".join(
+        f'<label><input type="checkbox" name="type" value="{html.escape(t)}" checked> {html.escape(t)}</label>'
+        for t in types
+    )
+
+    body = f"""
+<h1>🔍 {html.escape(service.upper())}</h1>
+<div class="metrics">
+{_card("", "Total Operations", f"{total:,}")}
+{_card("", "Supported", f"{supported:,}")}
+{_card("", "Coverage", f"{coverage:.1f}%")}
+{_card("", "CP Coverage", f"{cp_coverage:.1f}% ({supported_control_plane} of {control_plane})")}
+</div>
+<div class="charts">
+  <div class="chart" id="figure-types"></div>
+  <div class="chart" id="figure-support"></div>
+</div>
+<h2>🔧 Control Plane</h2>
+<div class="charts">
+  <div class="chart" id="figure-control_plane"></div>
+  <div></div>
+</div>
+<h2>📝 Operations Details</h2>
+<div id="operation-filters">
+  <span>Type: {type_filters}</span>
+  <span>Supported:
+    <label><input type="checkbox" name="supported" value="Yes" checked> Yes</label>
+    <label><input type="checkbox" name="supported" value="No" checked> No</label>
+  </span>
+  <input id="operation-query" type="search" placeholder="Filter operations">
+</div>
+<div class="table-wrap" id="operations-table"></div>
+{_json_script("ack-service", payload)}
+{_json_script("ack-figures", _json_bytes(figures))}
+"""
+    return _page(f"{service.upper()} coverage", "service", "../", body)
+
+
+def _page(title: str, page: str, root: str, body: str) -> str:
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)} · AWS ACK API Coverage</title>
+<link rel="stylesheet" href="{root}assets/dashboard.css">
+<script src="{root}assets/{PLOTLY_ASSET}" defer></script>
+<script src="{root}data/index.js" defer></script>
+<script src="{root}assets/dashboard.js" defer></script>
+</head>
+<body data-page="{page}" data-root="{root}">
+<header>
+  <a class="title" href="{root}index.html">🚀 AWS ACK API Coverage</a>
+  <a href="{root}index.html">Overall Coverage</a>
+  <a href="{root}control-plane.html">Control Plane Overview</a>
+  <select id="service-nav" aria-label="Service"></select>
+</header>
+<main>
+{body}
+<footer id="data-version"></footer>
+</main>
+</body>
+</html>
+"""
+
+
+def _card(card_id: str, label: str, value: str) -> str:
+    id_attr = f' id="{card_id}"' if card_id else ""
+    return (f'<div class="metric-card"><div class="label">{html.escape(label)}</div>'
+            f'<div class="value"{id_attr}>{html.escape(value)}</div></div>')
+
+
+def _figure(fig) -> Any:
+    return json.loads(fig.to_json())
+
+
+def _json_script(element_id: str, body: bytes) -> str:
+    # "</" would end the script element early.
+    text = body.decode().replace("</", "<\\/")
+    return f'<script type="application/json" id="{element_id}">{text}</script>'
+
+
+def _json_bytes(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def _digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _read_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get('format') == EXPORT_FORMAT else {}
+
+
+def _write_assets(assets: Path) -> None:
+    from plotly.offline import get_plotlyjs
+
+    for name in ASSETS:
+        _write(assets / name, (STATIC_DIR / name).read_bytes())
+    _write(assets / PLOTLY_ASSET, get_plotlyjs().encode())
+
+
+def _write(path: Path, body: bytes) -> None:
+    # Atomic, so a server never sees a partial page.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, body)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ack_dashboard.export",
+                                     description="Export the dashboard as static HTML and JSON.")
+    parser.add_argument("--results", default="results", help="results directory (default: %(default)s)")
+    parser.add_argument("--output", "-o", default="site", help="output directory (default: %(default)s)")
+    parser.add_argument("--full", action="store_true", help="rewrite every page, ignoring the previous export")
+    args = parser.parse_args(argv)
+
+    results_dir = Path(args.results)
+    if not results_dir.is_dir():
+        print(f"Results directory not found: {results_dir}", file=sys.stderr)
+        return 2
+
+    store = get_store(results_dir)
+    data = store.load()
+    for json_file, e in store.errors:
+        print(f"Error loading {json_file}: {e}", file=sys.stderr)
+    if store.errors or not data:
+        return 2
+
+    report = export_site(data, Path(args.output), full=args.full)
+    print(f"Exported {len(data)} services to {args.output} in {report.elapsed_s:.2f}s: "
+          f"{len(report.written)} page(s) written, {len(report.unchanged)} unchanged, {len(report.removed)} removed"
+          f"{' (full export)' if report.full else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
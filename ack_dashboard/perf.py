@@ -0,0 +1,234 @@
+"""Per-rerun performance instrumentation.
+
+A ``RerunProfiler`` times the phases of one Streamlit rerun (load, metrics,
+each view, figure builds, ...), optionally with tracemalloc allocation
+deltas, and records the cache hit/miss counts accumulated during the rerun.
+Finished reruns are:
+
+- logged as one JSON line on the ``ack_dashboard.perf`` logger (printed to
+  stderr with ``ACK_DASHBOARD_PERF_LOG=1``)
+- kept in a rolling window whose p50/p95 summary is written to
+  ``metrics_path()``, which ``health_check.py`` serves under ``/metrics``
+
+Code that runs inside a rerun marks phases with ``phase(name)`` or the
+``instrumented`` decorator; both are no-ops outside a profiled rerun. Counters
+are process-wide, so reruns of concurrent sessions can see each other's
+cache traffic and allocations.
+"""
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from .data.cache import cache_stats
+from .data.files import write_atomic
+
+
+logger = logging.getLogger(__name__)
+if os.environ.get("ACK_DASHBOARD_PERF_LOG") == "1" and not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+WINDOW = 500
+WRITE_INTERVAL = 1.0
+
+_local = threading.local()
+_tracing_lock = threading.Lock()
+_tracing_reruns = 0
+
+
+def metrics_path() -> Path:
+    return Path(os.environ.get("ACK_DASHBOARD_METRICS_FILE",
+                               os.path.join(tempfile.gettempdir(), "ack-dashboard-metrics.json")))
+
+
+class RerunProfiler:
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self._start = time.perf_counter()
+        self._caches = cache_stats()
+        if trace_memory:
+            _start_tracing()
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        _local.profiler = self
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        memory = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self.phases.setdefault(name, {'ms': 0.0, 'calls': 0})
+            timing['ms'] += (time.perf_counter() - start) * 1000
+            timing['calls'] += 1
+            if self.trace_memory:
+                timing['alloc_kb'] = timing.get('alloc_kb', 0.0) + (tracemalloc.get_traced_memory()[0] - memory) / 1024
+
+    def finish(self, **fields: Any) -> Dict[str, Any]:
+        """End the rerun: log it, add it to the rolling window and return the record."""
+        if getattr(_local, 'profiler', None) is self:
+            del _local.profiler
+        record: Dict[str, Any] = {'event': 'rerun', **fields}
+        record['total_ms'] = (time.perf_counter() - self._start) * 1000
+        record['phases'] = self.phases
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            record['alloc_kb'] = (current - self._memory_start) / 1024
+            record['peak_kb'] = (peak - self._memory_start) / 1024
+            _stop_tracing()
+        record['caches'] = _cache_deltas(self._caches, cache_stats())
+
+        logger.info(json.dumps(record, default=float))
+        _recorder.record(record)
+        return record
+
+
+def _start_tracing() -> None:
+    # tracemalloc slows down every allocation, so it only runs while a profiled rerun asks for it.
+    global _tracing_reruns
+    with _tracing_lock:
+        if _tracing_reruns == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing_reruns += 1
+
+
+def _stop_tracing() -> None:
+    global _tracing_reruns
+    with _tracing_lock:
+        _tracing_reruns -= 1
+        if _tracing_reruns == 0:
+            tracemalloc.stop()
+
+
+def _cache_deltas(before: Dict[str, Dict[str, Any]], after: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    deltas = {}
+    for name, stats in after.items():
+        previous = before.get(name, {})
+        deltas[name] = {
+            'hits': stats['hits'] - previous.get('hits', 0),
+            'misses': stats['misses'] - previous.get('misses', 0),
+        }
+    return deltas
+
+
+def current_profiler() -> Optional[RerunProfiler]:
+    return getattr(_local, 'profiler', None)
+
+
+def phase(name: str):
+    """Time ``name`` in the current rerun's profile, if there is one."""
+    profiler = current_profiler()
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+
+def instrumented(func: Callable) -> Callable:
+    """Record every call of ``func`` as the phase ``view.<name>``."""
+    name = f"view.{func.__name__.removeprefix('show_')}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with phase(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class PerfRecorder:
+    """Rolling window of the last ``window`` reruns, summarized as p50/p95 per phase."""
+
+    def __init__(self, window: int = WINDOW, path: Optional[Path] = None):
+        self.path = path
+        self._reruns: Deque[Dict[str, Any]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._written = 0.0
+
+    def record(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._reruns.append(record)
+            now = time.monotonic()
+            if now - self._written < WRITE_INTERVAL:
+                return
+            self._written = now
+            summary = self._summary()
+        self._write(summary)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._summary()
+
+    def _summary(self) -> Dict[str, Any]:
+        samples: Dict[str, List[float]] = {'total': [r['total_ms'] for r in self._reruns]}
+        for r in self._reruns:
+            for name, timing in r['phases'].items():
+                samples.setdefault(name, []).append(timing['ms'])
+        return {
+            'updated_at': time.time(),
+            'reruns': len(self._reruns),
+            'phases': {
+                name: {'count': len(values), 'p50_ms': percentile(values, 0.5), 'p95_ms': percentile(values, 0.95)}
+                for name, values in samples.items()
+            },
+            'caches': cache_stats(),
+        }
+
+    def _write(self, summary: Dict[str, Any]) -> None:
+        path = self.path or metrics_path()
+        try:
+            write_atomic(path, json.dumps(summary).encode())
+        except OSError:
+            logger.debug("Could not write %s", path, exc_info=True)
+
+
+_recorder = PerfRecorder()
+
+
+def get_recorder() -> PerfRecorder:
+    return _recorder
+
+
+def read_summary(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads((path or metrics_path()).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def render_prometheus(summary: Dict[str, Any]) -> str:
+    """Prometheus text exposition of a ``PerfRecorder`` summary."""
+    lines = [
+        "# HELP ack_dashboard_reruns Reruns in the rolling window.",
+        "# TYPE ack_dashboard_reruns gauge",
+        f"ack_dashboard_reruns {summary['reruns']}",
+        "# HELP ack_dashboard_phase_seconds Rerun phase wall time over the rolling window.",
+        "# TYPE ack_dashboard_phase_seconds summary",
+    ]
+    for name, phase_summary in summary['phases'].items():
+        for quantile, key in (("0.5", 'p50_ms'), ("0.95", 'p95_ms')):
+            lines.append(f'ack_dashboard_phase_seconds{{phase="{name}",quantile="{quantile}"}} '
+                         f'{phase_summary[key] / 1000:.6f}')
+        lines.append(f'ack_dashboard_phase_seconds_count{{phase="{name}"}} {phase_summary["count"]}')
+    for metric in ('hits', 'misses', 'evictions', 'size'):
+        lines.append(f"# TYPE ack_dashboard_cache_{metric} {'gauge' if metric == 'size' else 'counter'}")
+        for name, stats in summary['caches'].items():
+            lines.append(f'ack_dashboard_cache_{metric}{{cache="{name}"}} {stats[metric]}')
+    lines.append(f"ack_dashboard_metrics_updated_timestamp_seconds {summary['updated_at']:.3f}")
+    return "\n".join(lines) + "\n"
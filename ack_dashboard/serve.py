@@ -0,0 +1,121 @@
+"""Streamlit server that loads the results before the first session: ``python -m ack_dashboard.serve [streamlit options]``.
+
+Runs ``streamlit run main.py`` in this process, plus a background thread that
+loads the configured datasets into their shared stores, starts their
+watchers, and then publishes the load state of every resident store to
+``status_path()`` every ``PUBLISH_INTERVAL`` seconds. ``health_check.py``
+derives ``/readyz`` and ``/stats`` from that file, so they describe what the
+serving process actually holds rather than a second copy of the data.
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .data.files import write_atomic
+from .data.loader import configured_datasets, watch_interval
+from .data.store import DataStore, get_store, max_stores, resident_stores
+
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_INTERVAL = 2.0
+MAIN_SCRIPT = Path(__file__).resolve().parent.parent / "main.py"
+
+
+def status_path() -> Path:
+    return Path(os.environ.get("ACK_DASHBOARD_STATUS_FILE",
+                               os.path.join(tempfile.gettempdir(), "ack-dashboard-status.json")))
+
+
+def store_status(store: DataStore, cold_load_ms: Optional[float] = None) -> Dict[str, Any]:
+    data, errors = store.current_with_errors()
+    reload_status = store.reload_status
+    return {
+        'path': str(store.results_dir),
+        'loaded': data is not None,
+        'data_version': data.version if data is not None else None,
+        'services': len(data) if data is not None else 0,
+        'load_errors': len(errors),
+        # A snapshot that cannot be written never gets warm; the store serves from the JSON files instead.
+        'snapshot_warm': data is not None and (not store.use_snapshot or store.snapshot_error is not None
+                                               or store.snapshot_version == data.version),
+        'snapshot_error': store.snapshot_error,
+        'watching': store.watching,
+        'cold_load_ms': cold_load_ms,
+        'reload_ms': reload_status.reload_ms,
+        'reloads': reload_status.reloads,
+        'checked_at': reload_status.checked_at,
+        'reload_error': reload_status.error,
+    }
+
+
+def write_status(status: Dict[str, Any], path: Optional[Path] = None) -> None:
+    path = path or status_path()
+    try:
+        write_atomic(path, json.dumps(status).encode())
+    except OSError:
+        logger.warning("Could not write %s", path, exc_info=True)
+
+
+def read_status(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads((path or status_path()).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def preload_and_publish(datasets: List[Path], stop: threading.Event, interval: float = PUBLISH_INTERVAL) -> None:
+    """Load ``datasets`` (the first is the default one), then publish their state until ``stop`` is set."""
+    started_at = time.time()
+    primary = str(datasets[0].resolve()) if datasets else None
+    cold_load_ms: Dict[str, float] = {}
+
+    def publish() -> None:
+        write_status({
+            'pid': os.getpid(),
+            'started_at': started_at,
+            'updated_at': time.time(),
+            'primary': primary,
+            'datasets': [store_status(store, cold_load_ms.get(str(store.results_dir))) for store in resident_stores()],
+        })
+
+    for results_dir in datasets:
+        if not results_dir.is_dir():
+            logger.error("Results directory not found: %s", results_dir)
+            continue
+        store = get_store(results_dir)
+        start = time.perf_counter()
+        try:
+            store.load()  # File errors are kept in the store's state and published below
+        except Exception:
+            logger.exception("Loading %s failed", results_dir)
+        cold_load_ms[str(store.results_dir)] = round((time.perf_counter() - start) * 1000, 2)
+        if watch_interval() > 0:
+            store.watch(watch_interval())
+        publish()
+
+    publish()
+    while not stop.wait(interval):
+        publish()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from streamlit.web import cli
+
+    # Only as many datasets as stay resident; preloading more would just evict the default one.
+    datasets = list(configured_datasets().values())[:max_stores()]
+    threading.Thread(
+        target=preload_and_publish, args=(datasets, threading.Event()), name="results-preload", daemon=True
+    ).start()
+    sys.argv = ["streamlit", "run", str(MAIN_SCRIPT), *(sys.argv[1:] if argv is None else argv)]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+// Client side of the static export (python -m ack_dashboard.export): filtering,
+// sorting and chart updates run in the browser against data embedded in the page.
+(function () {
+  "use strict";
+
+  function pageData(id) {
+    var element = document.getElementById(id);
+    return element ? JSON.parse(element.textContent) : null;
+  }
+
+  function percent(numerator, denominator) {
+    return denominator > 0 ? numerator * 100 / denominator : 0;
+  }
+
+  function mean(values) {
+    return values.length ? values.reduce(function (a, b) { return a + b; }, 0) / values.length : 0;
+  }
+
+  function formatNumber(value) {
+    return value.toLocaleString("en-US");
+  }
+
+  function escapeHtml(value) {
+    return String(value).replace(/[&<>"']/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c];
+    });
+  }
+
+  // Same aggregation as MetricsEngine: sums, plus the mean of per-service coverage
+  // over services that have operations of that kind.
+  function overallMetrics(services) {
+    var sum = function (field) {
+      return services.reduce(function (total, s) { return total + s[field]; }, 0);
+    };
+    return {
+      num_services: services.length,
+      total_operations: sum("total"),
+      total_supported: sum("supported"),
+      total_control_plane: sum("control_plane"),
+      total_supported_control_plane: sum("supported_control_plane"),
+      overall_coverage: mean(services.filter(function (s) { return s.total > 0; })
+        .map(function (s) { return percent(s.supported, s.total); })),
+      control_plane_coverage: mean(services.filter(function (s) { return s.control_plane > 0; })
+        .map(function (s) { return percent(s.supported_control_plane, s.control_plane); }))
+    };
+  }
+
+  function serviceRows(services) {
+    var rows = services.map(function (s) {
+      return {
+        "Service": s.service.toUpperCase(),
+        "service": s.service,
+        "Total Operations": s.total,
+        "Supported Operations": s.supported,
+        "Coverage %": Math.round(percent(s.supported, s.total) * 10) / 10,
+        "Control Plane Operations": s.control_plane,
+        "Supported Control Plane": s.supported_control_plane,
+        "Control Plane Coverage %": Math.round(percent(s.supported_control_plane, s.control_plane) * 10) / 10
+      };
+    });
+    return rows.sort(function (a, b) { return b["Coverage %"] - a["Coverage %"]; });
+  }
+
+  // Sortable table: clicking a header sorts by that column, clicking again reverses.
+  function Table(element, columns, options) {
+    this.element = element;
+    this.columns = columns;
+    this.link = (options || {}).link;
+    this.rows = [];
+    this.sortBy = null;
+    this.descending = false;
+  }
+
+  Table.prototype.render = function (rows) {
+    var self = this;
+    if (rows) {
+      this.rows = rows.slice();
+    }
+    var sorted = this.rows.slice();
+    if (this.sortBy !== null) {
+      var key = this.sortBy;
+      sorted.sort(function (a, b) {
+        var x = a[key], y = b[key];
+        var order = typeof x === "number" && typeof y === "number" ? x - y : String(x).localeCompare(String(y));
+        return self.descending ? -order : order;
+      });
+    }
+    var head = this.columns.map(function (column) {
+      var arrow = column === self.sortBy ? (self.descending ? " ▼" : " ▲") : "";
+      return "<th data-column=\"" + escapeHtml(column) + "\">" + escapeHtml(column) + arrow + "</th>";
+    }).join("");
+    var body = sorted.map(function (row) {
+      return "<tr>" + self.columns.map(function (column, i) {
+        var value = escapeHtml(row[column]);
+        if (i === 0 && self.link) {
+          value = "<a href=\"" + escapeHtml(self.link(row)) + "\">" + value + "</a>";
+        }
+        return "<td>" + value + "</td>";
+      }).join("") + "</tr>";
+    }).join("");
+    this.element.innerHTML = "<table><thead><tr>" + head + "</tr></thead><tbody>" + body + "</tbody></table>" +
+      "<p class=\"caption\">" + formatNumber(sorted.length) + " row(s)</p>";
+    Array.prototype.forEach.call(this.element.querySelectorAll("th"), function (th) {
+      th.addEventListener("click", function () {
+        var column = th.getAttribute("data-column");
+        self.descending = self.sortBy === column ? !self.descending : false;
+        self.sortBy = column;
+        self.render();
+      });
+    });
+  };
+
+  function renderFigure(id, figure) {
+    var element = document.getElementById(id);
+    if (element && window.Plotly) {
+      window.Plotly.react(element, figure.data, figure.layout, { responsive: true });
+    }
+  }
+
+  function setText(id, value) {
+    var element = document.getElementById(id);
+    if (element) {
+      element.textContent = value;
+    }
+  }
+
+  // Overall Coverage and Control Plane Overview: a service filter recomputes
+  // the metric cards, both charts and the services table.
+  function overviewPage(root, controlPlane) {
+    var summary = pageData("ack-summary");
+    var figures = pageData("ack-figures");
+    var checkboxes = document.getElementById("service-filter");
+    var table = new Table(document.getElementById("services-table"), controlPlane
+      ? ["Service", "Control Plane Operations", "Supported Control Plane", "Control Plane Coverage %"]
+      : ["Service", "Total Operations", "Supported Operations", "Coverage %"],
+      { link: function (row) { return root + "services/" + row.service + ".html"; } });
+
+    checkboxes.innerHTML = summary.services.map(function (s) {
+      return "<label><input type=\"checkbox\" value=\"" + escapeHtml(s.service) + "\" checked> " +
+        escapeHtml(s.service.toUpperCase()) + "</label>";
+    }).join("");
+
+    function update() {
+      var selected = {};
+      Array.prototype.forEach.call(checkboxes.querySelectorAll("input"), function (input) {
+        selected[input.value] = input.checked;
+      });
+      var services = summary.services.filter(function (s) { return selected[s.service]; });
+      if (controlPlane) {
+        services = services.filter(function (s) { return s.control_plane > 0; });
+      }
+      var metrics = overallMetrics(services);
+      var rows = serviceRows(services);
+      setText("selection-info", "Showing data for " + services.length + " of " + summary.services.length + " services");
+
+      var coverageColumn = controlPlane ? "Control Plane Coverage %" : "Coverage %";
+      var supported = controlPlane ? metrics.total_supported_control_plane : metrics.total_supported;
+      var total = controlPlane ? metrics.total_control_plane : metrics.total_operations;
+      setText("metric-services", formatNumber(metrics.num_services));
+      setText("metric-total", formatNumber(total));
+      setText("metric-supported", formatNumber(supported));
+      setText("metric-coverage", controlPlane
+        ? metrics.control_plane_coverage.toFixed(1) + "%"
+        : metrics.overall_coverage.toFixed(1) + "% | CP: " + metrics.control_plane_coverage.toFixed(1) + "%");
+
+      figures.pie.data[0].values = [supported, total - supported];
+      renderFigure("figure-pie", figures.pie);
+      var top = rows.slice().sort(function (a, b) { return b[coverageColumn] - a[coverageColumn]; }).slice(0, 10);
+      var bar = figures.bar.data[0];
+      bar.x = top.map(function (row) { return row[coverageColumn]; });
+      bar.y = top.map(function (row) { return row["Service"]; });
+      bar.marker.color = bar.x;
+      renderFigure("figure-bar", figures.bar);
+      table.render(rows);
+    }
+
+    checkboxes.addEventListener("change", update);
+    document.getElementById("select-all").addEventListener("click", function () {
+      Array.prototype.forEach.call(checkboxes.querySelectorAll("input"), function (input) { input.checked = true; });
+      update();
+    });
+    document.getElementById("clear-all").addEventListener("click", function () {
+      Array.prototype.forEach.call(checkboxes.querySelectorAll("input"), function (input) { input.checked = false; });
+      update();
+    });
+    update();
+  }
+
+  // Per-service page: operation type, support status and name filters over the embedded operations.
+  function servicePage() {
+    var service = pageData("ack-service");
+    var figures = pageData("ack-figures");
+    Object.keys(figures).forEach(function (name) { renderFigure("figure-" + name, figures[name]); });
+
+    var table = new Table(document.getElementById("operations-table"), ["Operation", "Type", "Supported", "File", "Line"]);
+    var rows = service.operations.map(function (op) {
+      var supported = Boolean(op.file) && op.line > 0;
+      return {
+        "Operation": op.name,
+        "Type": op.type.replace("_", " ").replace(/\b\w/g, function (c) { return c.toUpperCase(); }),
+        "Supported": supported ? "Yes" : "No",
+        "File": op.file || "N/A",
+        "Line": op.line > 0 ? op.line : "N/A"
+      };
+    });
+    var filters = document.getElementById("operation-filters");
+
+    function update() {
+      var types = {}, support = {};
+      Array.prototype.forEach.call(filters.querySelectorAll("input[name=type]"), function (input) {
+        types[input.value] = input.checked;
+      });
+      Array.prototype.forEach.call(filters.querySelectorAll("input[name=supported]"), function (input) {
+        support[input.value] = input.checked;
+      });
+      var query = document.getElementById("operation-query").value.trim().toLowerCase();
+      table.render(rows.filter(function (row) {
+        return types[row.Type] && support[row.Supported] &&
+          (!query || row.Operation.toLowerCase().indexOf(query) !== -1);
+      }));
+    }
+
+    filters.addEventListener("change", update);
+    document.getElementById("operation-query").addEventListener("input", update);
+    update();
+  }
+
+  function navigation(root) {
+    var select = document.getElementById("service-nav");
+    if (!select || !window.ACK_INDEX) {
+      return;
+    }
+    select.innerHTML = "<option value=\"\">Go to service…</option>" + window.ACK_INDEX.services.map(function (s) {
+      return "<option value=\"" + escapeHtml(s) + "\">" + escapeHtml(s.toUpperCase()) + "</option>";
+    }).join("");
+    select.addEventListener("change", function () {
+      if (select.value) {
+        window.location.href = root + "services/" + select.value + ".html";
+      }
+    });
+    setText("data-version", "Data version " + window.ACK_INDEX.data_version + " · exported " + window.ACK_INDEX.exported_at);
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    var page = document.body.getAttribute("data-page");
+    var root = document.body.getAttribute("data-root");
+    navigation(root);
+    if (page === "overall") {
+      overviewPage(root, false);
+    } else if (page === "control-plane") {
+      overviewPage(root, true);
+    } else if (page === "service") {
+      servicePage();
+    }
+  });
+})();
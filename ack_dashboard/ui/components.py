@@ -1,37 +1,105 @@
+import os
+import time
 import streamlit as st
-from typing import List
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from ..data.index import OperationsIndex
+    from pathlib import Path
+    from ..data.store import ReloadStatus
+
+
+SELECTION_KEY = "service_selection"
+PAGE_SIZES = [50, 100, 250, 500]
+TRACE_MEMORY_KEY = "perf_trace_memory"
+DATASET_KEY = "dataset"
+
+
+@dataclass(frozen=True)
+class ServiceSelection:
+    """Selected services as one bitmask over ``services``: bit ``i`` selects ``services[i]``."""
+
+    services: Tuple[str, ...]
+    mask: int
+    generation: int = 0
+
+    @classmethod
+    def all(cls, services: Sequence[str]) -> "ServiceSelection":
+        return cls(tuple(services), (1 << len(services)) - 1)
+
+    def names(self) -> List[str]:
+        return [service for i, service in enumerate(self.services) if self.mask >> i & 1]
+
+    def is_selected(self, i: int) -> bool:
+        return bool(self.mask >> i & 1)
+
+    def rebase(self, services: Sequence[str]) -> "ServiceSelection":
+        """Carry the selection over to a new service list, e.g. after the results changed."""
+        services = tuple(services)
+        if services == self.services:
+            return self
+        selected = set(self.names())
+        mask = sum(1 << i for i, service in enumerate(services) if service in selected)
+        return ServiceSelection(services, mask, self.generation + 1)
+
+    def with_mask(self, mask: int) -> "ServiceSelection":
+        return ServiceSelection(self.services, mask, self.generation + 1)
+
+
+def get_service_selection(all_services: Sequence[str]) -> ServiceSelection:
+    selection: Optional[ServiceSelection] = st.session_state.get(SELECTION_KEY)
+    selection = ServiceSelection.all(all_services) if selection is None else selection.rebase(all_services)
+    st.session_state[SELECTION_KEY] = selection
+    return selection
+
+
+def get_selected_services(all_services: Sequence[str]) -> List[str]:
+    return get_service_selection(all_services).names()
 
 
 def render_service_selector(all_services: List[str], key_prefix: str) -> List[str]:
-    for service in all_services:
-        checkbox_key = f"service_checkbox_{service}"
-        if checkbox_key not in st.session_state:
-            st.session_state[checkbox_key] = service in st.session_state.selected_services
-    
-    col1, col2, col3 = st.columns([1, 1, 4])
-    with col1:
-        if st.button("Select All", key=f"select_all_{key_prefix}"):
-            for service in all_services:
-                st.session_state[f"service_checkbox_{service}"] = True
-            st.rerun()
-    with col2:
-        if st.button("Clear All", key=f"clear_all_{key_prefix}"):
-            for service in all_services:
-                st.session_state[f"service_checkbox_{service}"] = False
-            st.rerun()
-    
-    # Services checkboxes in grid layout
-    cols = st.columns(4)
-    selected_services = []
-    
-    for i, service in enumerate(all_services):
-        col_idx = i % 4
-        with cols[col_idx]:
-            checkbox_key = f"service_checkbox_{service}"
-            if st.checkbox(service.upper(), key=checkbox_key):
-                selected_services.append(service)
-    
-    return selected_services
+    # Checkboxes live in a form, so toggling them does not rerun the script;
+    # the selection is applied in one batch when a submit button is pressed.
+    selection = get_service_selection(all_services)
+
+    with st.form(f"service_selector_{key_prefix}", border=False):
+        col1, col2, col3 = st.columns([1, 1, 4])
+        with col1:
+            select_all = st.form_submit_button("Select All")
+        with col2:
+            clear_all = st.form_submit_button("Clear All")
+        with col3:
+            apply = st.form_submit_button("Apply", type="primary")
+
+        if select_all:
+            selection = selection.with_mask((1 << len(selection.services)) - 1)
+        elif clear_all:
+            selection = selection.with_mask(0)
+        elif apply:
+            mask = 0
+            for i, service in enumerate(selection.services):
+                if st.session_state.get(_checkbox_key(key_prefix, selection, service), selection.is_selected(i)):
+                    mask |= 1 << i
+            selection = selection.with_mask(mask)
+        st.session_state[SELECTION_KEY] = selection
+
+        # Services checkboxes in grid layout. Keys carry the selection generation,
+        # so applying a new selection starts fresh widgets from the stored mask.
+        cols = st.columns(4)
+        for i, service in enumerate(selection.services):
+            with cols[i % 4]:
+                st.checkbox(
+                    service.upper(),
+                    value=selection.is_selected(i),
+                    key=_checkbox_key(key_prefix, selection, service)
+                )
+
+    return selection.names()
+
+
+def _checkbox_key(key_prefix: str, selection: ServiceSelection, service: str) -> str:
+    return f"service_checkbox_{key_prefix}_{selection.generation}_{service}"
 
 
 def render_selection_info(selected_count: int, total_count: int) -> None:
@@ -40,4 +108,104 @@ def render_selection_info(selected_count: int, total_count: int) -> None:
 
 
 def render_no_data_message(message: str = "No data available") -> None:
-    st.info(message)
\ No newline at end of file
+    st.info(message)
+
+
+def render_operations_table(index: "OperationsIndex", key_prefix: str, services: Optional[Sequence[str]] = None,
+                            types: Optional[Sequence[str]] = None, supported: Optional[Sequence[str]] = None,
+                            columns: Optional[List[str]] = None, height: int = 400) -> None:
+    # Filtering, sorting and paging run against the operations index on the
+    # server; only the visible page is serialized to the browser.
+    columns = columns or list(index.display.columns)
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col1:
+        sort_by = st.selectbox("Sort by:", options=columns, key=f"{key_prefix}_sort_by")
+    with col2:
+        descending = st.selectbox(
+            "Order:", options=[False, True], format_func=lambda x: "Descending" if x else "Ascending",
+            key=f"{key_prefix}_descending"
+        )
+    with col3:
+        page_size = st.selectbox("Rows per page:", options=PAGE_SIZES, index=1, key=f"{key_prefix}_page_size")
+
+    rows = index.query(services, types, supported, sort_by, descending)
+    pages = max(1, -(-len(rows) // page_size))
+    with col4:
+        # Keyed on the query, so changing a filter or the sort starts again at page 1.
+        query_key = hash((tuple(services or ()), tuple(types or ()), tuple(supported or ()), sort_by, descending, page_size))
+        page = st.number_input("Page:", min_value=1, max_value=pages, value=1, key=f"{key_prefix}_page_{query_key}")
+
+    if len(rows) == 0:
+        render_no_data_message("No operations match the selected filters.")
+        return
+    st.dataframe(index.page(rows, page - 1, page_size, columns), use_container_width=True, height=height)
+    start = (page - 1) * page_size
+    st.caption(f"Rows {start + 1:,}–{min(start + page_size, len(rows)):,} of {len(rows):,} · page {page} of {pages}")
+
+
+def debug_enabled() -> bool:
+    """The performance panel is opt-in: ``ACK_DASHBOARD_DEBUG=1`` or ``?debug=1`` in the URL."""
+    return os.environ.get("ACK_DASHBOARD_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+
+def trace_memory_requested() -> bool:
+    return st.session_state.get(TRACE_MEMORY_KEY, False)
+
+
+def render_perf_panel(record: Dict[str, Any], summary: Dict[str, Any]) -> None:
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        # Read at the start of the next rerun, so toggling it applies from then on.
+        st.checkbox("Trace allocations (tracemalloc)", key=TRACE_MEMORY_KEY)
+        caption = f"This rerun: **{record['total_ms']:.1f} ms**"
+        if 'peak_kb' in record:
+            caption += f", peak {record['peak_kb']:,.0f} KB allocated"
+        st.markdown(caption)
+
+        rolling = summary['phases']
+        st.dataframe(
+            [
+                {
+                    'Phase': name,
+                    'ms': round(timing['ms'], 2),
+                    'Calls': timing['calls'],
+                    'Alloc KB': round(timing['alloc_kb'], 1) if 'alloc_kb' in timing else None,
+                    'p50 ms': round(rolling[name]['p50_ms'], 2) if name in rolling else None,
+                    'p95 ms': round(rolling[name]['p95_ms'], 2) if name in rolling else None
+                }
+                for name, timing in record['phases'].items()
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+        st.dataframe(
+            [
+                {'Cache': name, 'Hits': counts['hits'], 'Misses': counts['misses']}
+                for name, counts in record['caches'].items() if counts['hits'] or counts['misses']
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+        st.caption(f"p50/p95 over the last {summary['reruns']} reruns of this process")
+
+
+def select_dataset(datasets: Dict[str, "Path"]) -> "Path":
+    """Sidebar switch between the configured results directories; hidden when there is only one."""
+    names = list(datasets)
+    if len(names) == 1:
+        return datasets[names[0]]
+    default = st.query_params.get("dataset")
+    name = st.sidebar.selectbox(
+        "Dataset",
+        options=names,
+        index=names.index(default) if default in names else 0,
+        key=DATASET_KEY
+    )
+    return datasets[name]
+
+
+def render_reload_status(status: "ReloadStatus") -> None:
+    if status.error:
+        st.sidebar.warning(f"Reloading results failed: {status.error}")
+    elif status.reloads:
+        updated = time.strftime("%H:%M:%S", time.localtime(status.reloaded_at))
+        st.sidebar.caption(f"🔄 Results updated at {updated} ({status.reload_ms:.0f} ms reload)")
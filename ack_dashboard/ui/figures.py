@@ -0,0 +1,218 @@
+import functools
+from typing import TYPE_CHECKING, Dict, Any, Callable, Hashable, Iterable, Optional
+
+import numpy as np
+
+from ..data.cache import LRUCache
+from ..data.store import data_version
+from ..perf import phase
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
+
+SUPPORT_COLORS = ['#2ecc71', '#e74c3c']
+PLANE_COLORS = ['#3498db', '#9b59b6']
+
+# ``st.plotly_chart`` only takes a figure (or a dict it re-validates into one) and
+# always runs ``plotly.io.to_json`` on it, so a JSON string cannot be passed
+# through. Figures are cached as their ``to_dict()`` taken once instead,
+# which leaves just the JSON encoding on the rerun path.
+_figure_cache = LRUCache(maxsize=256, name="figures")
+
+_READ_ONLY = "Cached figures are shared by every session and cannot be modified"
+
+
+def selection_key(selected_services: Optional[Iterable[str]]) -> Hashable:
+    return None if selected_services is None else frozenset(selected_services)
+
+
+def cached_figure(view: str, key: Hashable, data: Dict[str, Any], build: Callable[[], "go.Figure"]) -> "go.Figure":
+    """Return the figure for (view, key, data version), building it only on a miss.
+
+    Cached figures are shared by every session; changing one raises ``TypeError``.
+    """
+    return _figure_cache.get_or_create((view, key, data_version(data)), lambda: _timed_build(build))
+
+
+def _timed_build(build: Callable[[], "go.Figure"]) -> "go.Figure":
+    with phase("figure.build"):
+        return prebuilt(build())
+
+
+def prebuilt(fig: "go.Figure") -> "go.Figure":
+    """A read-only stand-in for ``fig`` whose ``to_dict()`` returns a frozen copy of ``fig``'s, taken once.
+
+    Serializing it no longer deep-copies every trace. ``fig`` itself is left as is.
+    """
+    return _prebuilt_figure_class()(_freeze(fig.to_dict()))
+
+
+@functools.lru_cache(maxsize=None)
+def _prebuilt_figure_class() -> type:
+    import plotly.graph_objects as go
+
+    class PrebuiltFigure(go.Figure):
+        # An empty figure holding the spec: every change to a figure goes
+        # through one of the methods below, and all of them raise.
+        def __init__(self, spec: Dict[str, Any]):
+            super().__init__()
+            self._prebuilt_spec = spec
+
+        def to_dict(self) -> Dict[str, Any]:
+            return self._prebuilt_spec
+
+        def __setattr__(self, prop: str, value: Any) -> None:
+            if prop in ('data', 'layout', 'frames'):
+                raise TypeError(_READ_ONLY)
+            super().__setattr__(prop, value)
+
+        def add_traces(self, *args: Any, **kwargs: Any) -> None:
+            raise TypeError(_READ_ONLY)
+
+        def _relayout_child(self, *args: Any, **kwargs: Any) -> None:
+            raise TypeError(_READ_ONLY)
+
+        def _restyle_child(self, *args: Any, **kwargs: Any) -> None:
+            raise TypeError(_READ_ONLY)
+
+    return PrebuiltFigure
+
+
+class _FrozenDict(dict):
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(_READ_ONLY)
+
+    __setitem__ = __delitem__ = __ior__ = clear = popitem = setdefault = update = _read_only
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        # ``plotly.io.to_json`` pops every trace's "uid"; popping a missing key changes nothing.
+        if key in self or not default:
+            self._read_only()
+        return default[0]
+
+
+class _FrozenList(list):
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(_READ_ONLY)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
+
+
+def figure_cache_stats() -> Dict[str, Any]:
+    return _figure_cache.stats()
+
+
+# Plotly is imported inside each builder so it is only loaded once a view draws a chart.
+def support_pie(supported: int, total: int, title: str, donut: bool = False, **layout: Any) -> "go.Figure":
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(
+        labels=['Supported', 'Not Supported'],
+        values=[supported, total - supported],
+        hole=0.4 if donut else None,
+        marker_colors=SUPPORT_COLORS
+    )])
+    fig.update_layout(title=title, **layout)
+    return fig
+
+
+def operation_types_pie(service: str, service_data: Dict[str, Any]) -> "go.Figure":
+    import plotly.graph_objects as go
+
+    control_plane_ops = service_data['control_plane_operations']
+    data_plane_ops = service_data['total_operations'] - control_plane_ops
+
+    fig = go.Figure(data=[go.Pie(
+        labels=['Control Plane', 'Data Plane'],
+        values=[control_plane_ops, data_plane_ops],
+        marker_colors=PLANE_COLORS
+    )])
+    fig.update_layout(title=f"{service.upper()} - Operation Types")
+    return fig
+
+
+def top_services_bar(service_df: "pd.DataFrame", coverage_column: str, title: str) -> "go.Figure":
+    import plotly.express as px
+
+    fig = px.bar(
+        service_df.head(10),
+        x=coverage_column,
+        y='Service',
+        orientation='h',
+        title=title,
+        color=coverage_column,
+        color_continuous_scale='RdYlGn'
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def coverage_trend_line(trend_df: "pd.DataFrame", coverage_column: str, title: str) -> "go.Figure":
+    import plotly.express as px
+
+    fig = px.line(
+        trend_df,
+        x='Snapshot',
+        y=coverage_column,
+        color='Service',
+        markers=True,
+        title=title
+    )
+    fig.update_layout(height=450, yaxis_range=[0, 100])
+    return fig
+
+
+def top_files_bar(files_df: "pd.DataFrame", title: str) -> "go.Figure":
+    import plotly.express as px
+
+    fig = px.bar(
+        files_df.head(15),
+        x='Operations',
+        y='File',
+        orientation='h',
+        title=title,
+        color='Services',
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(height=450, yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+
+def coverage_heatmap(coverage_df: "pd.DataFrame", counts: Dict[str, Any], title: str) -> "go.Figure":
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=go.Heatmap(
+        z=coverage_df.to_numpy(),
+        x=[service.upper() for service in coverage_df.columns],
+        y=list(coverage_df.index),
+        customdata=np.dstack([counts['supported'], counts['total']]),
+        zmin=0,
+        zmax=100,
+        colorscale='RdYlGn',
+        colorbar={'title': 'Coverage %'},
+        xgap=1,
+        ygap=1,
+        hovertemplate="%{y} · %{x}<br>%{z}% (%{customdata[0]} of %{customdata[1]})<extra></extra>"
+    ))
+    fig.update_layout(
+        title=title,
+        height=max(400, 28 * len(coverage_df.index) + 160),
+        yaxis={'autorange': 'reversed'},
+        xaxis={'tickangle': -45}
+    )
+    return fig
@@ -1,13 +1,51 @@
+import time
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from ..data.history import get_history
+from ..data.index import get_operations_index
+from ..data.loader import configured_baselines
+from ..data.search import get_search_index
+from ..data.store import load_dataset
+from ..calculations.diff import (
+    diff_datasets,
+    ADDED,
+    REMOVED,
+    NEWLY_SUPPORTED,
+    NEWLY_UNSUPPORTED,
+    TYPE_CHANGED,
+    MOVED
+)
+from ..calculations.hotspots import get_hotspot_report
+from ..calculations.matrix import get_coverage_matrix
 from ..calculations.metrics import calculate_overall_metrics, create_service_dataframe
-from .components import render_service_selector, render_selection_info, render_no_data_message
+from ..perf import instrumented, phase
+from .components import (
+    render_service_selector,
+    render_selection_info,
+    render_no_data_message,
+    render_operations_table
+)
+from .figures import (
+    cached_figure,
+    selection_key,
+    support_pie,
+    operation_types_pie,
+    top_services_bar,
+    coverage_trend_line,
+    top_files_bar,
+    coverage_heatmap
+)
 
 
+def _plotly_chart(fig, **kwargs):
+    # Timed separately: serializing the figure to the browser is often the slow part of a view.
+    with phase("figure.render"):
+        return st.plotly_chart(fig, use_container_width=True, **kwargs)
+
+
+@instrumented
 def show_overall_coverage(data: Dict[str, Any], metrics: Dict[str, Any], service_df: pd.DataFrame) -> None:
     st.header("📈 Overall API Coverage")
     
@@ -15,7 +53,6 @@ def show_overall_coverage(data: Dict[str, Any], metrics: Dict[str, Any], service
         all_services = list(data.keys())
         selected_services = render_service_selector(all_services, "overall")
     
-    st.session_state.selected_services = selected_services
     metrics = calculate_overall_metrics(data, selected_services)
     service_df = create_service_dataframe(data, selected_services)
     
@@ -52,34 +89,20 @@ def show_overall_coverage(data: Dict[str, Any], metrics: Dict[str, Any], service
     
     col1, col2 = st.columns(2)
     
+    selection = selection_key(selected_services)
     with col1:
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=['Supported', 'Not Supported'],
-            values=[metrics['total_supported'], metrics['total_operations'] - metrics['total_supported']],
-            hole=0.4,
-            marker_colors=['#2ecc71', '#e74c3c']
-        )])
-        fig_pie.update_layout(
-            title="Overall API Coverage",
-            title_x=0.5,
-            height=400
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        fig_pie = cached_figure("overall_pie", selection, data, lambda: support_pie(
+            metrics['total_supported'], metrics['total_operations'], "Overall API Coverage",
+            donut=True, title_x=0.5, height=400
+        ))
+        _plotly_chart(fig_pie)
     
     with col2:
         if not service_df.empty:
-            top_services = service_df.head(10)
-            fig_bar = px.bar(
-                top_services,
-                x='Coverage %',
-                y='Service',
-                orientation='h',
-                title="Top 10 Services by Coverage",
-                color='Coverage %',
-                color_continuous_scale='RdYlGn'
-            )
-            fig_bar.update_layout(height=400)
-            st.plotly_chart(fig_bar, use_container_width=True)
+            fig_bar = cached_figure("overall_bar", selection, data, lambda: top_services_bar(
+                service_df, 'Coverage %', "Top 10 Services by Coverage"
+            ))
+            _plotly_chart(fig_bar)
         else:
             render_no_data_message("No services selected for chart display.")
     
@@ -92,15 +115,38 @@ def show_overall_coverage(data: Dict[str, Any], metrics: Dict[str, Any], service
         )
     else:
         render_no_data_message("No services selected for table display.")
+    
+    st.subheader("📝 All Operations")
+    index = get_operations_index(data)
+    col1, col2 = st.columns(2)
+    with col1:
+        type_options = list(index.display['Type'].cat.categories)
+        type_filter = st.multiselect(
+            "Filter by Type:",
+            options=type_options,
+            default=type_options,
+            key="all_operations_type"
+        )
+    with col2:
+        support_filter = st.multiselect(
+            "Filter by Support Status:",
+            options=['Yes', 'No'],
+            default=['Yes', 'No'],
+            key="all_operations_supported"
+        )
+    render_operations_table(
+        index, "all_operations", selected_services, type_filter, support_filter,
+        columns=['Service', 'Operation', 'Type', 'Supported', 'File', 'Line']
+    )
 
 
+@instrumented
 def show_control_plane_overview(data: Dict[str, Any], metrics: Dict[str, Any], service_df: pd.DataFrame) -> None:
     st.header("⚙️ Control Plane Overview")
     with st.expander("🔧 Filter Services", expanded=False):
         all_services = list(data.keys())
         selected_services = render_service_selector(all_services, "cp")
     
-    st.session_state.selected_services = selected_services
     metrics = calculate_overall_metrics(data, selected_services)
     service_df = create_service_dataframe(data, selected_services)
     
@@ -146,34 +192,20 @@ def show_control_plane_overview(data: Dict[str, Any], metrics: Dict[str, Any], s
     
     col1, col2 = st.columns(2)
     
+    selection = selection_key(selected_services)
     with col1:
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=['Supported', 'Not Supported'],
-            values=[metrics['total_supported_control_plane'], metrics['total_control_plane'] - metrics['total_supported_control_plane']],
-            hole=0.4,
-            marker_colors=['#2ecc71', '#e74c3c']
-        )])
-        fig_pie.update_layout(
-            title="Control Plane Coverage",
-            title_x=0.5,
-            height=400
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        fig_pie = cached_figure("cp_pie", selection, data, lambda: support_pie(
+            metrics['total_supported_control_plane'], metrics['total_control_plane'], "Control Plane Coverage",
+            donut=True, title_x=0.5, height=400
+        ))
+        _plotly_chart(fig_pie)
     
     with col2:
         if not cp_service_df.empty:
-            top_cp_services = cp_service_df.head(10)
-            fig_bar = px.bar(
-                top_cp_services,
-                x='Control Plane Coverage %',
-                y='Service',
-                orientation='h',
-                title="Top 10 Services by Control Plane Coverage",
-                color='Control Plane Coverage %',
-                color_continuous_scale='RdYlGn'
-            )
-            fig_bar.update_layout(height=400)
-            st.plotly_chart(fig_bar, use_container_width=True)
+            fig_bar = cached_figure("cp_bar", selection, data, lambda: top_services_bar(
+                cp_service_df, 'Control Plane Coverage %', "Top 10 Services by Control Plane Coverage"
+            ))
+            _plotly_chart(fig_bar)
         else:
             render_no_data_message("No services with control plane operations selected.")
     
@@ -188,6 +220,7 @@ def show_control_plane_overview(data: Dict[str, Any], metrics: Dict[str, Any], s
         render_no_data_message("No services with control plane operations found in selection.")
 
 
+@instrumented
 def show_service_analysis(data: Dict[str, Any], service_df: pd.DataFrame) -> None:
     """Display per-service analysis."""
     st.header("🔍 Per-Service Analysis")
@@ -215,48 +248,28 @@ def show_service_analysis(data: Dict[str, Any], service_df: pd.DataFrame) -> Non
         
         col1, col2 = st.columns(2)    
         with col1:
-            control_plane_ops = service_data['control_plane_operations']
-            data_plane_ops = service_data['total_operations'] - control_plane_ops
-            
-            fig_ops = go.Figure(data=[go.Pie(
-                labels=['Control Plane', 'Data Plane'],
-                values=[control_plane_ops, data_plane_ops],
-                marker_colors=['#3498db', '#9b59b6']
-            )])
-            fig_ops.update_layout(title=f"{selected_service.upper()} - Operation Types")
-            st.plotly_chart(fig_ops, use_container_width=True)
+            fig_ops = cached_figure("service_types", selected_service, data, lambda: operation_types_pie(
+                selected_service, service_data
+            ))
+            _plotly_chart(fig_ops)
         
         with col2:
-            supported = service_data['supported_operations']
-            unsupported = service_data['total_operations'] - supported
-            
-            fig_support = go.Figure(data=[go.Pie(
-                labels=['Supported', 'Not Supported'],
-                values=[supported, unsupported],
-                marker_colors=['#2ecc71', '#e74c3c']
-            )])
-            fig_support.update_layout(title=f"{selected_service.upper()} - Support Status")
-            st.plotly_chart(fig_support, use_container_width=True)
+            fig_support = cached_figure("service_support", selected_service, data, lambda: support_pie(
+                service_data['supported_operations'], service_data['total_operations'],
+                f"{selected_service.upper()} - Support Status"
+            ))
+            _plotly_chart(fig_support)
         
         st.subheader("📝 Operations Details")   
-        operations_data = []
-        for op in service_data['operations']:
-            operations_data.append({
-                'Operation': op['name'],
-                'Type': op['type'].replace('_', ' ').title(),
-                'Supported': 'Yes' if op['file'] and op['line'] > 0 else 'No',
-                'File': op['file'] if op['file'] else 'N/A',
-                'Line': str(op['line']) if op['line'] > 0 else 'N/A'
-            })
-        
-        operations_df = pd.DataFrame(operations_data)
+        index = get_operations_index(data)
+        type_options = list(index.display['Type'].iloc[index.service_slice(selected_service)].unique())
         
         col1, col2 = st.columns(2)
         with col1:
             type_filter = st.multiselect(
                 "Filter by Type:",
-                options=operations_df['Type'].unique(),
-                default=operations_df['Type'].unique()
+                options=type_options,
+                default=type_options
             )
         with col2:
             support_filter = st.multiselect(
@@ -265,14 +278,12 @@ def show_service_analysis(data: Dict[str, Any], service_df: pd.DataFrame) -> Non
                 default=['Yes', 'No']
             )
         
-        filtered_df = operations_df[
-            (operations_df['Type'].isin(type_filter)) &
-            (operations_df['Supported'].isin(support_filter))
-        ]
-        
-        st.dataframe(filtered_df, use_container_width=True, height=400)
+        render_operations_table(
+            index, "service_operations", [selected_service], type_filter, support_filter
+        )
 
 
+@instrumented
 def show_per_service_control_plane(data: Dict[str, Any], service_df: pd.DataFrame) -> None:
     st.header("🔧 Per-Service Control Plane Analysis")
     
@@ -305,42 +316,22 @@ def show_per_service_control_plane(data: Dict[str, Any], service_df: pd.DataFram
         
         col1, col2 = st.columns(2)
         with col1:
-            supported_cp = service_data['supported_control_plane_operations']
-            unsupported_cp = service_data['control_plane_operations'] - supported_cp
-            
-            fig_cp_support = go.Figure(data=[go.Pie(
-                labels=['Supported', 'Not Supported'],
-                values=[supported_cp, unsupported_cp],
-                marker_colors=['#2ecc71', '#e74c3c']
-            )])
-            fig_cp_support.update_layout(title=f"{selected_service.upper()} - Control Plane Support")
-            st.plotly_chart(fig_cp_support, use_container_width=True)
+            fig_cp_support = cached_figure("service_cp_support", selected_service, data, lambda: support_pie(
+                service_data['supported_control_plane_operations'], service_data['control_plane_operations'],
+                f"{selected_service.upper()} - Control Plane Support"
+            ))
+            _plotly_chart(fig_cp_support)
         
         with col2:
-            control_plane_ops = service_data['control_plane_operations']
-            data_plane_ops = service_data['total_operations'] - control_plane_ops
-            
-            fig_ops = go.Figure(data=[go.Pie(
-                labels=['Control Plane', 'Data Plane'],
-                values=[control_plane_ops, data_plane_ops],
-                marker_colors=['#3498db', '#9b59b6']
-            )])
-            fig_ops.update_layout(title=f"{selected_service.upper()} - Operation Types")
-            st.plotly_chart(fig_ops, use_container_width=True)
+            fig_ops = cached_figure("service_types", selected_service, data, lambda: operation_types_pie(
+                selected_service, service_data
+            ))
+            _plotly_chart(fig_ops)
         
         st.subheader("📝 Control Plane Operations Details")
-        cp_operations_data = []
-        for op in service_data['operations']:
-            if op['type'] == 'control_plane':
-                cp_operations_data.append({
-                    'Operation': op['name'],
-                    'Supported': 'Yes' if op['file'] and op['line'] > 0 else 'No',
-                    'File': op['file'] if op['file'] else 'N/A',
-                    'Line': str(op['line']) if op['line'] > 0 else 'N/A'
-                })
+        index = get_operations_index(data)
         
-        if cp_operations_data:
-            cp_operations_df = pd.DataFrame(cp_operations_data)
+        if service_data['control_plane_operations'] > 0:
             col1, col2 = st.columns([1, 1])
             with col1:
                 support_filter = st.multiselect(
@@ -351,10 +342,361 @@ def show_per_service_control_plane(data: Dict[str, Any], service_df: pd.DataFram
             with col2:
                 st.write("")  # Spacer
             
-            filtered_cp_df = cp_operations_df[
-                cp_operations_df['Supported'].isin(support_filter)
-            ]
-            
-            st.dataframe(filtered_cp_df, use_container_width=True, height=400)
+            render_operations_table(
+                index, "service_cp_operations", [selected_service], ['Control Plane'], support_filter,
+                columns=['Operation', 'Supported', 'File', 'Line']
+            )
         else:
-            st.info("No control plane operations found for this service.")
\ No newline at end of file
+            st.info("No control plane operations found for this service.")
+
+
+@instrumented
+def show_coverage_trends(data: Dict[str, Any]) -> None:
+    st.header("📉 Coverage Trends")
+    
+    history = get_history()
+    if len(history) == 0:
+        st.info(
+            "No coverage history recorded yet. Record the current results as a snapshot with "
+            "`python -m ack_dashboard.data.history append <label>`."
+        )
+        return
+    
+    services = history.services
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        selected_services = st.multiselect(
+            "Services:",
+            options=services,
+            default=[s for s in services if s in data][:5],
+            format_func=lambda x: x.upper()
+        )
+    with col2:
+        last = st.number_input("Last snapshots:", min_value=1, max_value=len(history), value=min(50, len(history)))
+    with col3:
+        coverage_column = st.radio("Metric:", ['Coverage %', 'Control Plane Coverage %'])
+    
+    if not selected_services:
+        st.warning("Please select at least one service to display data.")
+        return
+    
+    def build_trend():
+        trend_df = pd.DataFrame([
+            {
+                'Snapshot': point.label,
+                'Service': service.upper(),
+                'Coverage %': round(point.coverage, 1),
+                'Control Plane Coverage %': round(point.control_plane_coverage, 1)
+            }
+            for service in selected_services
+            for point in history.coverage_series(service, last=int(last))
+        ])
+        return coverage_trend_line(trend_df, coverage_column, f"{coverage_column} over the last {int(last)} snapshot(s)")
+    
+    trend_key = (tuple(selected_services), int(last), coverage_column, history.version)
+    _plotly_chart(cached_figure("coverage_trends", trend_key, data, build_trend))
+    
+    st.subheader("🆕 Newly Supported Operations")
+    if len(history) < 2:
+        render_no_data_message("Record at least two snapshots to compare support changes.")
+        return
+    
+    since = st.selectbox("Since snapshot:", options=history.labels[:-1])
+    changes = history.newly_supported(since)
+    if changes:
+        st.dataframe(
+            pd.DataFrame([
+                {'Service': c.service.upper(), 'Operation': c.operation, 'Supported Since': c.label}
+                for c in changes
+            ]),
+            use_container_width=True,
+            height=400
+        )
+    else:
+        render_no_data_message(f"No operations became supported since {since}.")
+
+
+@instrumented
+def show_operation_search(data: Dict[str, Any]) -> None:
+    st.header("🔎 Operation Search")
+    
+    index = get_search_index(data)
+    query = st.text_input(
+        "Search operations across all services:",
+        placeholder="e.g. name:Tag* is:unsupported-everywhere",
+        help=(
+            "Terms are combined with AND. `word` matches a token, `word*` a token prefix, "
+            "`*word*` any part of a token and `~word` is fuzzy. Restrict a term with `name:`, "
+            "`service:` or `file:`. Filter with `is:supported`, `is:unsupported`, "
+            "`is:unsupported-everywhere`, `type:control` or `type:data`."
+        )
+    )
+    if not query.strip():
+        render_no_data_message(f"Type a query to search {len(index):,} operations.")
+        return
+    
+    start = time.perf_counter()
+    try:
+        hits = index.search(query)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    services = {hit.service for hit in hits}
+    st.caption(f"{len(hits):,} operation(s) in {len(services)} service(s) · {elapsed_ms:.2f} ms")
+    if not hits:
+        return
+    
+    st.dataframe(
+        pd.DataFrame([
+            {
+                'Service': hit.service.upper(),
+                'Operation': hit.name,
+                'Type': hit.type.replace('_', ' ').title(),
+                'Supported': 'Yes' if hit.supported else 'No',
+                'File': hit.file if hit.file else 'N/A',
+                'Line': str(hit.line) if hit.line > 0 else 'N/A'
+            }
+            for hit in hits
+        ]),
+        use_container_width=True,
+        height=400
+    )
+
+
+@instrumented
+def show_implementation_hotspots(data: Dict[str, Any]) -> None:
+    st.header("🔥 Implementation Hotspots")
+    
+    report = get_hotspot_report(data)
+    if report.by_file.empty:
+        render_no_data_message("No supported operations with implementation files found.")
+        return
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_files = cached_figure("hotspot_files", None, data, lambda: top_files_bar(
+            report.by_file, "Top Files by Supported Operations"
+        ))
+        _plotly_chart(fig_files)
+    
+    with col2:
+        st.subheader("📂 By File Name")
+        st.dataframe(report.by_basename, use_container_width=True, height=400, hide_index=True)
+    
+    st.subheader("🔁 Files Shared Across Services")
+    shared_files = report.shared_files
+    if not shared_files.empty:
+        st.dataframe(shared_files, use_container_width=True, height=300, hide_index=True)
+    else:
+        render_no_data_message("No implementation file is shared between services.")
+    
+    st.subheader("🔬 Drilldown")
+    col1, col2 = st.columns(2)
+    with col1:
+        selected_service = st.selectbox(
+            "Service:",
+            options=list(data.keys()),
+            format_func=lambda x: x.upper(),
+            key="hotspot_service"
+        )
+    service_files = report.files_for_service(selected_service)
+    if service_files.empty:
+        render_no_data_message(f"No supported operations found for {selected_service.upper()}.")
+        return
+    with col2:
+        selected_file = st.selectbox("File:", options=list(service_files['File']), key="hotspot_file")
+    
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.dataframe(report.line_ranges(selected_service, selected_file), use_container_width=True, hide_index=True)
+    with col2:
+        st.dataframe(
+            report.operations_in_file(selected_service, selected_file),
+            use_container_width=True,
+            hide_index=True
+        )
+
+
+@instrumented
+def show_service_matrix(data: Dict[str, Any]) -> None:
+    st.header("🧮 Service Matrix")
+    
+    matrix = get_coverage_matrix(data)
+    if not matrix.verbs:
+        render_no_data_message()
+        return
+    
+    with st.expander("🔧 Filter Services", expanded=False):
+        all_services = list(data.keys())
+        selected_services = render_service_selector(all_services, "matrix")
+    render_selection_info(len(selected_services), len(all_services))
+    if not selected_services:
+        st.warning("Please select at least one service to display data.")
+        return
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        verb_count = st.slider(
+            "Most common verbs:",
+            min_value=1,
+            max_value=len(matrix.verbs),
+            value=min(15, len(matrix.verbs)),
+            key="matrix_verbs"
+        )
+    with col2:
+        control_plane_only = st.radio(
+            "Operations:", [False, True], format_func=lambda x: "Control Plane" if x else "All", key="matrix_plane"
+        )
+    
+    # The pivot is precomputed per data version; a rerun only slices it.
+    matrix_key = (selection_key(selected_services), verb_count, control_plane_only)
+    coverage_df = matrix.frame(control_plane_only, selected_services, verb_count)
+    title = f"{'Control Plane ' if control_plane_only else ''}Coverage % by Verb and Service"
+    fig = cached_figure("service_matrix", matrix_key, data, lambda: coverage_heatmap(
+        coverage_df, matrix.counts(control_plane_only, selected_services, verb_count), title
+    ))
+    event = _plotly_chart(fig, key="matrix_heatmap", on_select="rerun", selection_mode="points")
+    st.caption("Click a cell to list its operations. Blank cells: the service has no operation with that verb.")
+    
+    with st.expander("📋 Verb Summary", expanded=False):
+        st.dataframe(
+            matrix.verb_summary(control_plane_only, selected_services, verb_count),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    st.subheader("🔬 Drilldown")
+    verbs = matrix.verbs[:verb_count]
+    services = list(coverage_df.columns)
+    # A newly clicked cell drives the selectboxes below; they stay editable afterwards.
+    points = event.selection.points if event else []
+    if points:
+        clicked = (points[0]['y'], points[0]['x'].lower())
+        if clicked != st.session_state.get("matrix_clicked") and clicked[0] in verbs and clicked[1] in services:
+            st.session_state["matrix_clicked"] = clicked
+            st.session_state["matrix_cell_verb"], st.session_state["matrix_cell_service"] = clicked
+    # Drop a drilldown choice that fell out of the matrix after a filter change.
+    for key, options in (("matrix_cell_verb", verbs), ("matrix_cell_service", services)):
+        if st.session_state.get(key, options[0]) not in options:
+            del st.session_state[key]
+    col1, col2 = st.columns(2)
+    with col1:
+        verb = st.selectbox("Verb:", options=verbs, key="matrix_cell_verb")
+    with col2:
+        service = st.selectbox("Service:", options=services, format_func=lambda x: x.upper(), key="matrix_cell_service")
+    
+    operations = matrix.cell_operations(verb, service, control_plane_only)
+    if operations.empty:
+        render_no_data_message(f"{service.upper()} has no {verb} operations.")
+        return
+    supported = int((operations['Supported'] == 'Yes').sum())
+    st.caption(f"{service.upper()} · {verb}: {supported} of {len(operations)} operation(s) supported")
+    st.dataframe(operations, use_container_width=True, hide_index=True)
+
+
+@instrumented
+def show_snapshot_diff(data: Dict[str, Any]) -> None:
+    st.header("🔀 Snapshot Diff")
+    
+    baselines = configured_baselines()
+    baseline_name = st.selectbox(
+        "Baseline:",
+        options=list(baselines),
+        index=None,
+        format_func=lambda name: f"{name} ({baselines[name]})",
+        placeholder="Choose a dataset or snapshot",
+        help="Changes are shown from the baseline to the results currently loaded in the dashboard. "
+             "Baselines are the configured datasets and ACK_DASHBOARD_BASELINES."
+    )
+    if baseline_name is None:
+        render_no_data_message("Choose a baseline to compare the current results against.")
+        return
+    
+    baseline, errors = load_dataset(baselines[baseline_name])
+    if errors:
+        details = "\n".join(f"- `{path}`: {e}" for path, e in errors)
+        st.error(f"Error loading {len(errors)} baseline file(s):\n{details}")
+    if not baseline:
+        return
+    
+    diff = diff_datasets(baseline, data)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Changed Services", len(diff.services_with_status('changed')), help=f"{diff.unchanged} unchanged")
+    with col2:
+        st.metric(
+            "Added / Removed Services",
+            f"{len(diff.services_with_status('added'))} / {len(diff.services_with_status('removed'))}"
+        )
+    with col3:
+        st.metric("Newly Supported", diff.count(NEWLY_SUPPORTED))
+    with col4:
+        st.metric("Newly Unsupported", diff.count(NEWLY_UNSUPPORTED))
+    
+    if not diff.services:
+        st.success("No differences: every service is identical in both datasets.")
+        return
+    
+    st.subheader("📋 Service Changes")
+    st.dataframe(
+        pd.DataFrame([
+            {
+                'Service': service.service.upper(),
+                'Status': service.status.title(),
+                'Coverage Before %': _summary_coverage(service.old_summary),
+                'Coverage After %': _summary_coverage(service.new_summary),
+                'Newly Supported': service.count(NEWLY_SUPPORTED),
+                'Newly Unsupported': service.count(NEWLY_UNSUPPORTED),
+                'Operations Added': service.count(ADDED),
+                'Operations Removed': service.count(REMOVED)
+            }
+            for service in diff.services
+        ]),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    st.subheader("📝 Operation Changes")
+    kinds = [ADDED, REMOVED, NEWLY_SUPPORTED, NEWLY_UNSUPPORTED, TYPE_CHANGED, MOVED]
+    kind_filter = st.multiselect(
+        "Filter by Change:",
+        options=kinds,
+        default=[NEWLY_SUPPORTED, NEWLY_UNSUPPORTED, TYPE_CHANGED],
+        format_func=lambda x: x.title()
+    )
+    changes = [change for change in diff.changes if change.kind in kind_filter]
+    if not changes:
+        render_no_data_message("No operation changes match the selected filters.")
+        return
+    st.dataframe(
+        pd.DataFrame([
+            {
+                'Service': change.service.upper(),
+                'Operation': change.operation,
+                'Change': change.kind.title(),
+                'Before': _location(change.old),
+                'After': _location(change.new)
+            }
+            for change in changes
+        ]),
+        use_container_width=True,
+        height=400,
+        hide_index=True
+    )
+
+
+def _summary_coverage(summary) -> Optional[float]:
+    if summary is None or summary[0] == 0:
+        return None
+    return round(summary[1] / summary[0] * 100, 1)
+
+
+def _location(state) -> str:
+    if state is None:
+        return '—'
+    op_type, file, line = state
+    where = f"{file}:{line}" if file and line > 0 else 'not supported'
+    return f"{op_type.replace('_', ' ').title()} · {where}"
@@ -0,0 +1,92 @@
+"""Time ``ack_dashboard.data.generate`` on a synthetic tree of controller checkouts.
+
+First regenerates ``fixtures/generate`` and compares it with
+``fixtures/generate/expected``; any difference fails the run (exit 1) before
+timing starts. ``--check-fixture`` stops after that comparison.
+
+Then reports, for ``--services`` controllers of ``--files`` Go files each:
+
+- ``cold``: no cache, every file scanned, with ``--workers`` processes
+- ``warm``: nothing changed, every file skipped by mtime and size
+- ``touched``: every file touched, matched by content hash without scanning
+- ``one-service``: one controller's files edited, only those rescanned
+
+    python benchmarks/generate.py [--services 55] [--files 20] [--workers N] [--check-fixture]
+"""
+import argparse
+import difflib
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic import generate_controllers  # noqa: E402
+
+from ack_dashboard.data.generate import generate  # noqa: E402
+
+FIXTURE = ROOT / "fixtures" / "generate"
+
+
+def check_fixture() -> bool:
+    """Regenerate the fixture tree without a cache and diff it against ``expected/``."""
+    with tempfile.TemporaryDirectory(prefix="ack-generate-fixture-") as tmp:
+        output = Path(tmp)
+        report = generate(FIXTURE / "operations", FIXTURE / "controllers", output, workers=1, use_cache=False)
+        for path, e in report.errors:
+            print(f"fixture: error generating from {path}: {e}", file=sys.stderr)
+        expected = {path.name: path.read_text() for path in (FIXTURE / "expected").glob("*.json")}
+        actual = {path.name: path.read_text() for path in output.glob("*.json")}
+        ok = not report.errors
+        for name in sorted(expected.keys() | actual.keys()):
+            if expected.get(name) != actual.get(name):
+                ok = False
+                sys.stderr.writelines(difflib.unified_diff(
+                    (expected.get(name) or "").splitlines(keepends=True),
+                    (actual.get(name) or "").splitlines(keepends=True),
+                    f"expected/{name}", f"generated/{name}",
+                ))
+    print(f"fixture: {'ok' if ok else 'MISMATCH'} ({len(expected)} expected file(s))")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--services", type=int, default=55)
+    parser.add_argument("--operations", type=int, default=80)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--check-fixture", action="store_true", help="only compare the fixture output")
+    args = parser.parse_args()
+
+    if not check_fixture():
+        return 1
+    if args.check_fixture:
+        return 0
+
+    with tempfile.TemporaryDirectory(prefix="ack-generate-") as tmp:
+        tree = generate_controllers(Path(tmp), args.services, args.operations, args.files)
+        operations, controllers, output = tree / "operations", tree / "controllers", tree / "results"
+
+        def run(label: str, **kwargs) -> None:
+            report = generate(operations, controllers, output, args.workers, **kwargs)
+            print(f"{label:>12}{report.elapsed_s * 1000:>10.1f} ms{report.scanned:>8} scanned"
+                  f"{report.stat_hits:>8} by stat{report.content_hits:>8} by hash{len(report.written):>6} written")
+
+        go_files = sorted(controllers.rglob("*.go"))
+        print(f"{len(go_files)} Go files, {sum(p.stat().st_size for p in go_files) / 2**20:.1f} MB")
+        run("cold")
+        run("warm")
+        for path in go_files:
+            os.utime(path)
+        run("touched")
+        for path in sorted((controllers / "svc0000-controller").rglob("*.go")):
+            path.write_text(path.read_text() + "// edited\n")
+        run("one-service")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Startup import budget, measured with ``python -X importtime``.
+
+For every module in ``import_budget.json`` this reports the median cumulative
+import time over fresh interpreters (interpreter startup excluded) and checks
+that none of its ``forbidden`` packages were imported. Exits 1 when a module
+is over budget or pulls in a forbidden package, so it can gate CI.
+
+    python benchmarks/import_time.py [--repeat 5] [--budget benchmarks/import_budget.json]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_profile(statement: str) -> List[Tuple[str, int, int]]:
+    """Return (module, depth, cumulative microseconds) for each line of ``-X importtime``."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    profile = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        profile.append((stripped, depth, int(cumulative)))
+    return profile
+
+
+def measure(module: str, startup: Set[str], repeat: int) -> Tuple[float, Set[str]]:
+    timings = []
+    imported: Set[str] = set()
+    for _ in range(repeat):
+        profile = import_profile(f"import {module}")
+        timings.append(sum(us for name, depth, us in profile if depth == 0 and name not in startup))
+        imported = {name for name, _, _ in profile}
+    return statistics.median(timings) / 1000, imported
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", default=str(Path(__file__).with_name("import_budget.json")))
+    args = parser.parse_args()
+
+    budgets: Dict[str, dict] = json.loads(Path(args.budget).read_text())
+    startup = {name for name, _, _ in import_profile("pass")}
+
+    failed = False
+    print(f"{'module':<40}{'median ms':>10}{'budget ms':>11}  status")
+    for module, budget in budgets.items():
+        elapsed_ms, imported = measure(module, startup, args.repeat)
+        leaked = sorted(pkg for pkg in budget.get("forbidden", []) if pkg in imported)
+        problems = []
+        if elapsed_ms > budget["budget_ms"]:
+            problems.append("over budget")
+        if leaked:
+            problems.append(f"imports {', '.join(leaked)}")
+        failed |= bool(problems)
+        print(f"{module:<40}{elapsed_ms:>10.1f}{budget['budget_ms']:>11}  {'; '.join(problems) or 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""Load test: many concurrent headless dashboard sessions in one process.
+
+Each session is a Streamlit ``AppTest`` of ``main.py`` on its own thread, the
+way a Streamlit server runs one script thread per browser session over
+shared process-wide caches. After its first render a session repeats a
+weighted interaction script with exponential think time between actions:
+
+- ``switch_view``: pick another view in the sidebar
+- ``toggle_service``: toggle one service checkbox and press Apply (Overall Coverage)
+- ``select_all``: press Select All (Overall Coverage)
+- ``change_service``: pick another service in Per-Service Analysis
+
+Every session count in ``--sessions`` runs for ``--duration`` seconds in a
+fresh interpreter, and reports rerun latency percentiles (overall and per
+action), reruns per second, CPU (100% = one core busy) and RSS (total and
+above the idle baseline, per session). Latency is the script run only:
+websocket transport and browser rendering are not part of it.
+
+    python benchmarks/load_test.py [--sessions 1 5 10 25] [--duration 30] [--think-ms 500] \\
+        [--results results | --services 54 --operations 80] [--output load.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Any, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic import generate_results  # noqa: E402
+
+if TYPE_CHECKING:
+    from streamlit.testing.v1 import AppTest
+
+
+ACTIONS = {
+    'switch_view': 4,
+    'toggle_service': 2,
+    'select_all': 1,
+    'change_service': 3,
+}
+FILTER_VIEW = "Overall Coverage"
+SERVICE_VIEW = "Per-Service Analysis"
+SERVICE_SELECTBOX = "Select a service for detailed analysis:"
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def latency_summary(values: List[float]) -> Dict[str, float]:
+    return {
+        'count': len(values),
+        'p50_ms': percentile(values, 0.5),
+        'p90_ms': percentile(values, 0.9),
+        'p95_ms': percentile(values, 0.95),
+        'p99_ms': percentile(values, 0.99),
+        'max_ms': max(values, default=0.0),
+    }
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+class Session:
+    """One simulated browser session and the latency of every rerun it triggered."""
+
+    def __init__(self, app: "AppTest", seed: int, think_ms: float):
+        self.app = app
+        self.rng = random.Random(seed)
+        self.think_ms = think_ms
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: List[str] = []
+
+    def run(self, deadline: float) -> None:
+        self._rerun('first_render', lambda: None)
+        actions, weights = list(ACTIONS), list(ACTIONS.values())
+        while time.monotonic() < deadline:
+            if self.think_ms > 0:
+                time.sleep(min(self.rng.expovariate(1000 / self.think_ms), max(0.0, deadline - time.monotonic())))
+            if time.monotonic() >= deadline:
+                break
+            getattr(self, self.rng.choices(actions, weights)[0])()
+
+    def switch_view(self) -> None:
+        views = self.app.sidebar.selectbox[0].options
+        current = self.app.sidebar.selectbox[0].value
+        self._switch_to(self.rng.choice([view for view in views if view != current]))
+
+    def toggle_service(self) -> None:
+        self._switch_to(FILTER_VIEW)
+        checkboxes = [c for c in self.app.checkbox if (c.key or "").startswith("service_checkbox_overall_")]
+        if not checkboxes:
+            return
+        checkbox = self.rng.choice(checkboxes)
+        checkbox.set_value(not checkbox.value)
+        self._rerun('toggle_service', lambda: self._button("Apply").click())
+
+    def select_all(self) -> None:
+        self._switch_to(FILTER_VIEW)
+        self._rerun('select_all', lambda: self._button("Select All").click())
+
+    def change_service(self) -> None:
+        self._switch_to(SERVICE_VIEW)
+        selectbox = next((s for s in self.app.selectbox if s.label == SERVICE_SELECTBOX), None)
+        if selectbox is None:
+            return
+        self._rerun('change_service', lambda: selectbox.set_value(self.rng.choice(selectbox.options).lower()))
+
+    def _switch_to(self, view: str) -> None:
+        if self.app.sidebar.selectbox[0].value != view:
+            self._rerun('switch_view', lambda: self.app.sidebar.selectbox[0].set_value(view))
+
+    def _button(self, label: str):
+        return next(b for b in self.app.button if b.label == label)
+
+    def _rerun(self, action: str, interact: Callable[[], Any]) -> None:
+        interact()
+        start = time.perf_counter()
+        self.app.run()
+        self.latencies.setdefault(action, []).append((time.perf_counter() - start) * 1000)
+        if self.app.exception:
+            self.errors.append(f"{action}: {self.app.exception[0].value}")
+
+
+def run_stage(sessions: int, duration: float, think_ms: float, seed: int) -> Dict[str, Any]:
+    """Run ``sessions`` concurrent sessions in this process for ``duration`` seconds."""
+    from streamlit.testing.v1 import AppTest  # Before the baseline, so the import is not counted per session
+
+    baseline_rss = rss_mb()
+    workers = [
+        Session(AppTest.from_file(str(ROOT / "main.py"), default_timeout=300), seed * 1000 + i, think_ms)
+        for i in range(sessions)
+    ]
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    deadline = time.monotonic() + duration
+    threads = [threading.Thread(target=session.run, args=(deadline,), daemon=True) for session in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    end_rss = rss_mb()
+
+    by_action: Dict[str, List[float]] = {}
+    for session in workers:
+        for action, values in session.latencies.items():
+            by_action.setdefault(action, []).extend(values)
+    reruns = [value for action, values in by_action.items() if action != 'first_render' for value in values]
+    errors = [error for session in workers for error in session.errors]
+    return {
+        'sessions': sessions,
+        'wall_s': wall,
+        'reruns': len(reruns),
+        'reruns_per_s': len(reruns) / wall if wall else 0.0,
+        'latency': latency_summary(reruns),
+        'actions': {action: latency_summary(values) for action, values in sorted(by_action.items())},
+        'cpu_percent': cpu / wall * 100 if wall else 0.0,
+        'rss_baseline_mb': baseline_rss,
+        'rss_end_mb': end_rss,
+        'rss_peak_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'rss_per_session_mb': (end_rss - baseline_rss) / sessions,
+        'errors': len(errors),
+        'error_samples': errors[:5],
+    }
+
+
+def stage_in_subprocess(sessions: int, args: argparse.Namespace, env: Dict[str, str]) -> Dict[str, Any]:
+    # A fresh interpreter per session count, so RSS and warm caches never carry over.
+    out = subprocess.run(
+        [sys.executable, __file__, "--stage", str(sessions), "--duration", str(args.duration),
+         "--think-ms", str(args.think_ms), "--seed", str(args.seed)],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if out.returncode != 0:
+        raise RuntimeError(f"{sessions} session(s) failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def print_results(stages: List[Dict[str, Any]], slo_ms: float) -> None:
+    print(f"{'sessions':>8}{'reruns':>8}{'rerun/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+          f"{'CPU %':>7}{'RSS MB':>8}{'MB/sess':>8}{'errors':>7}")
+    for stage in stages:
+        latency = stage['latency']
+        flag = "  > SLO" if latency['p95_ms'] > slo_ms else ""
+        print(f"{stage['sessions']:>8}{stage['reruns']:>8}{stage['reruns_per_s']:>9.1f}{latency['p50_ms']:>9.0f}"
+              f"{latency['p95_ms']:>9.0f}{latency['p99_ms']:>9.0f}{latency['max_ms']:>9.0f}"
+              f"{stage['cpu_percent']:>7.0f}{stage['rss_end_mb']:>8.0f}{stage['rss_per_session_mb']:>8.1f}"
+              f"{stage['errors']:>7}{flag}")
+
+    print(f"\n{'p50/p95 ms by action':<22}" + "".join(f"{stage['sessions']:>14}" for stage in stages))
+    for action in ['first_render', *ACTIONS]:
+        cells = []
+        for stage in stages:
+            summary = stage['actions'].get(action)
+            cells.append(f"{summary['p50_ms']:.0f}/{summary['p95_ms']:.0f}" if summary else "-")
+        print(f"{action:<22}" + "".join(f"{cell:>14}" for cell in cells))
+    for stage in stages:
+        for error in stage['error_samples']:
+            print(f"{stage['sessions']} session(s): {error}", file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25])
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per session count")
+    parser.add_argument("--think-ms", type=float, default=500.0, help="mean pause between actions")
+    parser.add_argument("--results", type=Path, help="results directory (default: synthetic data)")
+    parser.add_argument("--services", type=int, default=54)
+    parser.add_argument("--operations", type=int, default=80)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--slo-ms", type=float, default=1000.0, help="flag session counts whose p95 exceeds this")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--stage", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage is not None:
+        print(json.dumps(run_stage(args.stage, args.duration, args.think_ms, args.seed)))
+        return 0
+
+    with tempfile.TemporaryDirectory(prefix="ack-load-") as tmp:
+        results_dir = args.results.resolve() if args.results else generate_results(
+            Path(tmp) / "results", args.services, args.operations, seed=args.seed)
+        env = dict(os.environ, ACK_DASHBOARD_DATASETS=str(results_dir),
+                   ACK_DASHBOARD_HISTORY_DIR=str(Path(tmp) / "history"))
+        stages = []
+        for sessions in args.sessions:
+            stages.append(stage_in_subprocess(sessions, args, env))
+            print(f"{sessions} session(s): {stages[-1]['reruns']} reruns", file=sys.stderr)
+
+    print_results(stages, args.slo_ms)
+    if args.output:
+        args.output.write_text(json.dumps({
+            'meta': {
+                'results': str(args.results) if args.results else f"synthetic {args.services} x {args.operations}",
+                'duration_s': args.duration,
+                'think_ms': args.think_ms,
+                'seed': args.seed,
+                'cpus': os.cpu_count(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            },
+            'stages': stages,
+        }, indent=2) + "\n")
+    return 1 if any(stage['errors'] for stage in stages) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
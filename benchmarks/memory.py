@@ -0,0 +1,75 @@
+"""Memory held by loaded results: raw JSON dicts versus compact ``Operation`` records.
+
+For each scale, synthetic results of ``scale`` x the real dataset (54 services
+of ~80 operations) are generated, then loaded in a fresh interpreter in both
+forms while tracemalloc measures the bytes still allocated once loading is
+done:
+
+- ``dicts``: ``parse_results_files``, one dict per operation as in the JSON
+- ``compact``: ``DataStore.load()``, interned ``__slots__`` records
+
+    python benchmarks/memory.py [--scales 1 10 100]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic import generate_results  # noqa: E402
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVICES = 54
+OPERATIONS = 80
+
+CHILD = r"""
+import gc, json, sys, tracemalloc
+from pathlib import Path
+form, results_dir = sys.argv[1], Path(sys.argv[2])
+from ack_dashboard.data.ingest import parse_results_files
+from ack_dashboard.data.store import DataStore
+paths = sorted(results_dir.glob("*.json"))
+gc.collect()
+tracemalloc.start()
+if form == "dicts":
+    data, _ = parse_results_files(paths)
+else:
+    data = DataStore(results_dir, use_snapshot=False).load()
+gc.collect()
+current, peak = tracemalloc.get_traced_memory()
+operations = sum(len(service_data['operations']) for service_data in data.values())
+print(json.dumps({"bytes": current, "peak": peak, "operations": operations}))
+"""
+
+
+def measure(form: str, results_dir: Path) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, form, str(results_dir)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    print(f"{'scale':>6}{'operations':>12}{'form':>9}{'held MB':>10}{'peak MB':>10}{'B/op':>7}{'saved':>8}")
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory(prefix="ack-memory-") as tmp:
+            results_dir = generate_results(Path(tmp), SERVICES * scale, OPERATIONS)
+            dicts = measure("dicts", results_dir)
+            compact = measure("compact", results_dir)
+        for form, result in (("dicts", dicts), ("compact", compact)):
+            saved = f"{1 - result['bytes'] / dicts['bytes']:.0%}" if form == "compact" else ""
+            print(f"{scale:>5}x{result['operations']:>12,}{form:>9}{result['bytes'] / 2**20:>10.1f}"
+                  f"{result['peak'] / 2**20:>10.1f}{result['bytes'] // result['operations']:>7}{saved:>8}")
+
+
+if __name__ == "__main__":
+    main()
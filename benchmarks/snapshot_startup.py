@@ -0,0 +1,72 @@
+"""Compare cold start from the results/ JSON files against the compiled snapshot.
+
+Each measurement runs in a fresh interpreter so nothing is shared between
+runs. ``load`` is the time for the first ``DataStore.load()`` (imports excluded); ``first render``
+is the time for Streamlit's AppTest to execute ``main.py`` once against the
+same results directory; RSS is the child's peak resident set size.
+
+    python benchmarks/snapshot_startup.py [--repeat 5] [--results results]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = r"""
+import json, resource, sys, time
+mode, results_dir = sys.argv[1], sys.argv[2]
+if mode == "load":
+    from ack_dashboard.data.store import get_store
+    start = time.perf_counter()
+    get_store(results_dir).load()
+else:
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    AppTest.from_file("main.py", default_timeout=120).run()
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "rss_mb": rss_kb / 1024}))
+"""
+
+
+def measure(mode: str, source: str, results_dir: str, repeat: int) -> dict:
+    # The dashboard reads its results directory from ACK_DASHBOARD_DATASETS, so render runs use the same tree.
+    env = dict(os.environ, ACK_DASHBOARD_SNAPSHOT="1" if source == "snapshot" else "0",
+               ACK_DASHBOARD_DATASETS=results_dir)
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD, mode, results_dir],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {
+        "seconds": statistics.median(r["seconds"] for r in runs),
+        "rss_mb": statistics.median(r["rss_mb"] for r in runs),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--results", default="results")
+    args = parser.parse_args()
+    results_dir = str(Path(args.results).resolve())
+
+    subprocess.run([sys.executable, "-m", "ack_dashboard.data.snapshot", results_dir], cwd=ROOT, check=True)
+
+    print(f"{'phase':<14}{'source':<10}{'median ms':>12}{'peak RSS MB':>14}")
+    for mode, label in [("load", "load"), ("render", "first render")]:
+        for source in ["json", "snapshot"]:
+            result = measure(mode, source, results_dir, args.repeat)
+            print(f"{label:<14}{source:<10}{result['seconds'] * 1000:>12.1f}{result['rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
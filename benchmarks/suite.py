@@ -0,0 +1,192 @@
+"""Benchmark suite for loading, metrics, DataFrame construction and view rendering.
+
+Runs against a synthetic results directory of ``--services`` x ``--operations``
+(see ``synthetic.py``) and reports the median and min milliseconds of each
+benchmark over ``--repeat`` runs:
+
+- ``load.cold``: a fresh ``DataStore`` parsing every file; ``load.rerun``:
+  ``load_data()`` on a warm store, as paid by every Streamlit rerun
+- ``metrics.engine``: building the ``MetricsEngine``; ``metrics.overall`` and
+  ``metrics.service_dataframe``: ``calculate_overall_metrics`` and
+  ``create_service_dataframe`` for a different random selection on every run
+- ``render.first``: a new session's first headless run of ``main.py`` with
+  Streamlit's AppTest; ``render.<view>``: a rerun switching to each sidebar view
+
+Results are written as JSON with ``--output``. With ``--baseline``, each
+benchmark is compared to a previous run and the suite exits 1 when one got
+slower than its threshold from ``--thresholds``.
+
+    python benchmarks/suite.py [--services 54] [--operations 80] [--repeat 5] \\
+        [--output bench.json] [--baseline previous.json] [--thresholds benchmarks/thresholds.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic import generate_results  # noqa: E402
+
+
+VIEWS = [
+    "Overall Coverage",
+    "Per-Service Analysis",
+    "Control Plane Overview",
+    "Per-Service Control Plane",
+    "Service Matrix",
+]
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> List[float]:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return runs
+
+
+def bench_data(results_dir: Path, repeat: int) -> Dict[str, List[float]]:
+    from ack_dashboard.data.store import DataStore
+    from ack_dashboard.data.loader import load_data
+    from ack_dashboard.calculations.metrics import (
+        MetricsEngine,
+        calculate_overall_metrics,
+        create_service_dataframe
+    )
+
+    runs = {}
+    runs['load.cold'] = timed(lambda: DataStore(results_dir, use_snapshot=False).load(), repeat)
+    data = load_data(results_dir)
+    runs['load.rerun'] = timed(lambda: load_data(results_dir), repeat)
+
+    runs['metrics.engine'] = timed(lambda: MetricsEngine(data), repeat)
+    services = list(data.keys())
+    rng = random.Random(0)
+    selections = [rng.getrandbits(len(services)) for _ in range(repeat)]
+    runs['metrics.overall'] = timed(lambda: calculate_overall_metrics(data, selections.pop()), repeat)
+    selections = [rng.getrandbits(len(services)) for _ in range(repeat)]
+    runs['metrics.service_dataframe'] = timed(lambda: create_service_dataframe(data, selections.pop()), repeat)
+    return runs
+
+
+def bench_render(repeat: int) -> Dict[str, List[float]]:
+    from streamlit.testing.v1 import AppTest
+
+    def run(at: "AppTest", name: str) -> List[float]:
+        # Check right after the timed run, so a failing view is not timed as a fast one.
+        times = timed(at.run, 1)
+        if at.exception:
+            raise RuntimeError(f"{name} raised: {at.exception[0].value}")
+        return times
+
+    runs = {'render.first': []}
+    for _ in range(repeat):
+        at = AppTest.from_file(str(ROOT / "main.py"), default_timeout=300)
+        runs['render.first'].extend(run(at, VIEWS[0]))
+    for view in VIEWS:
+        key = 'render.' + view.lower().replace(' ', '_').replace('-', '_')
+        runs[key] = []
+        for _ in range(repeat):
+            at.sidebar.selectbox[0].set_value(view)
+            runs[key].extend(run(at, view))
+            at.sidebar.selectbox[0].set_value(VIEWS[0])
+            at.run()
+    return runs
+
+
+def summarize(runs: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    return {
+        name: {'median_ms': statistics.median(values), 'min_ms': min(values), 'runs': len(values)}
+        for name, values in runs.items()
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], thresholds: Dict[str, Any]) -> List[str]:
+    """Names of benchmarks whose median regressed past their threshold."""
+    default = thresholds.get('default', {})
+    regressions = []
+    print(f"\n{'benchmark':<36}{'baseline ms':>12}{'current ms':>12}{'change':>9}")
+    for name, current in results['benchmarks'].items():
+        previous = baseline['benchmarks'].get(name)
+        if previous is None:
+            continue
+        limit = {**default, **thresholds.get('benchmarks', {}).get(name, {})}
+        delta = current['median_ms'] - previous['median_ms']
+        change = delta / previous['median_ms'] if previous['median_ms'] else 0.0
+        regressed = change > limit.get('max_slowdown', 0.25) and delta > limit.get('min_delta_ms', 1.0)
+        flag = "  REGRESSED" if regressed else ""
+        print(f"{name:<36}{previous['median_ms']:>12.2f}{current['median_ms']:>12.2f}{change:>+9.0%}{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--services", type=int, default=54)
+    parser.add_argument("--operations", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-render", action="store_true", help="Skip the AppTest view renders")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Previous --output to compare against")
+    parser.add_argument("--thresholds", type=Path, default=Path(__file__).parent / "thresholds.json")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="ack-bench-") as tmp:
+        root = Path(tmp)
+        generate_results(root / "results", args.services, args.operations, seed=args.seed)
+        os.environ["ACK_DASHBOARD_DATASETS"] = str(root / "results")
+        os.environ["ACK_DASHBOARD_SNAPSHOT"] = "0"
+        os.environ["ACK_DASHBOARD_HISTORY_DIR"] = str(root / "history")
+
+        runs = bench_data(root / "results", args.repeat)
+        if not args.skip_render:
+            runs.update(bench_render(args.repeat))
+
+    results = {
+        'meta': {
+            'services': args.services,
+            'operations': args.operations,
+            'repeat': args.repeat,
+            'seed': args.seed,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'benchmarks': summarize(runs),
+    }
+
+    print(f"{'benchmark':<36}{'median ms':>12}{'min ms':>12}")
+    for name, result in results['benchmarks'].items():
+        print(f"{name:<36}{result['median_ms']:>12.2f}{result['min_ms']:>12.2f}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        sizes = ('services', 'operations')
+        if any(baseline['meta'].get(k) != results['meta'][k] for k in sizes):
+            print(f"\nWarning: baseline was run with a different dataset size "
+                  f"({baseline['meta'].get('services')} x {baseline['meta'].get('operations')})")
+        thresholds = json.loads(args.thresholds.read_text()) if args.thresholds.exists() else {}
+        regressions = compare(results, baseline, thresholds)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Synthetic results generator for benchmarks.
+
+Writes ``<service>-operations.json`` files in the format produced by the
+coverage generator: N services with M operations each. The default ratios
+follow the real results/ data: about 63% of operations are control plane,
+41% of those are supported, and data plane operations are never supported.
+
+    python benchmarks/synthetic.py /tmp/synthetic-results --services 200 --operations 500
+"""
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Dict, Any
+
+
+VERBS = ['Create', 'Delete', 'Describe', 'Get', 'List', 'Update', 'Put', 'Modify', 'Tag', 'Untag', 'Start', 'Stop']
+NOUNS = ['Bucket', 'Cluster', 'Instance', 'Function', 'Queue', 'Topic', 'Table', 'Role', 'Policy', 'Snapshot',
+         'Volume', 'Endpoint', 'Repository', 'Stream', 'Key', 'Alias', 'Rule', 'Subnet', 'Gateway', 'Certificate']
+QUALIFIERS = ['', 'Configuration', 'Attributes', 'Versions', 'Status', 'Permissions', 'Group', 'Set']
+FILES = ['sdk.go', 'hook.go', 'delta.go', 'manager.go', 'tags.go']
+
+
+def service_results(service: str, operations: int, control_plane_ratio: float = 0.63,
+                    supported_ratio: float = 0.41, rng: random.Random = None) -> Dict[str, Any]:
+    rng = rng or random.Random(0)
+    names = set()
+    while len(names) < operations:
+        name = f"{rng.choice(VERBS)}{rng.choice(NOUNS)}{rng.choice(QUALIFIERS)}"
+        names.add(name if name not in names else f"{name}{len(names)}")
+
+    ops = []
+    for name in sorted(names):
+        control_plane = rng.random() < control_plane_ratio
+        if control_plane and rng.random() < supported_ratio:
+            resource = rng.choice(NOUNS).lower()
+            file, line = f"pkg/resource/{resource}/{rng.choice(FILES)}", rng.randint(20, 4000)
+        else:
+            file, line = "", 0
+        ops.append({
+            'name': name,
+            'type': 'control_plane' if control_plane else 'data_plane',
+            'file': file,
+            'line': line,
+        })
+
+    control_plane_ops = [op for op in ops if op['type'] == 'control_plane']
+    return {
+        'service_name': service,
+        'total_operations': len(ops),
+        'supported_operations': sum(1 for op in ops if op['file']),
+        'control_plane_operations': len(control_plane_ops),
+        'supported_control_plane_operations': sum(1 for op in control_plane_ops if op['file']),
+        'operations': ops,
+    }
+
+
+def generate_results(directory: Path, services: int, operations: int, control_plane_ratio: float = 0.63,
+                     supported_ratio: float = 0.41, seed: int = 0) -> Path:
+    """Write ``services`` results files of ``operations`` operations each into ``directory``."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    for i in range(services):
+        service = f"svc{i:04d}"
+        results = service_results(service, operations, control_plane_ratio, supported_ratio, rng)
+        with open(directory / f"{service}-operations.json", 'w') as f:
+            json.dump(results, f, indent=2)
+    return directory
+
+
+def generate_controllers(directory: Path, services: int, operations: int, files: int = 20, lines: int = 800,
+                         seed: int = 0) -> Path:
+    """Write operation lists and ``<service>-controller`` Go sources for ``python -m ack_dashboard.data.generate``.
+
+    Returns ``directory``, holding ``operations/`` and ``controllers/``. Each
+    supported operation is called once in one of ``files`` files of about
+    ``lines`` lines under ``pkg/resource/``.
+    """
+    directory = Path(directory)
+    rng = random.Random(seed)
+    for i in range(services):
+        service = f"svc{i:04d}"
+        results = service_results(service, operations, rng=rng)
+        (directory / "operations").mkdir(parents=True, exist_ok=True)
+        with open(directory / "operations" / f"{service}.json", 'w') as f:
+            json.dump({'service_name': service,
+                       'operations': [{'name': op['name'], 'type': op['type']} for op in results['operations']]}, f)
+
+        calls: Dict[int, list] = {}
+        for op in results['operations']:
+            if op['file']:
+                calls.setdefault(rng.randrange(files), []).append(op['name'])
+        for n in range(files):
+            path = directory / "controllers" / f"{service}-controller" / "pkg" / "resource" / f"r{n % 8}" / f"f{n}.go"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            body = [f"package r{n % 8}", ""]
+            names = calls.get(n, [])
+            while len(body) < lines:
+                body.append("\tif err != nil {\n\t\treturn nil, fmt.Errorf(\"read: %w\", err)\n\t}")
+                if names and rng.random() < 0.05:
+                    body.append(f"\t_, err = rm.sdkapi.{names.pop()}WithContext(ctx, input)")
+            body.extend(f"\t_, err = rm.sdkapi.{name}(ctx, input)" for name in names)
+            path.write_text("\n".join(body) + "\n")
+    return directory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--services", type=int, default=54)
+    parser.add_argument("--operations", type=int, default=80)
+    parser.add_argument("--control-plane-ratio", type=float, default=0.63)
+    parser.add_argument("--supported-ratio", type=float, default=0.41)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generate_results(args.directory, args.services, args.operations,
+                     args.control_plane_ratio, args.supported_ratio, args.seed)
+    print(f"Wrote {args.services} services x {args.operations} operations to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+package main
+
+// Outside pkg/resource: not scanned.
+func main() {
+	client.ResetGadget(ctx, input)
+}
@@ -0,0 +1,14 @@
+package gadget
+
+func newResourceDelta(a *resource, b *resource) *ackcompare.Delta {
+	delta := ackcompare.NewDelta()
+	if ackcompare.HasNilDifference(a.ko.Spec.Attributes, b.ko.Spec.Attributes) {
+		delta.Add("Spec.Attributes", a.ko.Spec.Attributes, b.ko.Spec.Attributes)
+	}
+	return delta
+}
+
+func (rm *resourceManager) modifyAttributes(ctx context.Context, r *resource) error {
+	_, err := rm.sdkapi.ModifyGadgetAttributes(ctx, input)
+	return err
+}
@@ -0,0 +1,40 @@
+package gadget
+
+func (rm *resourceManager) sdkFind(
+	ctx context.Context,
+	r *resource,
+) (latest *resource, err error) {
+	resp, err := rm.sdkapi.GetGadget(ctx, input)
+	rm.metrics.RecordAPICall("READ_ONE", "GetGadget", err)
+	return rm.setOutput(r, resp)
+}
+
+func (rm *resourceManager) sdkCreate(
+	ctx context.Context,
+	desired *resource,
+) (created *resource, err error) {
+	resp, err := rm.sdkapi.CreateGadget(ctx, input)
+	rm.metrics.RecordAPICall("CREATE", "CreateGadget", err)
+	return rm.setOutput(desired, resp)
+}
+
+func (rm *resourceManager) sdkDelete(
+	ctx context.Context,
+	r *resource,
+) (latest *resource, err error) {
+	_, err = rm.sdkapi.DeleteGadget(ctx, input)
+	rm.metrics.RecordAPICall("DELETE", "DeleteGadget", err)
+	return nil, err
+}
+
+/*
+resetGadget is disabled until the API is generally available:
+
+	_, err := rm.sdkapi.ResetGadget(ctx, input)
+*/
+
+func (rm *resourceManager) sendCommand(ctx context.Context, r *resource) error {
+	rm.log.Info("not a call: rm.sdkapi.ResetGadget(ctx, input)")
+	_, err := rm.client("http://localhost:8080").SendGadgetCommand(ctx, input)
+	return err
+}
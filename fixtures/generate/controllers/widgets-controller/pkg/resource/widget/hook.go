@@ -0,0 +1,31 @@
+package widget
+
+import (
+	"context"
+
+	svcsdk "github.com/aws/aws-sdk-go/service/widgets"
+)
+
+func (rm *resourceManager) syncTags(
+	ctx context.Context,
+	desired *resource,
+	latest *resource,
+) (err error) {
+	if len(toAdd) > 0 {
+		_, err = rm.sdkapi.TagResourceWithContext(ctx, &svcsdk.TagResourceInput{})
+		rm.metrics.RecordAPICall("UPDATE", "TagResource", err)
+	}
+	if len(toRemove) > 0 {
+		_, err = rm.sdkapi.UntagResourceWithContext(ctx, &svcsdk.UntagResourceInput{})
+		rm.metrics.RecordAPICall("UPDATE", "UntagResource", err)
+	}
+	return err
+}
+
+func (rm *resourceManager) customUpdate(
+	ctx context.Context,
+	desired *resource,
+) (updated *resource, err error) {
+	_, err = rm.sdkapi.UpdateWidget(ctx, &svcsdk.UpdateWidgetInput{})
+	return desired, err
+}
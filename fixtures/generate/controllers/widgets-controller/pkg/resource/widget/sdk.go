@@ -0,0 +1,48 @@
+package widget
+
+import (
+	"context"
+
+	svcsdk "github.com/aws/aws-sdk-go/service/widgets"
+)
+
+// sdkFind returns SupportedResource of the widget.
+func (rm *resourceManager) sdkFind(
+	ctx context.Context,
+	r *resource,
+) (latest *resource, err error) {
+	input, err := rm.newDescribeRequestPayload(r)
+	if err != nil {
+		return nil, err
+	}
+	resp, err := rm.sdkapi.DescribeWidgetWithContext(ctx, input)
+	rm.metrics.RecordAPICall("READ_ONE", "DescribeWidget", err)
+	if err != nil {
+		return nil, err
+	}
+	return rm.setOutput(r, resp)
+}
+
+func (rm *resourceManager) sdkCreate(
+	ctx context.Context,
+	desired *resource,
+) (created *resource, err error) {
+	input := &svcsdk.CreateWidgetInput{}
+	resp, err := rm.sdkapi.CreateWidgetWithContext(ctx, input)
+	rm.metrics.RecordAPICall("CREATE", "CreateWidget", err)
+	if err != nil {
+		return nil, err
+	}
+	return rm.setOutput(desired, resp)
+}
+
+func (rm *resourceManager) sdkDelete(
+	ctx context.Context,
+	r *resource,
+) (latest *resource, err error) {
+	// UpdateWidget is not called here: rm.sdkapi.UpdateWidget(ctx, input)
+	input := &svcsdk.DeleteWidgetInput{}
+	_, err = rm.sdkapi.DeleteWidgetWithContext(ctx, input)
+	rm.metrics.RecordAPICall("DELETE", "DeleteWidget", err)
+	return nil, err
+}
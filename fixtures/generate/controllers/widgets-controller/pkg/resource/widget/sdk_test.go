@@ -0,0 +1,5 @@
+package widget
+
+func TestInvoke(t *testing.T) {
+	client.InvokeWidget(ctx, input)
+}
@@ -0,0 +1,23 @@
+package widget_pool
+
+func (rm *resourceManager) sdkCreate(
+	ctx context.Context,
+	desired *resource,
+) (created *resource, err error) {
+	resp, err := rm.sdkapi.CreateWidgetPoolWithContext(ctx, input)
+	rm.metrics.RecordAPICall("CREATE", "CreateWidgetPool", err)
+	return rm.setOutput(desired, resp)
+}
+
+func (rm *resourceManager) sdkDelete(
+	ctx context.Context,
+	r *resource,
+) (latest *resource, err error) {
+	_, err = rm.sdkapi.DeleteWidgetPoolWithContext(ctx, input)
+	return nil, err
+}
+
+func (rm *resourceManager) listWidgets(ctx context.Context) error {
+	_, err := rm.sdkapi.ListWidgetsWithContext(ctx, input)
+	return err
+}
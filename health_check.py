@@ -1,45 +1,208 @@
 import http.server
-import socketserver
-import threading
+import json
+import os
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+from ack_dashboard.perf import read_summary, render_prometheus
+from ack_dashboard.serve import read_status
+
+
+HEALTH_PORT = 8502
+STREAMLIT_PORT = 8501
+STREAMLIT_HEALTH_URL = f"http://127.0.0.1:{STREAMLIT_PORT}/_stcore/health"
+CHECK_INTERVAL = 5.0
+# The child publishes its load state every couple of seconds; an older file means it stopped doing so.
+STATUS_MAX_AGE = 15.0
+
+# Streamlit with the results preloaded and their load state published; see ack_dashboard/serve.py
+STREAMLIT_CMD = [
+    "uv", "run", "python", "-m", "ack_dashboard.serve",
+    f"--server.port={STREAMLIT_PORT}",
+    "--server.address=0.0.0.0",
+    "--server.headless=true",
+    "--server.fileWatcherType=none"
+]
+
+
+class AppState:
+    """What the probes report, refreshed by the checker thread.
+
+    Handlers only read this snapshot under a lock, so a probe never waits on
+    Streamlit or on the results directory. Load state comes from the status
+    file the Streamlit process publishes, never from loading the results here.
+    """
+
+    def __init__(self, status_path: Path):
+        self.status_path = status_path
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._process = None
+        self._stats = {
+            'streamlit_healthy': False,
+            'data_loaded': False,
+            'snapshot_warm': False,
+            'snapshot_error': None,
+            'data_version': None,
+            'services': 0,
+            'load_errors': 0,
+            'cold_load_ms': None,
+            'reload_ms': None,
+            'reloads': 0,
+            'status_updated_at': None,
+            'checked_at': None,
+        }
+
+    def attach(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._process = process
+
+    def live(self) -> bool:
+        with self._lock:
+            return self._process is not None and self._process.poll() is None
+
+    def ready(self) -> bool:
+        with self._lock:
+            stats = dict(self._stats)
+        published = stats['status_updated_at']
+        fresh = published is not None and time.time() - published <= STATUS_MAX_AGE
+        return self.live() and fresh and stats['streamlit_healthy'] and stats['data_loaded'] and stats['snapshot_warm']
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            pid = self._process.pid if self._process is not None else None
+        stats.update({
+            'live': self.live(),
+            'ready': self.ready(),
+            'pid': pid,
+            'uptime_s': round(time.time() - self.started_at, 1),
+        })
+        return stats
+
+    def check(self) -> None:
+        status = read_status(self.status_path) or {}
+        dataset = _primary_dataset(status) or {}
+        update = {
+            'streamlit_healthy': _streamlit_healthy(),
+            'data_loaded': bool(dataset.get('services')) and not dataset.get('load_errors'),
+            'snapshot_warm': bool(dataset.get('snapshot_warm')),
+            'snapshot_error': dataset.get('snapshot_error'),
+            'data_version': dataset.get('data_version'),
+            'services': dataset.get('services', 0),
+            'load_errors': dataset.get('load_errors', 0),
+            'cold_load_ms': dataset.get('cold_load_ms'),
+            'reload_ms': dataset.get('reload_ms'),
+            'reloads': dataset.get('reloads', 0),
+            'status_updated_at': status.get('updated_at'),
+            'checked_at': time.time(),
+        }
+        with self._lock:
+            self._stats.update(update)
+
+
+def _primary_dataset(status: dict) -> Optional[dict]:
+    """The published state of the default dataset, if the child has loaded it."""
+    return next((d for d in status.get('datasets', []) if d['path'] == status.get('primary')), None)
+
+
+def _streamlit_healthy() -> bool:
+    try:
+        with urllib.request.urlopen(STREAMLIT_HEALTH_URL, timeout=2) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
 
 class HealthHandler(http.server.BaseHTTPRequestHandler):
+    state: AppState = None
+
     def do_GET(self):
-        if self.path in ['/health', '/']:
-            self.send_response(200)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(b'OK')
+        path = self.path.split('?', 1)[0]
+        if path in ['/health', '/', '/livez']:
+            # Liveness: the Streamlit process is running
+            self._respond(200 if self.state.live() else 503, b'OK' if self.state.live() else b'DOWN')
+        elif path in ['/ready', '/readyz']:
+            # Readiness: Streamlit answers, and it has loaded the data and its snapshot is current (or cannot be written)
+            ready = self.state.ready()
+            self._respond(200 if ready else 503, b'READY' if ready else b'NOT READY')
+        elif path == '/stats':
+            self._respond(200, json.dumps(self.state.stats()).encode(), 'application/json')
+        elif path == '/metrics':
+            # Written by the Streamlit process after its reruns; see ack_dashboard/perf.py
+            summary = read_summary()
+            if summary is None:
+                self._respond(503, b'No reruns recorded yet')
+            else:
+                self._respond(200, render_prometheus(summary).encode(), 'text/plain; version=0.0.4')
         else:
-            self.send_response(404)
-            self.end_headers()
-    
+            self._respond(404, b'Not Found')
+
+    def _respond(self, status: int, body: bytes, content_type: str = 'text/plain') -> None:
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_message(self, format, *args):
         pass  # Suppress logs
 
-def start_health_server():
-    """Start a simple health check server on port 8502"""
-    with socketserver.TCPServer(("", 8502), HealthHandler) as httpd:
-        httpd.serve_forever()
+
+class HealthServer(http.server.ThreadingHTTPServer):
+    # One thread per connection, so a slow client cannot hold up other probes.
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def start_health_server(state: AppState, port: int = HEALTH_PORT) -> HealthServer:
+    """Start the health check server on port 8502 in a background thread"""
+    handler = type('BoundHealthHandler', (HealthHandler,), {'state': state})
+    httpd = HealthServer(("", port), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def run_checks(state: AppState, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            state.check()
+        except Exception as e:
+            print(f"Health check failed: {e}", file=sys.stderr)
+        stop.wait(CHECK_INTERVAL)
+
 
 def main():
-    health_thread = threading.Thread(target=start_health_server, daemon=True)
-    health_thread.start()
-    
-    print("Health check server started on port 8502")
-    time.sleep(1) 
-    
-    cmd = [
-        "uv", "run", "python", "-m", "streamlit", "run", "main.py",
-        "--server.port=8501",
-        "--server.address=0.0.0.0",
-        "--server.headless=true",
-        "--server.fileWatcherType=none"
-    ]
-    
-    subprocess.run(cmd)
+    # A fresh file per run, so a status left behind by a previous child never counts.
+    status_path = Path(tempfile.mkdtemp(prefix="ack-health-")) / "status.json"
+    state = AppState(status_path)
+    start_health_server(state)
+    print(f"Health check server started on port {HEALTH_PORT}")
+
+    process = subprocess.Popen(STREAMLIT_CMD, env=dict(os.environ, ACK_DASHBOARD_STATUS_FILE=str(status_path)))
+    state.attach(process)
+
+    # Pass termination on to Streamlit and exit with its status.
+    def forward(signum, frame):
+        process.send_signal(signum)
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+
+    stop = threading.Event()
+    checker = threading.Thread(target=run_checks, args=(state, stop), daemon=True)
+    checker.start()
+
+    returncode = process.wait()
+    stop.set()
+    sys.exit(returncode)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
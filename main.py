@@ -1,14 +1,31 @@
 import streamlit as st
-from ack_dashboard.data.loader import load_data
+from ack_dashboard.data.loader import configured_datasets, load_data, set_error_reporter
+from ack_dashboard.data.store import get_store
 from ack_dashboard.calculations.metrics import calculate_overall_metrics, create_service_dataframe
+from ack_dashboard.perf import RerunProfiler, get_recorder
+from ack_dashboard.ui.components import (
+    get_service_selection,
+    debug_enabled,
+    trace_memory_requested,
+    render_perf_panel,
+    render_reload_status,
+    select_dataset
+)
 from ack_dashboard.ui.views import (
     show_overall_coverage,
     show_service_analysis,
     show_control_plane_overview,
-    show_per_service_control_plane
+    show_per_service_control_plane,
+    show_coverage_trends,
+    show_operation_search,
+    show_implementation_hotspots,
+    show_service_matrix,
+    show_snapshot_diff
 )
 
 
+set_error_reporter(st.error)
+
 st.set_page_config(
     page_title="AWS ACK API Coverage Dashboard",
     page_icon="📊",
@@ -43,24 +60,51 @@ st.markdown("""
 
 
 def main():
+    debug = debug_enabled()
+    profiler = RerunProfiler(trace_memory=debug and trace_memory_requested())
+    view = None
+    try:
+        view = render_dashboard(profiler)
+    finally:
+        record = profiler.finish(view=view)
+    if debug:
+        render_perf_panel(record, get_recorder().summary())
+
+
+def render_dashboard(profiler: RerunProfiler) -> str:
     st.markdown('<h1 class="main-header">🚀 AWS ACK API Coverage Dashboard</h1>', unsafe_allow_html=True)
     
-    data = load_data()
+    # Every configured dataset has its own shared store; switching never reparses a resident one.
+    results_dir = select_dataset(configured_datasets())
+    with profiler.phase("load"):
+        data = load_data(results_dir)
     if not data:
         st.stop()
     
-    # Initialize session state for service selection
-    if 'selected_services' not in st.session_state:
-        st.session_state.selected_services = list(data.keys())
+    # Service selection is kept as one bitmask over the services in data order
+    selection = get_service_selection(list(data.keys()))
     
-    overall_metrics = calculate_overall_metrics(data, st.session_state.selected_services)
-    service_df = create_service_dataframe(data, st.session_state.selected_services)
+    with profiler.phase("metrics"):
+        overall_metrics = calculate_overall_metrics(data, selection.mask)
+    with profiler.phase("service_dataframe"):
+        service_df = create_service_dataframe(data, selection.mask)
     
     st.sidebar.markdown('<div class="sidebar-header">Navigation</div>', unsafe_allow_html=True)
     view = st.sidebar.selectbox(
         "Select View",
-        ["Overall Coverage", "Per-Service Analysis", "Control Plane Overview", "Per-Service Control Plane"]
+        [
+            "Overall Coverage",
+            "Per-Service Analysis",
+            "Control Plane Overview",
+            "Per-Service Control Plane",
+            "Coverage Trends",
+            "Operation Search",
+            "Implementation Hotspots",
+            "Service Matrix",
+            "Snapshot Diff"
+        ]
     )
+    render_reload_status(get_store(results_dir).reload_status)
     
     if view == "Overall Coverage":
         show_overall_coverage(data, overall_metrics, service_df)
@@ -68,8 +112,19 @@ def main():
         show_service_analysis(data, service_df)
     elif view == "Control Plane Overview":
         show_control_plane_overview(data, overall_metrics, service_df)
-    else:
+    elif view == "Per-Service Control Plane":
         show_per_service_control_plane(data, service_df)
+    elif view == "Coverage Trends":
+        show_coverage_trends(data)
+    elif view == "Operation Search":
+        show_operation_search(data)
+    elif view == "Implementation Hotspots":
+        show_implementation_hotspots(data)
+    elif view == "Service Matrix":
+        show_service_matrix(data)
+    else:
+        show_snapshot_diff(data)
+    return view
 
 
 if __name__ == "__main__":